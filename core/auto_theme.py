@@ -2,10 +2,14 @@
 
 import requests
 import logging
+import sys
 from datetime import datetime, timezone
 from typing import Dict, Optional, Tuple
 import time
 
+# fromisoformat accepts a trailing 'Z' natively from Python 3.11
+_ISO_Z_SUPPORTED = sys.version_info >= (3, 11)
+
 class LocationService:
     """Service to get user location and sunrise/sunset times"""
     
@@ -93,8 +97,12 @@ class LocationService:
                     results = data['results']
                     
                     # Parse ISO format times
-                    sunrise_utc = datetime.fromisoformat(results['sunrise'].replace('Z', '+00:00'))
-                    sunset_utc = datetime.fromisoformat(results['sunset'].replace('Z', '+00:00'))
+                    sunrise_str, sunset_str = results['sunrise'], results['sunset']
+                    if not _ISO_Z_SUPPORTED:
+                        sunrise_str = sunrise_str.replace('Z', '+00:00')
+                        sunset_str = sunset_str.replace('Z', '+00:00')
+                    sunrise_utc = datetime.fromisoformat(sunrise_str)
+                    sunset_utc = datetime.fromisoformat(sunset_str)
                     
                     return {
                         'sunrise_utc': sunrise_utc,
@@ -3,13 +3,19 @@
 import os
 import sys
 import json
+import zlib
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional
 from config import Config
 from core.data_validator import WeatherDataValidator
 from core.state_utils import normalize_state_abbreviation
-from core.database import WeatherDatabase
+from core.database import WeatherDatabase, encode_api_response, decode_api_response
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib codec
+    orjson = None
 
 class WeatherDataHandler:
     """Handles all weather data operations with integrated validation and config support"""
@@ -55,7 +61,7 @@ class WeatherDataHandler:
         
         if to_database:
             try:
-                with self.db.get_connection() as conn:
+                with self.db.transaction() as conn:
                     cursor = conn.cursor()
                     # Ensure timestamp is present
                     timestamp = validated_data.get('timestamp') or datetime.now().isoformat()
@@ -86,9 +92,8 @@ class WeatherDataHandler:
                         validated_data.get('visibility'),
                         validated_data.get('uv_index'),
                         timestamp,
-                        json.dumps(validated_data)  # Store full data as JSON
+                        encode_api_response(validated_data)  # Store full data as compressed JSON
                     ))
-                    conn.commit()
                 self.logger.info(f"Successfully saved weather data to database for {validated_data.get('city')}")
             except Exception as e:
                 self.logger.error(f"Error saving to database: {str(e)}")
@@ -106,12 +111,16 @@ class WeatherDataHandler:
             state = normalize_state_abbreviation(city_data.get('state', ''))
             
             self.logger.info(f"Attempting to save city: {city_data.get('city')}, {state}")
-            with self.db.get_connection() as conn:
+            with self.db.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
-                    INSERT OR REPLACE INTO saved_locations (
+                    INSERT INTO saved_locations (
                         city, state, country, latitude, longitude
                     ) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(city, state, country) DO UPDATE SET
+                        latitude = excluded.latitude,
+                        longitude = excluded.longitude,
+                        last_accessed = CURRENT_TIMESTAMP
                 ''', (
                     city_data.get('city'),
                     state,  # Use normalized state
@@ -119,7 +128,6 @@ class WeatherDataHandler:
                     city_data.get('latitude'),
                     city_data.get('longitude')
                 ))
-                conn.commit()
             self.logger.info(f"Successfully saved city {city_data.get('city')} to database")
             return True
         except Exception as e:
@@ -133,8 +141,7 @@ class WeatherDataHandler:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('SELECT * FROM saved_locations')
-                rows = cursor.fetchall()
-                cities = [dict(row) for row in rows]
+                cities = [dict(row) for row in cursor]
                 self.logger.info(f"Successfully loaded {len(cities)} saved cities")
                 return cities
         except Exception as e:
@@ -145,7 +152,7 @@ class WeatherDataHandler:
         """Delete a city from saved locations"""
         try:
             self.logger.info(f"Attempting to delete city: {city}, {state}")
-            with self.db.get_connection() as conn:
+            with self.db.transaction() as conn:
                 cursor = conn.cursor()
                 if state:
                     cursor.execute('''
@@ -157,7 +164,10 @@ class WeatherDataHandler:
                         DELETE FROM saved_locations
                         WHERE city = ? AND state IS NULL AND country = ?
                     ''', (city, country))
-                conn.commit()
+                # Callers drop the city from memory on True, so report whether a row went
+                if cursor.rowcount == 0:
+                    self.logger.warning(f"No saved location matched {city}, {state}, {country}")
+                    return False
                 self.logger.info(f"Successfully deleted city {city} from database")
                 return True
         except Exception as e:
@@ -172,9 +182,10 @@ class WeatherDataHandler:
             
             if os.path.exists(filepath):
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as file:
-                        history = json.load(file)
-                except json.JSONDecodeError:
+                    with open(filepath, 'rb') as file:
+                        raw = file.read()
+                    history = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
                     self.logger.warning(f"Could not decode existing JSON file: {filepath}")
                     history = []
             
@@ -184,8 +195,12 @@ class WeatherDataHandler:
             
             history.append(data)
             
-            with open(filepath, 'w', encoding='utf-8') as file:
-                json.dump(history, file, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps(history, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(history, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(filepath, 'wb') as file:
+                file.write(payload)
             
             return True
         except Exception as e:
@@ -210,7 +225,7 @@ class WeatherDataHandler:
             return False
             
         try:
-            with self.db.get_connection() as conn:
+            with self.db.transaction() as conn:
                 cursor = conn.cursor()
                 
                 # First, delete existing forecast data for this location to avoid duplicates
@@ -219,47 +234,34 @@ class WeatherDataHandler:
                     WHERE city = ? AND state = ? AND country = ?
                 ''', (city, state, country))
                 
-                # Insert new forecast data
-                for day_forecast in forecast_data:
-                    try:
-                        # Convert timestamp to date
-                        dt = day_forecast.get('dt')
-                        if dt:
-                            forecast_date = datetime.fromtimestamp(dt).strftime('%Y-%m-%d')
-                        else:
-                            continue  # Skip if no timestamp
-                        
-                        cursor.execute('''
-                            INSERT OR REPLACE INTO forecast_weather (
-                                city, state, country, forecast_date,
-                                temperature_min, temperature_max, temperature_day, temperature_night,
-                                humidity, pressure, wind_speed,
-                                weather_description, weather_main, weather_icon,
-                                precipitation_probability, precipitation_amount,
-                                created_timestamp, api_response
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            city, state, country, forecast_date,
-                            day_forecast.get('temp_min'),
-                            day_forecast.get('temp_max'), 
-                            day_forecast.get('temp_day'),
-                            day_forecast.get('temp_night'),
-                            day_forecast.get('humidity'),
-                            day_forecast.get('pressure'),
-                            day_forecast.get('wind_speed'),
-                            day_forecast.get('description'),
-                            day_forecast.get('main'),
-                            day_forecast.get('icon'),
-                            day_forecast.get('pop', 0),  # Precipitation probability
-                            day_forecast.get('precipitation_amount', 0),
-                            datetime.now().isoformat(),
-                            json.dumps(day_forecast)  # Store full forecast data as JSON
-                        ))
-                    except Exception as e:
-                        self.logger.warning(f"Error saving individual forecast day: {str(e)}")
-                        continue
+                # Insert new forecast data in one batch
+                cursor.executemany('''
+                    INSERT INTO forecast_weather (
+                        city, state, country, forecast_date,
+                        temperature_min, temperature_max, temperature_day, temperature_night,
+                        humidity, pressure, wind_speed,
+                        weather_description, weather_main, weather_icon,
+                        precipitation_probability, precipitation_amount,
+                        created_timestamp, api_response
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(city, state, forecast_date) DO UPDATE SET
+                        country = excluded.country,
+                        temperature_min = excluded.temperature_min,
+                        temperature_max = excluded.temperature_max,
+                        temperature_day = excluded.temperature_day,
+                        temperature_night = excluded.temperature_night,
+                        humidity = excluded.humidity,
+                        pressure = excluded.pressure,
+                        wind_speed = excluded.wind_speed,
+                        weather_description = excluded.weather_description,
+                        weather_main = excluded.weather_main,
+                        weather_icon = excluded.weather_icon,
+                        precipitation_probability = excluded.precipitation_probability,
+                        precipitation_amount = excluded.precipitation_amount,
+                        created_timestamp = excluded.created_timestamp,
+                        api_response = excluded.api_response
+                ''', self._forecast_rows(city, state, country, forecast_data))
                 
-                conn.commit()
                 self.logger.info(f"Successfully saved {len(forecast_data)} forecast days for {city}, {state}")
                 return True
                 
@@ -267,6 +269,43 @@ class WeatherDataHandler:
             self.logger.error(f"Error saving forecast data to database: {str(e)}")
             return False
 
+    def _forecast_rows(self, city: str, state: str, country: str, forecast_data: List[Dict]) -> List[tuple]:
+        """Build forecast_weather parameter tuples, skipping days that can't be converted"""
+        created_timestamp = datetime.now().isoformat()
+        rows = []
+        
+        for day_forecast in forecast_data:
+            try:
+                # Convert timestamp to date
+                dt = day_forecast.get('dt')
+                if dt:
+                    forecast_date = datetime.fromtimestamp(dt).strftime('%Y-%m-%d')
+                else:
+                    continue  # Skip if no timestamp
+                
+                rows.append((
+                    city, state, country, forecast_date,
+                    day_forecast.get('temp_min'),
+                    day_forecast.get('temp_max'), 
+                    day_forecast.get('temp_day'),
+                    day_forecast.get('temp_night'),
+                    day_forecast.get('humidity'),
+                    day_forecast.get('pressure'),
+                    day_forecast.get('wind_speed'),
+                    day_forecast.get('description'),
+                    day_forecast.get('main'),
+                    day_forecast.get('icon'),
+                    day_forecast.get('pop', 0),  # Precipitation probability
+                    day_forecast.get('precipitation_amount', 0),
+                    created_timestamp,
+                    encode_api_response(day_forecast)  # Store full forecast data as compressed JSON
+                ))
+            except Exception as e:
+                self.logger.warning(f"Error saving individual forecast day: {str(e)}")
+                continue
+        
+        return rows
+
     def get_forecast_data(self, city: str, state: str = None, country: str = 'US', days: int = 7) -> List[Dict]:
         """
         Retrieve forecast data from the database
@@ -291,10 +330,8 @@ class WeatherDataHandler:
                     LIMIT ?
                 ''', (city, state, country, days))
                 
-                results = cursor.fetchall()
-                
                 forecast_data = []
-                for row in results:
+                for row in cursor:
                     forecast_item = {
                         'id': row['id'],
                         'forecast_date': row['forecast_date'],
@@ -316,9 +353,9 @@ class WeatherDataHandler:
                     # Try to parse the stored API response if available
                     if row['api_response']:
                         try:
-                            api_data = json.loads(row['api_response'])
+                            api_data = decode_api_response(row['api_response'])
                             forecast_item['api_data'] = api_data
-                        except json.JSONDecodeError:
+                        except (ValueError, zlib.error):
                             pass
                     
                     forecast_data.append(forecast_item)
@@ -341,17 +378,16 @@ class WeatherDataHandler:
             True if successful, False otherwise
         """
         try:
-            with self.db.get_connection() as conn:
+            with self.db.transaction() as conn:
                 cursor = conn.cursor()
                 
                 # Delete forecast data older than specified days
                 cursor.execute('''
                     DELETE FROM forecast_weather 
-                    WHERE created_timestamp < datetime('now', '-{} days')
-                '''.format(days_to_keep))
+                    WHERE created_timestamp < datetime('now', ?)
+                ''', (f'-{int(days_to_keep)} days',))
                 
                 deleted_count = cursor.rowcount
-                conn.commit()
                 
                 if deleted_count > 0:
                     self.logger.info(f"Cleaned up {deleted_count} old forecast records")
@@ -1,9 +1,25 @@
 """Weather data validation and cleaning utilities"""
 
 import logging
+import sys
 from datetime import datetime
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
+from functools import lru_cache
+
+@lru_cache(maxsize=128)
+def _title(text: str) -> str:
+    """Title-case a weather description (small vocabulary, so results are cached)"""
+    return text.title()
+
+def _in_range(value: Any, low: float, high: float, cast=float) -> bool:
+    """Return True if value converts with cast and lies within [low, high]"""
+    if value is None:
+        return False
+    try:
+        return low <= cast(value) <= high
+    except (ValueError, TypeError):
+        return False
 
 @dataclass
 class ValidationRules:
@@ -94,9 +110,9 @@ class WeatherDataValidator:
                 'ground_level': self._clean_float(main_data.get('grnd_level')),
                 
                 # Weather description
-                'weather_main': self._clean_string(weather_data.get('main')),
+                'weather_main': self._clean_token(weather_data.get('main')),
                 'weather_description': self._clean_string(weather_data.get('description')),
-                'weather_icon': self._clean_string(weather_data.get('icon')),
+                'weather_icon': self._clean_token(weather_data.get('icon')),
                 
                 # Wind data
                 'wind_speed': self._clean_float(wind_data.get('speed')),
@@ -130,6 +146,11 @@ class WeatherDataValidator:
             return None
         return str(value).strip() if str(value).strip() else None
     
+    def _clean_token(self, value: Any) -> Optional[str]:
+        """Clean small-vocabulary strings (weather main, icon code) and intern them"""
+        cleaned = self._clean_string(value)
+        return sys.intern(cleaned) if cleaned else None
+    
     def _clean_float(self, value: Any) -> Optional[float]:
         """Clean and validate float values"""
         if value is None:
@@ -158,65 +179,78 @@ class WeatherDataValidator:
         except (ValueError, TypeError, OSError):
             return None
     
+    def _temperature_bounds(self):
+        """Return (min, max, unit label) for the configured temperature unit"""
+        if self.temperature_unit == "imperial":
+            return self.rules.min_temperature_fahrenheit, self.rules.max_temperature_fahrenheit, "°F"
+        elif self.temperature_unit == "metric":
+            return self.rules.min_temperature_celsius, self.rules.max_temperature_celsius, "°C"
+        else:  # kelvin
+            return self.rules.min_temperature_kelvin, self.rules.max_temperature_kelvin, "K"
+    
+    def _wind_bounds(self):
+        """Return (max, unit label) for wind speed in the configured unit system"""
+        if self.temperature_unit == "imperial":
+            return self.rules.max_wind_speed_imperial, "mph"
+        return self.rules.max_wind_speed_metric, "m/s"
+    
     def _validate_weather_data(self, data: Dict) -> bool:
         """Validate cleaned weather data against reasonable ranges"""
+        rules = self.rules
+        min_temp, max_temp, _ = self._temperature_bounds()
+        max_wind, _ = self._wind_bounds()
+        
+        temp = data.get('temperature')
+        humidity = data.get('humidity')
+        pressure = data.get('pressure')
+        wind_speed = data.get('wind_speed')
+        
+        # Single fused check, ordered so the most likely failure (temperature
+        # outliers) short-circuits first; warnings are only built on failure
+        if (temp and min_temp <= temp <= max_temp
+                and data.get('city') and data.get('weather_description')
+                and (humidity is None or rules.min_humidity <= humidity <= rules.max_humidity)
+                and (pressure is None or rules.min_pressure <= pressure <= rules.max_pressure)
+                and (wind_speed is None or wind_speed <= max_wind)):
+            return True
+        
+        self._log_validation_failure(data)
+        return False
+    
+    def _log_validation_failure(self, data: Dict) -> None:
+        """Log why cleaned weather data failed validation (slow path only)"""
         
         # Check required fields
         required_fields = ['city', 'temperature', 'weather_description']
         for field in required_fields:
             if not data.get(field):
                 self.logger.warning(f"Missing required field: {field}")
-                return False
+                return
         
         # Validate temperature with correct units
         temp = data.get('temperature')
-        if temp is not None:
-            if self.temperature_unit == "imperial":
-                min_temp = self.rules.min_temperature_fahrenheit
-                max_temp = self.rules.max_temperature_fahrenheit
-                temp_unit = "°F"
-            elif self.temperature_unit == "metric":
-                min_temp = self.rules.min_temperature_celsius
-                max_temp = self.rules.max_temperature_celsius
-                temp_unit = "°C"
-            else:  # kelvin
-                min_temp = self.rules.min_temperature_kelvin
-                max_temp = self.rules.max_temperature_kelvin
-                temp_unit = "K"
-            
-            if not (min_temp <= temp <= max_temp):
-                self.logger.warning(f"Temperature out of range: {temp}{temp_unit} (expected {min_temp}-{max_temp})")
-                return False
+        min_temp, max_temp, temp_unit = self._temperature_bounds()
+        if not (min_temp <= temp <= max_temp):
+            self.logger.warning(f"Temperature out of range: {temp}{temp_unit} (expected {min_temp}-{max_temp})")
+            return
         
         # Validate humidity
         humidity = data.get('humidity')
-        if humidity is not None:
-            if not (self.rules.min_humidity <= humidity <= self.rules.max_humidity):
-                self.logger.warning(f"Humidity out of range: {humidity}%")
-                return False
+        if humidity is not None and not (self.rules.min_humidity <= humidity <= self.rules.max_humidity):
+            self.logger.warning(f"Humidity out of range: {humidity}%")
+            return
         
         # Validate pressure
         pressure = data.get('pressure')
-        if pressure is not None:
-            if not (self.rules.min_pressure <= pressure <= self.rules.max_pressure):
-                self.logger.warning(f"Pressure out of range: {pressure} hPa")
-                return False
+        if pressure is not None and not (self.rules.min_pressure <= pressure <= self.rules.max_pressure):
+            self.logger.warning(f"Pressure out of range: {pressure} hPa")
+            return
         
         # Validate wind speed with correct units
         wind_speed = data.get('wind_speed')
-        if wind_speed is not None:
-            if self.temperature_unit == "imperial":
-                max_wind = self.rules.max_wind_speed_imperial
-                wind_unit = "mph"
-            else:  # metric
-                max_wind = self.rules.max_wind_speed_metric
-                wind_unit = "m/s"
-            
-            if wind_speed > max_wind:
-                self.logger.warning(f"Wind speed out of range: {wind_speed} {wind_unit}")
-                return False
-        
-        return True
+        max_wind, wind_unit = self._wind_bounds()
+        if wind_speed is not None and wind_speed > max_wind:
+            self.logger.warning(f"Wind speed out of range: {wind_speed} {wind_unit}")
     
     def validate_forecast_data(self, raw_forecast_list: list) -> list:
         """
@@ -240,7 +274,7 @@ class WeatherDataValidator:
                     'temperature_max': self._clean_float(forecast_item.get('temp', {}).get('max')),
                     'humidity': self._clean_int(forecast_item.get('humidity')),
                     'pressure': self._clean_float(forecast_item.get('pressure')),
-                    'weather_main': self._clean_string(forecast_item.get('weather', [{}])[0].get('main')),
+                    'weather_main': self._clean_token(forecast_item.get('weather', [{}])[0].get('main')),
                     'weather_description': self._clean_string(forecast_item.get('weather', [{}])[0].get('description')),
                     'precipitation_probability': self._clean_float(forecast_item.get('pop')),
                     'wind_speed': self._clean_float(forecast_item.get('wind_speed')),
@@ -326,7 +360,7 @@ class WeatherDataValidator:
                 return None
             
             weather_info = weather_list[0]
-            description = weather_info.get('description', '').title()
+            description = _title(weather_info.get('description', ''))
             main_weather = weather_info.get('main', '')
             icon = weather_info.get('icon', '')
             
@@ -374,8 +408,11 @@ class WeatherDataValidator:
         try:
             forecast_list = []
             
+            # Resolve range limits once for the whole batch
+            bounds = self._forecast_bounds()
+            
             for day_data in daily_data[:7]:  # Limit to 7 days
-                day_forecast = self._validate_daily_forecast_day(day_data)
+                day_forecast = self._validate_daily_forecast_day(day_data, bounds)
                 if day_forecast:
                     forecast_list.append(day_forecast)
             
@@ -385,9 +422,24 @@ class WeatherDataValidator:
             self.logger.error(f"Error extracting daily forecast: {e}")
             return []
     
-    def _validate_daily_forecast_day(self, day_data: Dict) -> Optional[Dict]:
+    def _forecast_bounds(self) -> tuple:
+        """Return the numeric range limits used to validate forecast days"""
+        min_temp, max_temp, _ = self._temperature_bounds()
+        max_wind, _ = self._wind_bounds()
+        return (
+            min_temp, max_temp,
+            self.rules.min_humidity, self.rules.max_humidity,
+            self.rules.min_pressure, self.rules.max_pressure,
+            max_wind
+        )
+    
+    def _validate_daily_forecast_day(self, day_data: Dict, bounds: tuple = None) -> Optional[Dict]:
         """Validate a single day of forecast data"""
         try:
+            min_temp, max_temp, min_hum, max_hum, min_press, max_press, max_wind = (
+                bounds or self._forecast_bounds()
+            )
+            
             # Temperature data
             temp_data = day_data.get('temp', {})
             temp_min = temp_data.get('min')
@@ -395,7 +447,7 @@ class WeatherDataValidator:
             temp_day = temp_data.get('day')
             temp_night = temp_data.get('night')
             
-            if not self._is_valid_temperature(temp_min) or not self._is_valid_temperature(temp_max):
+            if not (_in_range(temp_min, min_temp, max_temp) and _in_range(temp_max, min_temp, max_temp)):
                 self.logger.warning(f"Invalid forecast temperatures: min={temp_min}, max={temp_max}")
                 return None
             
@@ -405,7 +457,7 @@ class WeatherDataValidator:
                 return None
             
             weather_info = weather_list[0]
-            description = weather_info.get('description', '').title()
+            description = _title(weather_info.get('description', ''))
             main_weather = weather_info.get('main', '')
             icon = weather_info.get('icon', '')
             
@@ -427,9 +479,9 @@ class WeatherDataValidator:
                 'description': description,
                 'main': main_weather,
                 'icon': icon,
-                'humidity': humidity if self._is_valid_humidity(humidity) else None,
-                'pressure': pressure if self._is_valid_pressure(pressure) else None,
-                'wind_speed': wind_speed if self._is_valid_wind_speed(wind_speed) else None,
+                'humidity': humidity if _in_range(humidity, min_hum, max_hum, int) else None,
+                'pressure': pressure if _in_range(pressure, min_press, max_press) else None,
+                'wind_speed': wind_speed if _in_range(wind_speed, 0, max_wind) else None,
                 'wind_deg': wind_deg,
                 'clouds': clouds,
                 'pop': pop,  # Probability of precipitation (0-1)
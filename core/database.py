@@ -4,25 +4,143 @@ import sqlite3
 import json
 import os
 import logging
+import atexit
+import threading
+import zlib
+from itertools import islice
+from types import MappingProxyType
+import queue
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from contextlib import contextmanager
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Per-connection performance settings (journal_mode is persistent in the file)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",      # ~64 MB page cache
+    "PRAGMA mmap_size=134217728",    # 128 MB memory-mapped I/O
+    "PRAGMA busy_timeout=5000",      # Wait up to 5s on a locked database
+    "PRAGMA foreign_keys=ON",
+)
+
+# Source column order expected by historical_weather inserts (after city, state)
+HISTORICAL_SOURCE_COLUMNS = (
+    'date',
+    'temperature_2m_max',
+    'temperature_2m_min',
+    'temperature_2m_mean',
+    'precipitation_sum',
+    'rain_sum',
+    'wind_speed_10m_max',
+    'wind_gusts_10m_max',
+    'cloud_cover_mean',
+    'relative_humidity_2m_mean',
+    'latitude',
+    'longitude',
+    'sunrise',
+    'sunset',
+)
+
+# Shared read-only defaults for missing API sections, instead of fresh literals per call
+_EMPTY_DICT = MappingProxyType({})
+_EMPTY_WEATHER = (_EMPTY_DICT,)
+
+# Bump whenever _initialize_database's DDL changes so existing files re-run it
+SCHEMA_VERSION = 2
+
+# PRAGMA auto_vacuum value for INCREMENTAL, and freelist pages released per cleanup
+_AUTO_VACUUM_INCREMENTAL = 2
+_INCREMENTAL_VACUUM_PAGES = 1000
+
+# Freshness windows are bound as parameters (e.g. '-1 hours') so each query
+# keeps a single SQL text and hits sqlite3's prepared-statement cache
+SQL_GET_CURRENT = '''
+    SELECT * FROM current_weather
+    WHERE city = ? AND state = ?
+    AND datetime(timestamp) > datetime('now', ?)
+    ORDER BY timestamp DESC LIMIT 1
+'''
+
+SQL_GET_FORECAST = '''
+    SELECT * FROM forecast_weather
+    WHERE city = ? AND state = ?
+    AND datetime(created_timestamp) > datetime('now', ?)
+    ORDER BY forecast_date ASC
+'''
+
+def encode_api_response(data) -> bytes:
+    """Serialize a raw API payload to a compact zlib-compressed JSON BLOB"""
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    return sqlite3.Binary(zlib.compress(payload, 1))
+
+
+def decode_api_response(payload):
+    """Inverse of encode_api_response; also reads legacy plain-JSON TEXT values"""
+    if payload is None:
+        return None
+    if isinstance(payload, str):
+        return json.loads(payload)
+    raw = zlib.decompress(payload)
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+# Historical rows committed per transaction; bounds WAL growth on large ingests
+_HISTORICAL_CHUNK_ROWS = 10000
+
+# Upper bound on queued writes grouped into one background commit
+_WRITE_BATCH_SIZE = 64
+
+# Sentinel telling the background writer thread to exit
+_STOP_WRITER = object()
+
+_INSERT_HISTORICAL_SQL = '''
+    INSERT INTO historical_weather
+    (city, state, date, temperature_max, temperature_min, temperature_mean,
+     precipitation, rain, wind_speed_max, wind_gusts_max, cloud_cover,
+     humidity, latitude, longitude, sunrise, sunset)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(city, state, date) DO UPDATE SET
+        temperature_max = excluded.temperature_max,
+        temperature_min = excluded.temperature_min,
+        temperature_mean = excluded.temperature_mean,
+        precipitation = excluded.precipitation,
+        rain = excluded.rain,
+        wind_speed_max = excluded.wind_speed_max,
+        wind_gusts_max = excluded.wind_gusts_max,
+        cloud_cover = excluded.cloud_cover,
+        humidity = excluded.humidity,
+        latitude = excluded.latitude,
+        longitude = excluded.longitude,
+        sunrise = excluded.sunrise,
+        sunset = excluded.sunset
+'''
+
 class WeatherDatabase:
     """Handles all database operations for weather data storage"""
     
     def __init__(self, db_path: str = "data/weather.db"):
         """Initialize the database connection"""
         self.db_path = db_path
+        self._local = threading.local()  # One cached connection per thread
+        self._write_queue = queue.Queue()
+        self._writer_thread = None
+        self._writer_lock = threading.Lock()
         self._ensure_database_directory()
         self._initialize_database()
-        if not self._verify_tables():
-            logger.info("Re-initializing database tables...")
-            self._initialize_database()  # Try to create tables again
-            if not self._verify_tables():
-                raise RuntimeError("Failed to initialize database tables")
+        atexit.register(self.close)
         logger.info("Database initialized successfully at %s", self.db_path)
     
     def _ensure_database_directory(self):
@@ -39,47 +157,162 @@ class WeatherDatabase:
             logger.error("Error ensuring database directory exists: %s", e)
             raise
     
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection) -> None:
+        """Apply WAL mode and related performance PRAGMAs to a new connection"""
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's cached connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode: writes open their own BEGIN IMMEDIATE via transaction()
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+            self._apply_pragmas(conn)
+            self._local.conn = conn
+        return conn
+    
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+        """Context manager yielding the calling thread's long-lived connection
+        
+        Waits for queued background writes first so reads see them.
+        """
+        self.flush()
+        conn = self._connect()
         try:
             yield conn
         except Exception as e:
             conn.rollback()
             raise e
-        finally:
-            conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        """Context manager running the block in one BEGIN IMMEDIATE write transaction
+        
+        Taking the write lock up front avoids the deferred-to-reserved lock
+        upgrade that fails with SQLITE_BUSY when another connection is writing.
+        Commits on success and rolls back if the block raises.
+        """
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+    
+    def submit_write(self, sql: str, rows: List[Tuple]) -> Future:
+        """
+        Queue a write for the background writer thread
+        
+        Args:
+            sql: Parameterised INSERT/UPDATE/DELETE statement
+            rows: Parameter tuples, run with executemany
             
-    def _verify_tables(self):
-        """Verify that all required tables exist"""
+        Returns:
+            Future resolving to True once the write is committed
+        """
+        future = Future()
+        self._ensure_writer()
+        self._write_queue.put((sql, rows, future))
+        return future
+    
+    def flush(self) -> None:
+        """Block until every queued background write has been committed"""
+        writer = self._writer_thread
+        if writer is not None and writer.is_alive() and writer is not threading.current_thread():
+            self._write_queue.join()
+    
+    def _ensure_writer(self) -> None:
+        """Start the background writer thread if it is not running"""
+        with self._writer_lock:
+            if self._writer_thread is None or not self._writer_thread.is_alive():
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="WeatherDatabaseWriter", daemon=True
+                )
+                self._writer_thread.start()
+    
+    def _writer_loop(self) -> None:
+        """Drain the write queue, grouping pending writes into one transaction"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT name FROM sqlite_master 
-                    WHERE type='table' AND name IN 
-                    ('current_weather', 'forecast_weather', 'saved_locations', 'user_preferences', 'historical_weather')
-                """)
-                existing_tables = {row[0] for row in cursor.fetchall()}
-                required_tables = {'current_weather', 'forecast_weather', 'saved_locations', 'user_preferences', 'historical_weather'}
-                missing_tables = required_tables - existing_tables
+            while True:
+                batch = [self._write_queue.get()]
+                while len(batch) < _WRITE_BATCH_SIZE:
+                    try:
+                        batch.append(self._write_queue.get_nowait())
+                    except queue.Empty:
+                        break
                 
-                if missing_tables:
-                    logger.warning("Missing tables detected: %s", missing_tables)
-                    return False
-                else:
-                    logger.debug("All required database tables verified")
+                writes = [item for item in batch if item is not _STOP_WRITER]
+                try:
+                    if writes:
+                        self._commit_writes(writes)
+                finally:
+                    for _ in batch:
+                        self._write_queue.task_done()
                 
-                return True
+                if len(writes) < len(batch):
+                    break
+        finally:
+            self._close_thread_connection()
+    
+    def _commit_writes(self, writes: List[Tuple]) -> None:
+        """Commit queued writes together, falling back to one at a time on error"""
+        try:
+            with self.transaction() as conn:
+                for sql, rows, _ in writes:
+                    conn.executemany(sql, rows)
         except Exception as e:
-            logger.error("Error verifying tables: %s", e)
-            return False
-
+            if len(writes) > 1:
+                logger.warning("Grouped write failed (%s), retrying writes individually", e)
+                for write in writes:
+                    self._commit_writes([write])
+                return
+            logger.error("Error in queued database write: %s", e)
+            writes[0][2].set_exception(e)
+            return
+        
+        for _, _, future in writes:
+            future.set_result(True)
+    
+    def close(self) -> None:
+        """Flush and stop the background writer, then close this thread's connection"""
+        writer = self._writer_thread
+        if writer is not None and writer.is_alive() and writer is not threading.current_thread():
+            self._write_queue.put(_STOP_WRITER)
+            writer.join()
+        self._close_thread_connection()
+    
+    def _close_thread_connection(self) -> None:
+        """Close the calling thread's cached connection, if any"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning("Error closing database connection: %s", e)
+            
     def _initialize_database(self):
-        """Create database tables if they don't exist"""
+        """Create tables and indexes in one transaction unless already at SCHEMA_VERSION"""
         with self.get_connection() as conn:
+            if conn.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+                logger.debug("Database schema is current (version %s)", SCHEMA_VERSION)
+                return
+            
+            # auto_vacuum only changes on a VACUUM once the file has a header,
+            # which the journal_mode=WAL pragma has already written
+            if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != _AUTO_VACUUM_INCREMENTAL:
+                logger.info("Enabling incremental auto_vacuum (one-time VACUUM)")
+                conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+                conn.execute('VACUUM')
+        
+        with self.transaction() as conn:
             cursor = conn.cursor()
             
             # Current weather table
@@ -103,7 +336,7 @@ class WeatherDatabase:
                     visibility INTEGER,
                     uv_index REAL,
                     timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    api_response TEXT,  -- Store full API response as JSON
+                    api_response BLOB,  -- Full API response, zlib-compressed JSON
                     UNIQUE(city, state, timestamp)
                 )
             ''')
@@ -129,7 +362,7 @@ class WeatherDatabase:
                     precipitation_probability REAL,
                     precipitation_amount REAL,
                     created_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    api_response TEXT,
+                    api_response BLOB,
                     UNIQUE(city, state, forecast_date)
                 )
             ''')
@@ -184,94 +417,128 @@ class WeatherDatabase:
                     UNIQUE(city, state, date)
                 )
             ''')
-            
-            conn.commit()
+
+            # The UNIQUE constraints already index the (city, state, timestamp/date)
+            # lookups; the history query groups on DATE(timestamp), which needs an
+            # expression index to avoid scanning every reading for the city
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_current_city_date
+                ON current_weather(city, state, DATE(timestamp))
+            ''')
+
+            # Refresh planner statistics so the indexes are picked up
+            conn.execute('ANALYZE')
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        logger.info("Database schema migrated to version %s", SCHEMA_VERSION)
     
     def save_current_weather(self, weather_data: Dict, city: str, state: str = None) -> bool:
-        """Save current weather data to database"""
+        """Queue current weather data for the background writer"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Extract data from API response
-                main_data = weather_data.get('main', {})
-                weather_info = weather_data.get('weather', [{}])[0]
-                wind_data = weather_data.get('wind', {})
-                coord_data = weather_data.get('coord', {})
-                
-                cursor.execute('''
-                    INSERT OR REPLACE INTO current_weather (
-                        city, state, latitude, longitude, temperature, feels_like,
-                        humidity, pressure, wind_speed, wind_direction,
-                        weather_description, weather_main, weather_icon,
-                        visibility, api_response
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    city,
-                    state,
-                    coord_data.get('lat'),
-                    coord_data.get('lon'),
-                    main_data.get('temp'),
-                    main_data.get('feels_like'),
-                    main_data.get('humidity'),
-                    main_data.get('pressure'),
-                    wind_data.get('speed'),
-                    wind_data.get('deg'),
-                    weather_info.get('description'),
-                    weather_info.get('main'),
-                    weather_info.get('icon'),
-                    weather_data.get('visibility'),
-                    json.dumps(weather_data)
-                ))
-                
-                conn.commit()
-                return True
-                
+            # Extract data from API response
+            main_data = weather_data.get('main', _EMPTY_DICT)
+            weather_info = (weather_data.get('weather') or _EMPTY_WEATHER)[0]
+            wind_data = weather_data.get('wind', _EMPTY_DICT)
+            coord_data = weather_data.get('coord', _EMPTY_DICT)
+            
+            self.submit_write('''
+                INSERT INTO current_weather (
+                    city, state, latitude, longitude, temperature, feels_like,
+                    humidity, pressure, wind_speed, wind_direction,
+                    weather_description, weather_main, weather_icon,
+                    visibility, api_response
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(city, state, timestamp) DO UPDATE SET
+                    latitude = excluded.latitude,
+                    longitude = excluded.longitude,
+                    temperature = excluded.temperature,
+                    feels_like = excluded.feels_like,
+                    humidity = excluded.humidity,
+                    pressure = excluded.pressure,
+                    wind_speed = excluded.wind_speed,
+                    wind_direction = excluded.wind_direction,
+                    weather_description = excluded.weather_description,
+                    weather_main = excluded.weather_main,
+                    weather_icon = excluded.weather_icon,
+                    visibility = excluded.visibility,
+                    api_response = excluded.api_response
+            ''', [(
+                city,
+                state,
+                coord_data.get('lat'),
+                coord_data.get('lon'),
+                main_data.get('temp'),
+                main_data.get('feels_like'),
+                main_data.get('humidity'),
+                main_data.get('pressure'),
+                wind_data.get('speed'),
+                wind_data.get('deg'),
+                weather_info.get('description'),
+                weather_info.get('main'),
+                weather_info.get('icon'),
+                weather_data.get('visibility'),
+                encode_api_response(weather_data)
+            )])
+            
+            return True
+            
         except Exception as e:
             logger.error("Error saving current weather: %s", e)
             return False
     
+    @staticmethod
+    def _forecast_row(day_forecast: Dict, city: str, state: str) -> Tuple:
+        """Build the forecast_weather parameter tuple for one forecast day"""
+        temp_data = day_forecast.get('temp', _EMPTY_DICT)
+        weather_info = (day_forecast.get('weather') or _EMPTY_WEATHER)[0]
+        
+        return (
+            city,
+            state,
+            datetime.fromtimestamp(day_forecast.get('dt')).date().isoformat(),
+            temp_data.get('min'),
+            temp_data.get('max'),
+            temp_data.get('day'),
+            temp_data.get('night'),
+            day_forecast.get('humidity'),
+            day_forecast.get('pressure'),
+            day_forecast.get('wind_speed'),
+            weather_info.get('description'),
+            weather_info.get('main'),
+            weather_info.get('icon'),
+            day_forecast.get('pop'),  # Probability of precipitation
+            encode_api_response(day_forecast)
+        )
+    
     def save_forecast_data(self, forecast_data: List[Dict], city: str, state: str = None) -> bool:
-        """Save 7-day forecast data to database"""
+        """Queue 7-day forecast data for the background writer"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                for day_forecast in forecast_data:
-                    # Extract forecast data
-                    temp_data = day_forecast.get('temp', {})
-                    weather_info = day_forecast.get('weather', [{}])[0]
-                    
-                    # Convert timestamp to date
-                    forecast_date = datetime.fromtimestamp(day_forecast.get('dt')).date()
-                    
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO forecast_weather (
-                            city, state, forecast_date, temperature_min, temperature_max,
-                            temperature_day, temperature_night, humidity, pressure,
-                            wind_speed, weather_description, weather_main, weather_icon,
-                            precipitation_probability, api_response
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        city,
-                        state,
-                        forecast_date,
-                        temp_data.get('min'),
-                        temp_data.get('max'),
-                        temp_data.get('day'),
-                        temp_data.get('night'),
-                        day_forecast.get('humidity'),
-                        day_forecast.get('pressure'),
-                        day_forecast.get('wind_speed'),
-                        weather_info.get('description'),
-                        weather_info.get('main'),
-                        weather_info.get('icon'),
-                        day_forecast.get('pop'),  # Probability of precipitation
-                        json.dumps(day_forecast)
-                    ))
-                
-                conn.commit()
-                return True
+            rows = [self._forecast_row(day_forecast, city, state) for day_forecast in forecast_data]
+            
+            # One prepared statement and one transaction for the whole batch
+            self.submit_write('''
+                INSERT INTO forecast_weather (
+                    city, state, forecast_date, temperature_min, temperature_max,
+                    temperature_day, temperature_night, humidity, pressure,
+                    wind_speed, weather_description, weather_main, weather_icon,
+                    precipitation_probability, api_response
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(city, state, forecast_date) DO UPDATE SET
+                    temperature_min = excluded.temperature_min,
+                    temperature_max = excluded.temperature_max,
+                    temperature_day = excluded.temperature_day,
+                    temperature_night = excluded.temperature_night,
+                    humidity = excluded.humidity,
+                    pressure = excluded.pressure,
+                    wind_speed = excluded.wind_speed,
+                    weather_description = excluded.weather_description,
+                    weather_main = excluded.weather_main,
+                    weather_icon = excluded.weather_icon,
+                    precipitation_probability = excluded.precipitation_probability,
+                    created_timestamp = CURRENT_TIMESTAMP,
+                    api_response = excluded.api_response
+            ''', rows)
+            
+            return True
                 
         except Exception as e:
             logger.error("Error saving forecast data: %s", e)
@@ -289,54 +556,77 @@ class WeatherDatabase:
         Returns:
             True if successful, False otherwise
         """
+        return self.save_historical_weather_many(city, state, [data])
+    
+    def save_historical_weather_many(self, city: str, state: str, records: List[Dict]) -> bool:
+        """
+        Save many days of historical weather data in a single transaction
+        
+        Args:
+            city: City name
+            state: State code
+            records: Dictionaries with historical weather data, one per day
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        rows = (tuple(data[column] for column in HISTORICAL_SOURCE_COLUMNS) for data in records)
+        return self.save_historical_weather_bulk(city, state, rows)
+    
+    def save_historical_weather_bulk(self, city: str, state: str, rows: Iterable[Tuple]) -> bool:
+        """
+        Save positional historical weather rows with one executemany per chunk transaction
+        
+        A chunk that fails is rolled back and retried row by row so only the
+        bad rows are skipped.
+        
+        Args:
+            city: City name
+            state: State code
+            rows: Tuples ordered as HISTORICAL_SOURCE_COLUMNS, one per day
+            
+        Returns:
+            True if every row was saved, False otherwise
+        """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT OR REPLACE INTO historical_weather
-                    (city, state, date, temperature_max, temperature_min, temperature_mean,
-                     precipitation, rain, wind_speed_max, wind_gusts_max, cloud_cover,
-                     humidity, latitude, longitude, sunrise, sunset)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    city,
-                    state,
-                    data['date'],
-                    data['temperature_2m_max'],
-                    data['temperature_2m_min'],
-                    data['temperature_2m_mean'],
-                    data['precipitation_sum'],
-                    data['rain_sum'],
-                    data['wind_speed_10m_max'],
-                    data['wind_gusts_10m_max'],
-                    data['cloud_cover_mean'],
-                    data['relative_humidity_2m_mean'],
-                    data['latitude'],
-                    data['longitude'],
-                    data['sunrise'],
-                    data['sunset']
-                ))
-                conn.commit()
-                return True
+            params = ((city, state, *row) for row in rows)
+            skipped = 0
+            
+            while True:
+                chunk = list(islice(params, _HISTORICAL_CHUNK_ROWS))
+                if not chunk:
+                    break
+                try:
+                    with self.transaction() as conn:
+                        conn.executemany(_INSERT_HISTORICAL_SQL, chunk)
+                except sqlite3.Error as e:
+                    logger.warning("Historical chunk of %s rows failed (%s), retrying row by row", len(chunk), e)
+                    skipped += self._save_historical_rows_individually(chunk)
+            
+            if skipped:
+                logger.warning("Skipped %s invalid historical rows for %s, %s", skipped, city, state)
+            return skipped == 0
         except Exception as e:
-            logger.error(f"Error saving historical weather data: {str(e)}")
+            logger.error("Error saving historical weather data: %s", e)
             return False
     
+    def _save_historical_rows_individually(self, chunk: List[Tuple]) -> int:
+        """Insert rows one statement at a time in one transaction; return how many failed"""
+        failed = 0
+        with self.transaction() as conn:
+            for params in chunk:
+                try:
+                    conn.execute(_INSERT_HISTORICAL_SQL, params)
+                except sqlite3.Error as e:
+                    failed += 1
+                    logger.debug("Skipping historical row %s: %s", params[:3], e)
+        return failed
+    
     def get_current_weather(self, city: str, state: str = None, max_age_hours: int = 1) -> Optional[Dict]:
         """Retrieve current weather data from database if recent enough"""
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = '''
-                    SELECT * FROM current_weather 
-                    WHERE city = ? AND state = ?
-                    AND datetime(timestamp) > datetime('now', '-{} hours')
-                    ORDER BY timestamp DESC LIMIT 1
-                '''.format(max_age_hours)
-                
-                cursor.execute(query, (city, state))
-                row = cursor.fetchone()
+                row = conn.execute(SQL_GET_CURRENT, (city, state, f'-{int(max_age_hours)} hours')).fetchone()
                 
                 if row:
                     return dict(row)
@@ -350,19 +640,10 @@ class WeatherDatabase:
         """Retrieve forecast data from database if recent enough"""
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = '''
-                    SELECT * FROM forecast_weather 
-                    WHERE city = ? AND state = ?
-                    AND datetime(created_timestamp) > datetime('now', '-{} hours')
-                    ORDER BY forecast_date ASC
-                '''.format(max_age_hours)
-                
-                cursor.execute(query, (city, state))
-                rows = cursor.fetchall()
+                cursor = conn.execute(SQL_GET_FORECAST, (city, state, f'-{int(max_age_hours)} hours'))
                 
-                return [dict(row) for row in rows]
+                # Stream rows from the cursor instead of materializing fetchall() first
+                return [dict(row) for row in cursor]
                 
         except Exception as e:
             logger.error("Error retrieving forecast data: %s", e)
@@ -383,8 +664,7 @@ class WeatherDatabase:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
+                cursor = conn.execute('''
                     SELECT *
                     FROM historical_weather
                     WHERE city = ? AND state = ?
@@ -392,10 +672,10 @@ class WeatherDatabase:
                     ORDER BY date ASC
                 ''', (city, state, start_date, end_date))
                 
-                return [dict(row) for row in cursor.fetchall()]
+                return [dict(row) for row in cursor]
                 
         except Exception as e:
-            logger.error(f"Error retrieving historical weather data: {str(e)}")
+            logger.error("Error retrieving historical weather data: %s", e)
             return []
     
     def save_location(
@@ -406,7 +686,7 @@ class WeatherDatabase:
         latitude: float = None,
         longitude: float = None,
     ) -> bool:
-        """Save a location to saved locations"""
+        """Queue a location upsert into saved locations for the background writer"""
         try:
             logger.debug(
                 "Attempting to save location: city=%s, state=%s, nickname=%s, lat=%s, lon=%s",
@@ -417,34 +697,23 @@ class WeatherDatabase:
                 longitude,
             )
 
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # First check if location already exists
-                cursor.execute(
-                    """
-                        SELECT id FROM saved_locations
-                        WHERE city = ? AND state = ?
-                    """,
-                    (city, state),
-                )
-
-                existing = cursor.fetchone()
-                if existing:
-                    logger.debug("Location already exists with id %s, updating...", existing[0])
+            # UPSERT keeps the row id stable when the location already exists
+            self.submit_write(
+                """
+                    INSERT INTO saved_locations (
+                        city, state, nickname, latitude, longitude, last_accessed
+                    ) VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(city, state, country) DO UPDATE SET
+                        nickname = excluded.nickname,
+                        latitude = excluded.latitude,
+                        longitude = excluded.longitude,
+                        last_accessed = CURRENT_TIMESTAMP
+                """,
+                [(city, state, nickname, latitude, longitude)],
+            )
 
-                cursor.execute(
-                    """
-                        INSERT OR REPLACE INTO saved_locations (
-                            city, state, nickname, latitude, longitude, last_accessed
-                        ) VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    """,
-                    (city, state, nickname, latitude, longitude),
-                )
-
-                conn.commit()
-                logger.info("Successfully saved location: %s, %s", city, state)
-                return True
+            logger.info("Queued location save: %s, %s", city, state)
+            return True
 
         except Exception as e:
             logger.error("Error saving location: %s", e)
@@ -455,13 +724,11 @@ class WeatherDatabase:
         """Get all saved locations"""
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
+                cursor = conn.execute('''
                     SELECT * FROM saved_locations 
                     ORDER BY is_favorite DESC, last_accessed DESC
                 ''')
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+                return [dict(row) for row in cursor]
                 
         except Exception as e:
             logger.error("Error retrieving saved locations: %s", e)
@@ -470,10 +737,8 @@ class WeatherDatabase:
     def remove_saved_location(self, location_id: int) -> bool:
         """Remove a saved location by ID"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM saved_locations WHERE id = ?', (location_id,))
-                conn.commit()
+            with self.transaction() as conn:
+                cursor = conn.execute('DELETE FROM saved_locations WHERE id = ?', (location_id,))
                 return cursor.rowcount > 0
                 
         except Exception as e:
@@ -483,13 +748,14 @@ class WeatherDatabase:
     def save_user_preference(self, key: str, value: str) -> bool:
         """Save a user preference"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT OR REPLACE INTO user_preferences (preference_key, preference_value)
+            with self.transaction() as conn:
+                conn.execute('''
+                    INSERT INTO user_preferences (preference_key, preference_value)
                     VALUES (?, ?)
+                    ON CONFLICT(preference_key) DO UPDATE SET
+                        preference_value = excluded.preference_value,
+                        updated_at = CURRENT_TIMESTAMP
                 ''', (key, value))
-                conn.commit()
                 return True
                 
         except Exception as e:
@@ -500,9 +766,9 @@ class WeatherDatabase:
         """Get a user preference value"""
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT preference_value FROM user_preferences WHERE preference_key = ?', (key,))
-                row = cursor.fetchone()
+                row = conn.execute(
+                    'SELECT preference_value FROM user_preferences WHERE preference_key = ?', (key,)
+                ).fetchone()
                 return row[0] if row else default
                 
         except Exception as e:
@@ -512,29 +778,33 @@ class WeatherDatabase:
     def cleanup_old_data(self, days_to_keep: int = 30) -> bool:
         """Clean up old weather data to prevent database bloat"""
         try:
-            with self.get_connection() as conn:
+            with self.transaction() as conn:
                 cursor = conn.cursor()
+                cutoff = (f'-{int(days_to_keep)} days',)
                 
                 # Clean up old current weather data
                 cursor.execute('''
                     DELETE FROM current_weather 
-                    WHERE datetime(timestamp) < datetime('now', '-{} days')
-                '''.format(days_to_keep))
+                    WHERE datetime(timestamp) < datetime('now', ?)
+                ''', cutoff)
                 
                 # Clean up old forecast data
                 cursor.execute('''
                     DELETE FROM forecast_weather 
-                    WHERE datetime(created_timestamp) < datetime('now', '-{} days')
-                '''.format(days_to_keep))
+                    WHERE datetime(created_timestamp) < datetime('now', ?)
+                ''', cutoff)
                 
                 # Clean up old historical weather data
                 cursor.execute('''
                     DELETE FROM historical_weather 
-                    WHERE date < date('now', '-{} days')
-                '''.format(days_to_keep))
-                
-                conn.commit()
-                return True
+                    WHERE date < date('now', ?)
+                ''', cutoff)
+            
+            # Hand freed pages back to the OS without a full VACUUM rewrite;
+            # executescript steps the pragma to completion
+            with self.get_connection() as conn:
+                conn.executescript(f'PRAGMA incremental_vacuum({_INCREMENTAL_VACUUM_PAGES});')
+            return True
                 
         except Exception as e:
             logger.error("Error cleaning up old data: %s", e)
@@ -3,18 +3,26 @@
 import json
 import os
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional
 import pandas as pd
-from core.database import get_database
+from core.database import HISTORICAL_SOURCE_COLUMNS, get_database
 
 logger = logging.getLogger(__name__)
 
+# Current-weather reads are memoized per (city, state, max_age) for one time bucket
+_WEATHER_CACHE_SIZE = 32
+_WEATHER_CACHE_BUCKET_SECONDS = 60
+
 class DatabaseDataHandler:
     """Enhanced data handler that uses SQLite database for persistence"""
     
     def __init__(self):
         self.db = get_database()
+        self._preferences = {}  # Preference values read or written through this handler
+        self._weather_cache = OrderedDict()  # (city, state, max_age_hours, bucket) -> row
         # Keep JSON fallback for migration/backup
         self.json_file = "data/saved_locations.json"
         self._migrate_json_data()
@@ -47,6 +55,7 @@ class DatabaseDataHandler:
     
     def save_weather_data(self, weather_data: Dict, city: str, state: str = None) -> bool:
         """Save current weather data to database"""
+        self._invalidate_weather_cache(city, state)
         return self.db.save_current_weather(weather_data, city, state)
     
     def save_forecast_data(self, forecast_data: List[Dict], city: str, state: str = None) -> bool:
@@ -54,8 +63,25 @@ class DatabaseDataHandler:
         return self.db.save_forecast_data(forecast_data, city, state)
     
     def get_weather_data(self, city: str, state: str = None, max_age_hours: int = 1) -> Optional[Dict]:
-        """Get cached weather data if recent enough"""
-        return self.db.get_current_weather(city, state, max_age_hours)
+        """Get cached weather data if recent enough, memoized for the current minute"""
+        key = (city, state, max_age_hours, int(time.time()) // _WEATHER_CACHE_BUCKET_SECONDS)
+        
+        if key in self._weather_cache:
+            self._weather_cache.move_to_end(key)
+            result = self._weather_cache[key]
+        else:
+            result = self.db.get_current_weather(city, state, max_age_hours)
+            self._weather_cache[key] = result
+            if len(self._weather_cache) > _WEATHER_CACHE_SIZE:
+                self._weather_cache.popitem(last=False)
+        
+        # Hand out a copy so callers can't mutate the cached row
+        return dict(result) if result is not None else None
+    
+    def _invalidate_weather_cache(self, city: str, state: str = None) -> None:
+        """Drop memoized current-weather reads for one location"""
+        for key in [key for key in self._weather_cache if key[0] == city and key[1] == state]:
+            del self._weather_cache[key]
     
     def get_forecast_data(self, city: str, state: str = None, max_age_hours: int = 6) -> List[Dict]:
         """Get cached forecast data if recent enough"""
@@ -67,21 +93,29 @@ class DatabaseDataHandler:
     
     def load_saved_cities(self) -> List[Dict]:
         """Load all saved cities from database"""
-        locations = self.db.get_saved_locations()
-        
-        # Convert database format to match existing JSON format for compatibility
-        formatted_cities = []
-        for location in locations:
-            formatted_cities.append({
-                'id': location['id'],
-                'city': location['city'],
-                'state': location['state'],
-                'nickname': location.get('nickname'),
-                'last_updated': location['last_accessed'],
-                'is_favorite': bool(location.get('is_favorite', 0))
-            })
-        
-        return formatted_cities
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.execute('''
+                    SELECT id, city, state, nickname, last_accessed, is_favorite
+                    FROM saved_locations
+                    ORDER BY is_favorite DESC, last_accessed DESC
+                ''')
+                
+                # Build the JSON-compatible format straight from positional columns
+                return [
+                    {
+                        'id': row[0],
+                        'city': row[1],
+                        'state': row[2],
+                        'nickname': row[3],
+                        'last_updated': row[4],
+                        'is_favorite': bool(row[5] or 0)
+                    }
+                    for row in cursor
+                ]
+        except Exception as e:
+            logger.error("Error loading saved cities: %s", e)
+            return []
     
     def remove_saved_city(self, city_index_or_id) -> bool:
         """Remove a saved city by index (legacy) or ID"""
@@ -101,19 +135,27 @@ class DatabaseDataHandler:
     
     def save_user_theme(self, theme: str) -> bool:
         """Save user theme preference to database"""
-        return self.db.save_user_preference('theme', theme)
+        return self.save_user_preference('theme', theme)
     
     def load_user_theme(self, default: str = 'vapor') -> str:
         """Load user theme preference from database"""
-        return self.db.get_user_preference('theme', default)
+        return self.get_user_preference('theme', default)
     
     def save_user_preference(self, key: str, value: str) -> bool:
         """Save any user preference"""
-        return self.db.save_user_preference(key, value)
+        saved = self.db.save_user_preference(key, value)
+        if saved:
+            self._preferences[key] = value
+        else:
+            self._preferences.pop(key, None)
+        return saved
     
     def get_user_preference(self, key: str, default: str = None) -> Optional[str]:
-        """Get any user preference"""
-        return self.db.get_user_preference(key, default)
+        """Get any user preference, memoized until it is next saved through this handler"""
+        if key not in self._preferences:
+            self._preferences[key] = self.db.get_user_preference(key)
+        value = self._preferences[key]
+        return default if value is None else value
     
     def get_weather_history(self, city: str, state: str = None, days: int = 7) -> List[Dict]:
         """Get historical weather data for analytics"""
@@ -128,13 +170,12 @@ class DatabaseDataHandler:
                            weather_description
                     FROM current_weather 
                     WHERE city = ? AND state = ?
-                    AND DATE(timestamp) >= DATE('now', '-{} days')
+                    AND DATE(timestamp) >= DATE('now', ?)
                     GROUP BY DATE(timestamp)
                     ORDER BY date DESC
-                '''.format(days), (city, state))
+                ''', (city, state, f'-{int(days)} days'))
                 
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+                return [dict(row) for row in cursor]
                 
         except Exception as e:
             logger.error("Error getting weather history: %s", e)
@@ -142,11 +183,16 @@ class DatabaseDataHandler:
     
     def cleanup_old_data(self, days: int = 30) -> bool:
         """Clean up old weather data"""
+        self._weather_cache.clear()
         return self.db.cleanup_old_data(days)
     
     def save_historical_data(self, city: str, state: str, historical_df: pd.DataFrame) -> bool:
+        """Save historical weather data from DataFrame (alias of save_historical_data_bulk)"""
+        return self.save_historical_data_bulk(city, state, historical_df)
+    
+    def save_historical_data_bulk(self, city: str, state: str, historical_df: pd.DataFrame) -> bool:
         """
-        Save historical weather data from DataFrame
+        Save a whole historical DataFrame with one executemany per transaction
         
         Args:
             city: City name
@@ -157,13 +203,11 @@ class DatabaseDataHandler:
             True if successful, False otherwise
         """
         try:
-            success = True
-            for _, row in historical_df.iterrows():
-                if not self.db.save_historical_weather(city, state, row):
-                    success = False
-            return success
+            # Plain positional tuples in insert order; no per-row Series or dict
+            rows = historical_df[list(HISTORICAL_SOURCE_COLUMNS)].itertuples(index=False, name=None)
+            return self.db.save_historical_weather_bulk(city, state, rows)
         except Exception as e:
-            logger.error(f"Error saving historical data: {str(e)}")
+            logger.error("Error saving historical data: %s", e)
             return False
     
     def get_historical_data(self, city: str, state: str, start_date: datetime, end_date: datetime) -> List[Dict]:
@@ -187,5 +231,5 @@ class DatabaseDataHandler:
                 end_date=end_date.strftime("%Y-%m-%d")
             )
         except Exception as e:
-            logger.error(f"Error getting historical data: {str(e)}")
+            logger.error("Error getting historical data: %s", e)
             return []
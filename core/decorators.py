@@ -1,50 +1,95 @@
 """Useful decorators for the weather dashboard application"""
 
 import time
+import random
 import logging
+import threading
+from dataclasses import dataclass, field
 from functools import wraps
-from typing import Callable, Any
+from operator import itemgetter
+from typing import Callable, Any, Optional
 
-def rate_limit(min_interval: float = 1.0):
+@dataclass
+class TokenBucket:
+    """Token bucket allowing bursts of up to `capacity` calls, refilled at `refill_rate` tokens per second"""
+    capacity: float
+    refill_rate: float
+    tokens: Optional[float] = None
+    last_refill: int = field(default_factory=time.monotonic_ns)  # Integer nanoseconds
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.tokens is None:
+            self.tokens = self.capacity  # Start full so the first burst is immediate
+    
+    def acquire(self) -> float:
+        """
+        Take one token
+        
+        Returns:
+            Seconds the caller must wait before proceeding (0.0 if a token was available)
+        """
+        with self._lock:
+            now = time.monotonic_ns()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate / 1e9)
+            self.last_refill = now
+            
+            # Going negative reserves the next token, so concurrent waiters queue up
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.refill_rate
+
+def rate_limit(min_interval: float = 1.0, capacity: float = 3.0):
     """
-    Decorator to enforce rate limiting on API calls
+    Decorator to enforce token-bucket rate limiting on API calls
     
     Args:
-        min_interval: Minimum seconds between calls
+        min_interval: Sustained minimum seconds between calls (refill period of one token)
+        capacity: Number of calls allowed back-to-back before throttling starts
     """
     def decorator(func: Callable) -> Callable:
-        last_called = [0.0]  # Use list to allow modification in closure
+        bucket = TokenBucket(capacity=capacity, refill_rate=1.0 / min_interval)
         
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            current_time = time.time()
-            time_since_last = current_time - last_called[0]
-            
-            if time_since_last < min_interval:
-                sleep_time = min_interval - time_since_last
-                logging.debug(f"Rate limiting {func.__name__}: sleeping {sleep_time:.2f}s")
+            sleep_time = bucket.acquire()
+            if sleep_time > 0:
+                logging.debug("Rate limiting %s: sleeping %.2fs", func.__name__, sleep_time)
                 time.sleep(sleep_time)
-            
-            last_called[0] = time.time()
             return func(*args, **kwargs)
         
         return wrapper
     return decorator
 
-def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0):
+def _backoff_delay(delay: float, backoff: float, attempt: int, max_delay: float, jitter: str) -> float:
+    """Exponential backoff for a retry attempt, optionally randomized to spread out retries"""
+    ceiling = min(max_delay, delay * (backoff ** attempt))
+    if jitter == 'full':
+        return random.uniform(0, ceiling)
+    if jitter == 'equal':
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+    return ceiling
+
+def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0,
+                     max_delay: float = 60.0, jitter: str = 'full'):
     """
-    Decorator to retry functions on failure with exponential backoff
+    Decorator to retry functions on failure with jittered exponential backoff
     
     Args:
         max_retries: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
         backoff: Multiplier for delay on each retry
+        max_delay: Upper bound on any single delay in seconds
+        jitter: 'full' (uniform 0..delay), 'equal' (half fixed, half random) or 'none'
     """
+    if jitter not in ('full', 'equal', 'none'):
+        raise ValueError(f"Unknown jitter mode: {jitter}")
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             last_exception = None
-            current_delay = delay
             
             for attempt in range(max_retries + 1):  # +1 for initial attempt
                 try:
@@ -56,8 +101,7 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float =
                         logging.warning(
                             f"{func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}): {e}"
                         )
-                        time.sleep(current_delay)
-                        current_delay *= backoff
+                        time.sleep(_backoff_delay(delay, backoff, attempt, max_delay, jitter))
                     else:
                         logging.error(
                             f"{func.__name__} failed after {max_retries + 1} attempts: {e}"
@@ -83,20 +127,53 @@ def log_execution_time(logger: logging.Logger = None):
         
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                execution_time = time.time() - start_time
-                logger.debug(f"{func.__name__} executed in {execution_time:.3f}s")
+                logger.debug("%s executed in %.3fms", func.__name__, (time.perf_counter_ns() - start_ns) / 1e6)
                 return result
             except Exception as e:
-                execution_time = time.time() - start_time
-                logger.debug(f"{func.__name__} failed after {execution_time:.3f}s: {e}")
+                logger.debug("%s failed after %.3fms: %s", func.__name__,
+                             (time.perf_counter_ns() - start_ns) / 1e6, e)
                 raise
         
         return wrapper
     return decorator
 
+def _compile_path(field: str) -> Callable[[Any], Any]:
+    """
+    Precompile a dot-notation field path into an accessor function
+    
+    Lists descend into their first item. The accessor raises KeyError,
+    IndexError or TypeError when the path is missing.
+    """
+    parts = tuple(field.split('.'))
+    getters = tuple(map(itemgetter, parts))
+    
+    def walk(data: Any) -> Any:
+        current = data
+        for part in parts:
+            if isinstance(current, dict):
+                current = current[part]
+            elif isinstance(current, list) and current:
+                current = current[0][part]  # Check first item in list
+            else:
+                raise KeyError(part)
+        return current
+    
+    def access(data: Any) -> Any:
+        # Fast path: plain nested dicts resolve through C-level itemgetters;
+        # anything else (lists, wrong types, missing keys) takes the checked walk
+        try:
+            current = data
+            for get in getters:
+                current = get(current)
+            return current
+        except (KeyError, IndexError, TypeError):
+            return walk(data)
+    
+    return access
+
 def validate_api_response(required_fields: list = None):
     """
     Decorator to validate API response data
@@ -104,6 +181,9 @@ def validate_api_response(required_fields: list = None):
     Args:
         required_fields: List of required fields in the response
     """
+    # Field paths are fixed at decoration time, so split them once here
+    accessors = [(field, _compile_path(field)) for field in required_fields or ()]
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
@@ -114,21 +194,11 @@ def validate_api_response(required_fields: list = None):
                 return result
             
             # Validate required fields if specified
-            if required_fields and isinstance(result, dict):
+            if accessors and isinstance(result, dict):
                 missing_fields = []
-                for field in required_fields:
-                    # Support nested field checking with dot notation
-                    current = result
-                    field_parts = field.split('.')
-                    
+                for field, access in accessors:
                     try:
-                        for part in field_parts:
-                            if isinstance(current, dict):
-                                current = current[part]
-                            elif isinstance(current, list) and current:
-                                current = current[0][part]  # Check first item in list
-                            else:
-                                raise KeyError(part)
+                        access(result)
                     except (KeyError, IndexError, TypeError):
                         missing_fields.append(field)
                 
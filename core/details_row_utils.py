@@ -1,5 +1,25 @@
 """Utility functions for updating the weather details row using ttkbootstrap."""
 
+
+def _fmt(value, suffix):
+    """Format a parsed value with its unit suffix, using N/A for missing values."""
+    if value is None or value == "N/A":
+        return f"N/A{suffix}"
+    return f"{value}{suffix}"
+
+
+def set_label_text(label, text):
+    """
+    Configure the label text only when it differs from what it currently shows.
+    Compares against the live widget text, so writes made elsewhere are respected.
+    Args:
+        label: Label widget to update
+        text: New text for the label
+    """
+    if str(label.cget("text")) != text:
+        label.config(text=text)
+
+
 def update_weather_details_row(humidity_label, pressure_label, wind_label, parsed):
     """
     Update the details row labels for humidity, pressure, and wind.
@@ -9,14 +29,8 @@ def update_weather_details_row(humidity_label, pressure_label, wind_label, parse
         wind_label: Label widget for wind
         parsed: dict from parse_weather_data (should include 'wind_unit_label')
     """
-    humidity_display = f"{parsed['humidity']}%" if parsed['humidity'] != "N/A" and parsed['humidity'] is not None else "N/A%"
-    humidity_label.config(text=f"💧 Humidity: {humidity_display}")
-
-    pressure_display = f"{parsed['pressure']} hPa" if parsed['pressure'] != "N/A" and parsed['pressure'] is not None else "N/A hPa"
-    pressure_label.config(text=f"🌡️ Pressure: {pressure_display}")
+    wind_suffix = " " + parsed.get('wind_unit_label', 'mph')
 
-    if parsed['wind_speed'] != "N/A" and parsed['wind_speed'] is not None:
-        wind_display = f"{parsed['wind_speed']} {parsed.get('wind_unit_label', 'mph')}"
-    else:
-        wind_display = f"N/A {parsed.get('wind_unit_label', 'mph')}"
-    wind_label.config(text=f"🌬️ Wind: {wind_display}")
+    set_label_text(humidity_label, f"💧 Humidity: {_fmt(parsed['humidity'], '%')}")
+    set_label_text(pressure_label, f"🌡️ Pressure: {_fmt(parsed['pressure'], ' hPa')}")
+    set_label_text(wind_label, f"🌬️ Wind: {_fmt(parsed['wind_speed'], wind_suffix)}")
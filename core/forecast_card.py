@@ -1,8 +1,142 @@
 """
-Reusable function to create a forecast card (Tkinter/Ttkbootstrap).
+Reusable forecast card (Tkinter/Ttkbootstrap).
 Call from both forecast and saved cities components for deduplication.
 """
-def create_forecast_card_tk(parent, day_data, index, icon_manager, style='main', unit_label="°F"):
+import time
+import tkinter as tk
+
+from core.details_row_utils import set_label_text
+
+try:
+    import ttkbootstrap as tb
+    Frame = tb.Frame
+    Label = tb.Label
+except ImportError:
+    Frame = tk.Frame
+    Label = tk.Label
+
+# tm_wday index -> abbreviated day name, avoiding a locale-aware strftime per card
+_WEEKDAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# Card fonts, resolved once per style instead of rebuilt for every card
+_FONT_FAMILY = "Helvetica Neue"
+_FONT_DAY = {'main': (_FONT_FAMILY, 12, "bold"), 'mini': (_FONT_FAMILY, 9, "bold")}
+_FONT_ICON = {'main': (_FONT_FAMILY, 28), 'mini': (_FONT_FAMILY, 16)}
+_FONT_TEMP_HIGH = (_FONT_FAMILY, 14, "bold")
+_FONT_TEMP_LOW = (_FONT_FAMILY, 12)
+_FONT_TEMP_MINI = (_FONT_FAMILY, 9)
+_FONT_DESCRIPTION = (_FONT_FAMILY, 9)
+_FONT_POP = (_FONT_FAMILY, 8)
+
+def _day_text(day_data, index):
+    """Return the card heading for the given forecast day."""
+    if index == 0:
+        return "Tomorrow"  # First forecast day is tomorrow (today is excluded)
+    try:
+        return _WEEKDAY_NAMES[time.localtime(day_data.get('dt') or 0).tm_wday]
+    except (TypeError, ValueError, OverflowError, OSError):
+        return f"Day {index + 1}"
+
+
+def precompute_day_labels(day_datas):
+    """
+    Compute the card headings for a whole render pass at once.
+    Args:
+        day_datas: sequence of day dicts, in display order
+    Returns:
+        list of heading strings, one per day
+    """
+    return [_day_text(day_data, index) for index, day_data in enumerate(day_datas)]
+
+
+class ForecastCard:
+    """
+    Forecast card whose widgets are created once and updated in place.
+    Refreshing a card only reconfigures label text, avoiding Tk widget churn.
+    """
+
+    def __init__(self, parent, style='main'):
+        """
+        Build the card widgets without any data.
+        Args:
+            parent: parent frame
+            style: 'main' (large) or 'mini' (compact)
+        """
+        self.style = style
+        is_main = style == 'main'
+        size = 'main' if is_main else 'mini'
+
+        # Card frame with uniform sizing
+        if is_main:
+            self.frame = Frame(parent, relief="raised", borderwidth=2)
+            # Set uniform width and height for all cards
+            self.frame.configure(width=130, height=180)
+            self.frame.pack_propagate(False)  # Prevent internal widgets from changing size
+            self.frame.grid_propagate(False)  # Prevent grid from changing size
+        else:
+            self.frame = Frame(parent)
+
+        self.day_label = Label(self.frame, font=_FONT_DAY[size], anchor="center")
+        self.day_label.pack(pady=(5, 5) if is_main else 0)
+
+        self.icon_label = Label(self.frame, font=_FONT_ICON[size], anchor="center")
+        self.icon_label.pack(pady=5 if is_main else 0)
+
+        if is_main:
+            self.high_label = Label(self.frame, font=_FONT_TEMP_HIGH)
+            self.high_label.pack()
+            self.low_label = Label(self.frame, font=_FONT_TEMP_LOW)
+            self.low_label.pack()
+            self.description_label = Label(self.frame, font=_FONT_DESCRIPTION, wraplength=120, justify="center")
+            self.description_label.pack(pady=(5, 0))
+            self.pop_label = Label(self.frame, font=_FONT_POP)
+        else:
+            self.temp_label = Label(self.frame, font=_FONT_TEMP_MINI, anchor="center")
+            self.temp_label.pack()
+            self.pop_label = Label(self.frame, font=_FONT_POP, anchor="center")
+        self._pop_visible = False
+
+    def update(self, day_data, index, icon_manager, unit_label="°F", day_text=None):
+        """
+        Show a day's forecast on the existing widgets.
+        Args:
+            day_data: dict with weather info
+            index: int, day index (0=Tomorrow, 1=Day after tomorrow, etc.)
+            icon_manager: instance for weather icons
+            unit_label: str, e.g. '°F'
+            day_text: optional heading from precompute_day_labels
+        """
+        is_main = self.style == 'main'
+        description = day_data.get('description', 'Clear')
+
+        if day_text is None:
+            day_text = _day_text(day_data, index)
+        set_label_text(self.day_label, day_text)
+        set_label_text(self.icon_label, icon_manager.get_weather_icon(description))
+
+        # Temperature
+        temp_min = day_data.get('temp_min', 0)
+        temp_max = day_data.get('temp_max', 0)
+        if is_main:
+            set_label_text(self.high_label, f"{int(temp_max)}{unit_label}")
+            set_label_text(self.low_label, f"{int(temp_min)}{unit_label}")
+            set_label_text(self.description_label, day_data.get('description', ''))
+        else:
+            set_label_text(self.temp_label, f"{int(temp_max)}{unit_label}/{int(temp_min)}{unit_label}")
+
+        # Precipitation probability, shown last and only when notable
+        pop = day_data.get('pop')
+        show_pop = pop is not None and pop > (0 if is_main else 0.2)
+        if show_pop:
+            set_label_text(self.pop_label, f"\U0001F4A7 {int(pop * 100)}%")  # 💧
+            if not self._pop_visible:
+                self.pop_label.pack(pady=(5, 5) if is_main else 0)
+        elif self._pop_visible:
+            self.pop_label.pack_forget()
+        self._pop_visible = show_pop
+
+
+def create_forecast_card_tk(parent, day_data, index, icon_manager, style='main', unit_label="°F", day_text=None):
     """
     Create a forecast card frame for a given day's data.
     Args:
@@ -12,74 +146,13 @@ def create_forecast_card_tk(parent, day_data, index, icon_manager, style='main',
         icon_manager: instance for weather icons
         style: 'main' (large) or 'mini' (compact)
         unit_label: str, e.g. '°F'
+        day_text: optional heading from precompute_day_labels
     Returns:
         card_frame: the created Frame
     """
-    import tkinter as tk
-    try:
-        import ttkbootstrap as tb
-        Frame = tb.Frame
-        Label = tb.Label
-    except ImportError:
-        Frame = tk.Frame
-        Label = tk.Label
-    from datetime import datetime
-
-    # Card frame with uniform sizing
-    if style == 'main':
-        card_frame = Frame(parent, relief="raised", borderwidth=2)
-        # Set uniform width and height for all cards
-        card_frame.configure(width=130, height=180)
-        card_frame.pack_propagate(False)  # Prevent internal widgets from changing size
-        card_frame.grid_propagate(False)  # Prevent grid from changing size
-    else:
-        card_frame = Frame(parent)
-
-    # Day label
-    try:
-        dt = datetime.fromtimestamp(day_data.get('dt', 0))
-        if index == 0:
-            day_text = "Tomorrow"  # First forecast day is tomorrow (today is excluded)
-        elif index == 1:
-            day_text = dt.strftime("%a")  # Day after tomorrow shows day name
-        else:
-            day_text = dt.strftime("%a")
-    except:
-        day_text = f"Day {index + 1}"
-
-    font_main = ("Helvetica Neue", 12, "bold") if style == 'main' else ("Helvetica Neue", 9, "bold")
-    Label(card_frame, text=day_text, font=font_main, anchor="center").pack(pady=(5, 5) if style=='main' else 0)
-
-    # Weather icon
-    weather_description = day_data.get('description', 'Clear')
-    weather_icon = icon_manager.get_weather_icon(weather_description)
-    font_icon = ("Helvetica Neue", 28) if style == 'main' else ("Helvetica Neue", 16)
-    Label(card_frame, text=weather_icon, font=font_icon, anchor="center").pack(pady=5 if style=='main' else 0)
-
-    # Temperature
-    temp_min = day_data.get('temp_min', 0)
-    temp_max = day_data.get('temp_max', 0)
-    if style == 'main':
-        Label(card_frame, text=f"{int(temp_max)}{unit_label}", font=("Helvetica Neue", 14, "bold")).pack()
-        Label(card_frame, text=f"{int(temp_min)}{unit_label}", font=("Helvetica Neue", 12)).pack()
-    else:
-        Label(card_frame, text=f"{int(temp_max)}{unit_label}/{int(temp_min)}{unit_label}", font=("Helvetica Neue", 9), anchor="center").pack()
-
-    # Description
-    desc_label = day_data.get('description', '')
-    if style == 'main':
-        Label(card_frame, text=desc_label, font=("Helvetica Neue", 9), wraplength=120, justify="center").pack(pady=(5, 0))
-
-    # Precipitation probability
-    pop = day_data.get('pop')
-    if pop is not None:
-        if (style == 'main' and pop > 0) or (style == 'mini' and pop > 0.2):
-            pop_text = f"\U0001F4A7 {int(pop * 100)}%"  # 💧
-            if style == 'main':
-                Label(card_frame, text=pop_text, font=("Helvetica Neue", 8)).pack(pady=(5, 5))
-            else:
-                Label(card_frame, text=pop_text, font=("Helvetica Neue", 8), anchor="center").pack()
+    card = ForecastCard(parent, style=style)
+    card.update(day_data, index, icon_manager, unit_label, day_text=day_text)
 
     # Return the card frame without packing it
     # Let the parent component handle the layout
-    return card_frame
+    return card.frame
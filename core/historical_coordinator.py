@@ -1,19 +1,28 @@
 """Coordinator for historical weather data operations"""
 
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
+import pandas as pd
+from .decorators import TokenBucket
 from .open_meteo_historical import OpenMeteoHistorical
 from .db_data_handler import DatabaseDataHandler
 
 logger = logging.getLogger(__name__)
 
+# Locations sent in one multi-coordinate archive request, and the request budget batches share
+_BATCH_LOCATIONS_PER_REQUEST = 10
+_BATCH_BURST = 4
+_BATCH_REQUESTS_PER_SECOND = 2.0
+
 class HistoricalDataCoordinator:
     """Coordinates fetching, validating, and storing historical weather data"""
     
     def __init__(self):
         self.api_client = OpenMeteoHistorical()
         self.data_handler = DatabaseDataHandler()
+        self._request_bucket = TokenBucket(capacity=_BATCH_BURST, refill_rate=_BATCH_REQUESTS_PER_SECOND)
         
     def fetch_and_store_historical_data(
         self,
@@ -36,13 +45,69 @@ class HistoricalDataCoordinator:
         Returns:
             Tuple of (success status, error message if any)
         """
-        try:
-            # Fetch data from API (start_date and end_date are handled internally)
-            historical_df, error = self.api_client.get_historical_data(
-                latitude=latitude,
-                longitude=longitude
-            )
+        return self._fetch_and_store(city, state, latitude, longitude)
+    
+    def fetch_and_store_historical_data_batch(self, locations: List[Dict]) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Fetch and store historical data for many locations
+        
+        Locations go to the archive API as multi-coordinate requests, so N
+        cities cost one round trip per chunk; requests are paced by a token
+        bucket so bursts don't exceed the archive API's rate limits.
+        
+        Args:
+            locations: Dicts with 'city', 'state', 'latitude' and 'longitude' keys
             
+        Returns:
+            List of (success status, error message if any), in the order of locations
+        """
+        if not locations:
+            return []
+        
+        results = []
+        for start in range(0, len(locations), _BATCH_LOCATIONS_PER_REQUEST):
+            chunk = locations[start:start + _BATCH_LOCATIONS_PER_REQUEST]
+            
+            wait = self._request_bucket.acquire()
+            if wait > 0:
+                time.sleep(wait)
+            
+            fetched = self.api_client.get_historical_data_batch(
+                [(location['latitude'], location['longitude']) for location in chunk]
+            )
+            for location, (historical_df, error) in zip(chunk, fetched):
+                results.append(self._clean_and_store(
+                    location['city'],
+                    location.get('state'),
+                    historical_df,
+                    error,
+                ))
+        return results
+    
+    def _fetch_and_store(
+        self,
+        city: str,
+        state: str,
+        latitude: float,
+        longitude: float
+    ) -> Tuple[bool, Optional[str]]:
+        """Fetch, clean and store historical data for one location"""
+        # Fetch data from API (start_date and end_date are handled internally)
+        historical_df, error = self.api_client.get_historical_data(
+            latitude=latitude,
+            longitude=longitude
+        )
+        return self._clean_and_store(city, state, historical_df, error)
+    
+    def _clean_and_store(
+        self,
+        city: str,
+        state: str,
+        historical_df: Optional[pd.DataFrame],
+        error: Optional[str]
+    ) -> Tuple[bool, Optional[str]]:
+        """Clean and store one location's fetched DataFrame, or pass its fetch error on"""
+        try:
             if error:
                 return False, error
                 
@@ -50,12 +115,13 @@ class HistoricalDataCoordinator:
                 return False, "No data received from API"
             
             # Clean and validate the data
+            historical_df = self._vectorized_clean(historical_df)
             cleaned_df = self.api_client.clean_historical_data(historical_df)
             if cleaned_df is None:
                 return False, "Failed to clean historical data"
             
-            # Store in database
-            if not self.data_handler.save_historical_data(city, state, cleaned_df):
+            # Store in database as one bulk insert
+            if not self.data_handler.save_historical_data_bulk(city, state, cleaned_df):
                 return False, "Failed to save historical data to database"
             
             return True, None
@@ -65,6 +131,23 @@ class HistoricalDataCoordinator:
             logger.error(error_msg)
             return False, error_msg
             
+    @staticmethod
+    def _vectorized_clean(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop days with missing measurements in one vectorized pass
+        
+        The archive API returns NaN for days it has not finalized yet, which
+        would otherwise break the integer casts in clean_historical_data.
+        
+        Args:
+            df: Raw DataFrame from the API
+            
+        Returns:
+            DataFrame containing only fully populated days
+        """
+        numeric_cols = df.select_dtypes('number').columns
+        return df.dropna(subset=numeric_cols, how='any').reset_index(drop=True)
+    
     def get_historical_data(
         self,
         city: str,
@@ -0,0 +1,94 @@
+"""
+Utility for creating pooled HTTP sessions shared by the API clients.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:  # Optional: sessions go uncached without it
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to requests' stdlib decoder
+    orjson = None
+
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 10
+
+# Default lifetime of cached GET responses, in seconds
+_CACHE_EXPIRE_SECONDS = 600
+
+# Transient failures are retried quickly at the transport level
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.2
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Seconds allowed to establish a connection; the rest of a budget goes to reads
+_CONNECT_TIMEOUT = 3
+
+
+def split_timeout(total):
+    """
+    Split a total timeout budget into a (connect, read) tuple for requests.
+    Connection stalls fail fast while reads keep most of the budget.
+    Args:
+        total: overall timeout in seconds
+    Returns:
+        tuple: (connect timeout, read timeout)
+    """
+    connect = min(_CONNECT_TIMEOUT, total)
+    return (connect, total - connect or total)
+
+
+def create_session(cache_name=None, urls_expire_after=None):
+    """
+    Create a requests.Session with a keep-alive connection pool.
+    Reusing one session per client skips the TCP/TLS handshake on repeat calls,
+    and idempotent GETs are retried with backoff on connection errors and 429/5xx.
+    Args:
+        cache_name: optional SQLite cache path; when given and requests_cache is
+            installed, GET responses are cached like OpenMeteoHistorical's session
+        urls_expire_after: optional {url pattern: seconds} cache lifetimes
+    Returns:
+        requests.Session: session with pooled adapters mounted for http and https
+    """
+    if cache_name and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            cache_name,
+            backend='sqlite',
+            expire_after=_CACHE_EXPIRE_SECONDS,
+            urls_expire_after=urls_expire_after,
+            allowable_methods=('GET',)
+        )
+    else:
+        session = requests.Session()
+    retry = Retry(
+        total=_RETRY_TOTAL,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=('GET',),
+        raise_on_status=False  # Hand the final error response back to the caller
+    )
+    adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def parse_json(response):
+    """
+    Decode a response body as JSON, using orjson when it is installed.
+    Args:
+        response: requests.Response to decode
+    Returns:
+        The decoded JSON document
+    Raises:
+        ValueError: if the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
@@ -1,25 +1,105 @@
 """Icon and image management system for the weather dashboard"""
 
 import os
+import re
+import hashlib
+import threading
 import tkinter as tk
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 from PIL import Image, ImageTk
 import ttkbootstrap as tb
 
 logger = logging.getLogger(__name__)
 
+# Description keywords per icon_map key, highest priority first
+# ("few clouds" must win over the plain "cloud" keyword, rain over thunder, ...)
+_WEATHER_KEYWORDS = (
+    ("sunny", ("clear",)),
+    ("partly_cloudy", ("few clouds", "partly")),
+    ("cloudy", ("cloud", "overcast")),
+    ("windy", ("wind",)),
+    ("rainy", ("rain", "drizzle", "shower")),
+    ("thunderstorm", ("thunder", "storm")),
+    ("snowy", ("snow", "sleet")),
+    ("fog", ("mist", "fog")),
+)
+_WEATHER_PRIORITY = {key: rank for rank, (key, _) in enumerate(_WEATHER_KEYWORDS)}
+
+# One alternation with a named group per icon key, so a description is scanned once
+_WEATHER_RE = re.compile("|".join(
+    f"(?P<{key}>{'|'.join(map(re.escape, words))})" for key, words in _WEATHER_KEYWORDS
+))
+
+@lru_cache(maxsize=256)
+def _classify_weather(description: str) -> str:
+    """Map a weather description to an icon_map key"""
+    # Lower-casing happens inside the cache, so repeat descriptions skip it
+    desc_lower = description.lower()
+    best = None
+    for match in _WEATHER_RE.finditer(desc_lower):
+        key = match.lastgroup
+        if best is None or _WEATHER_PRIORITY[key] < _WEATHER_PRIORITY[best]:
+            best = key
+    return best or "partly_cloudy"
+
+# Supported file extensions, in lookup priority order
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp')
+_ICON_EXTENSIONS = ('.png', '.svg', '.ico', '.jpg', '.jpeg')
+
+_RESIZE_REDUCING_GAP = 2.0
+
+_IMAGE_CACHE_SIZE = 64
+_ICON_CACHE_SIZE = 128
+
+class _LRUCache(OrderedDict):
+    """Dict-compatible cache that evicts the least recently used entry past maxsize"""
+    
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self[key]
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
 class IconManager:
     """Centralized icon and image management system"""
     
-    def __init__(self, assets_path: str = "assets"):
+    __slots__ = (
+        'assets_path', 'icons_path', 'images_path', '_disk_cache_dir',
+        '_image_cache', '_icon_cache', '_image_index', '_icon_index',
+        'icon_map', '_emoji_get',
+    )
+    
+    def __init__(self, assets_path: str = "assets", disk_cache_dir: Optional[str] = None):
         self.assets_path = assets_path
         self.icons_path = os.path.join(assets_path, "icons")
         self.images_path = os.path.join(assets_path, "images")
         
-        # Cache for loaded images to avoid reloading
-        self._image_cache: Dict[str, ImageTk.PhotoImage] = {}
-        self._icon_cache: Dict[str, ImageTk.PhotoImage] = {}
+        # Resized images persisted across runs so cold starts skip decode + LANCZOS
+        self._disk_cache_dir = disk_cache_dir or os.path.join(
+            os.path.expanduser("~"), ".cache", "weather-dashboard", "icons"
+        )
+        
+        # Bounded caches for loaded images; widgets keep their own reference to
+        # a displayed PhotoImage, so eviction only costs a rebuild on next load
+        self._image_cache: Dict[str, ImageTk.PhotoImage] = _LRUCache(_IMAGE_CACHE_SIZE)
+        self._icon_cache: Dict[str, ImageTk.PhotoImage] = _LRUCache(_ICON_CACHE_SIZE)
         
         # Ensure directories exist
         self._ensure_directories()
@@ -34,6 +114,7 @@ class IconManager:
             "partly_cloudy": "🌤️",
             "thunderstorm": "⛈️",
             "windy": "🌬️",
+            "fog": "🌫️",
             "temperature": "🌡️",
             
             # UI icons
@@ -68,11 +149,38 @@ class IconManager:
             "wind": "🌬️",
             "visibility": "👁️"
         }
+        self._emoji_get = self.icon_map.get  # Bound once for the get_emoji_icon hot path
     
     def _ensure_directories(self) -> None:
         """Create asset directories if they don't exist"""
         os.makedirs(self.icons_path, exist_ok=True)
         os.makedirs(self.images_path, exist_ok=True)
+        self.refresh_index()
+    
+    @staticmethod
+    def _scan_directory(path: str, extensions: Tuple[str, ...]) -> Dict[str, str]:
+        """
+        Index a directory's files by stem, preferring earlier extensions
+        
+        Args:
+            path: Directory to scan
+            extensions: Allowed extensions in priority order
+            
+        Returns:
+            Dictionary mapping file stem to full path
+        """
+        candidates = {}
+        with os.scandir(path) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext in extensions and entry.is_file():
+                    candidates.setdefault(stem, []).append((extensions.index(ext), entry.path))
+        return {stem: min(found)[1] for stem, found in candidates.items()}
+    
+    def refresh_index(self) -> None:
+        """Rescan the asset directories, e.g. after files are added at runtime"""
+        self._image_index = self._scan_directory(self.images_path, _IMAGE_EXTENSIONS)
+        self._icon_index = self._scan_directory(self.icons_path, _ICON_EXTENSIONS)
     
     def get_emoji_icon(self, icon_name: str) -> str:
         """
@@ -84,7 +192,42 @@ class IconManager:
         Returns:
             Emoji character or default if not found
         """
-        return self.icon_map.get(icon_name, "❓")
+        return self._emoji_get(icon_name, "❓")
+    
+    def _open_resized(self, source_path: str, size: Optional[Tuple[int, int]]) -> Image.Image:
+        """
+        Open an image resized to size, reusing a previously resized copy from disk
+        
+        Args:
+            source_path: Path of the original image file
+            size: Optional tuple of (width, height); None returns the original
+            
+        Returns:
+            PIL Image
+        """
+        if not size:
+            return Image.open(source_path)
+        
+        # Source mtime is part of the key so edited assets are re-rendered
+        key_source = f"{os.path.abspath(source_path)}|{os.path.getmtime(source_path)}|{size}"
+        key = hashlib.sha1(key_source.encode("utf-8")).hexdigest()[:16]
+        cached_path = os.path.join(self._disk_cache_dir, f"{key}.png")
+        
+        if os.path.exists(cached_path):
+            try:
+                return Image.open(cached_path)
+            except OSError as e:
+                logger.debug("Ignoring unreadable cached image %s: %s", cached_path, e)
+        
+        # reducing_gap lets Pillow box-reduce large sources by an integer factor
+        # first, so LANCZOS only runs over an image within 2x of the target
+        img = Image.open(source_path).resize(size, Image.Resampling.LANCZOS, reducing_gap=_RESIZE_REDUCING_GAP)
+        try:
+            os.makedirs(self._disk_cache_dir, exist_ok=True)
+            img.save(cached_path, format="PNG")
+        except OSError as e:
+            logger.debug("Could not write image cache %s: %s", cached_path, e)
+        return img
     
     def load_image(self, image_name: str, size: Optional[Tuple[int, int]] = None) -> Optional[ImageTk.PhotoImage]:
         """
@@ -100,18 +243,11 @@ class IconManager:
         cache_key = f"{image_name}_{size}" if size else image_name
         
         # Check cache first
-        if cache_key in self._image_cache:
-            return self._image_cache[cache_key]
+        cached = self._image_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Try different extensions
-        extensions = ['.png', '.jpg', '.jpeg', '.gif', '.bmp']
-        image_path = None
-        
-        for ext in extensions:
-            potential_path = os.path.join(self.images_path, f"{image_name}{ext}")
-            if os.path.exists(potential_path):
-                image_path = potential_path
-                break
+        image_path = self._image_index.get(image_name)
         
         if not image_path:
             logger.warning("Image not found: %s", image_name)
@@ -119,9 +255,7 @@ class IconManager:
         
         try:
             # Load and optionally resize image
-            img = Image.open(image_path)
-            if size:
-                img = img.resize(size, Image.Resampling.LANCZOS)
+            img = self._open_resized(image_path, size)
             
             # Convert to PhotoImage
             photo_img = ImageTk.PhotoImage(img)
@@ -149,18 +283,11 @@ class IconManager:
         cache_key = f"icon_{icon_name}_{size}"
         
         # Check cache first
-        if cache_key in self._icon_cache:
-            return self._icon_cache[cache_key]
-        
-        # Try different extensions
-        extensions = ['.png', '.svg', '.ico', '.jpg', '.jpeg']
-        icon_path = None
+        cached = self._icon_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        for ext in extensions:
-            potential_path = os.path.join(self.icons_path, f"{icon_name}{ext}")
-            if os.path.exists(potential_path):
-                icon_path = potential_path
-                break
+        icon_path = self._icon_index.get(icon_name)
         
         if not icon_path:
             logger.warning("Icon not found: %s", icon_name)
@@ -168,8 +295,7 @@ class IconManager:
         
         try:
             # Load and resize icon
-            img = Image.open(icon_path)
-            img = img.resize(size, Image.Resampling.LANCZOS)
+            img = self._open_resized(icon_path, size)
             
             # Convert to PhotoImage
             photo_img = ImageTk.PhotoImage(img)
@@ -227,32 +353,14 @@ class IconManager:
         Returns:
             Icon (emoji for now, could be file path later)
         """
-        d = description.lower()
-        
-        # Map weather descriptions to icon names
-        if "clear" in d or "sky is clear" in d:
-            return self.get_emoji_icon("sunny")
-        elif "few clouds" in d or "partly" in d:
-            return self.get_emoji_icon("partly_cloudy")
-        elif "scattered clouds" in d or "broken clouds" in d or "cloud" in d or "overcast" in d:
-            return self.get_emoji_icon("cloudy")
-        elif "wind" in d:
-            return self.get_emoji_icon("windy")
-        elif "rain" in d or "drizzle" in d or "shower" in d:
-            return self.get_emoji_icon("rainy")
-        elif "thunder" in d or "storm" in d:
-            return self.get_emoji_icon("thunderstorm")
-        elif "snow" in d or "sleet" in d:
-            return self.get_emoji_icon("snowy")
-        elif "mist" in d or "fog" in d:
-            return "🌫️"
-        else:
-            return self.get_emoji_icon("partly_cloudy")
+        # Classification is memoized; the emoji lookup stays live so custom icons apply
+        return self.get_emoji_icon(_classify_weather(description))
     
     def clear_cache(self) -> None:
         """Clear the image cache to free memory"""
         self._image_cache.clear()
         self._icon_cache.clear()
+        _classify_weather.cache_clear()
     
     def add_custom_icon(self, name: str, emoji: str) -> None:
         """
@@ -263,21 +371,30 @@ class IconManager:
             emoji: Emoji character
         """
         self.icon_map[name] = emoji
+        self._emoji_get = self.icon_map.get
 
 # Global icon manager instance
 _icon_manager = None
+_icon_manager_lock = threading.Lock()
+_get_emoji_icon = None  # Bound get_emoji_icon of the global manager, resolved on first use
 
 def get_icon_manager() -> IconManager:
     """Get the global icon manager instance"""
     global _icon_manager
     if _icon_manager is None:
-        _icon_manager = IconManager()
+        # Double-checked so concurrent first calls don't each scan the asset dirs
+        with _icon_manager_lock:
+            if _icon_manager is None:
+                _icon_manager = IconManager()
     return _icon_manager
 
 # Convenience functions
 def get_icon(icon_name: str) -> str:
     """Get emoji icon by name"""
-    return get_icon_manager().get_emoji_icon(icon_name)
+    global _get_emoji_icon
+    if _get_emoji_icon is None:
+        _get_emoji_icon = get_icon_manager().get_emoji_icon
+    return _get_emoji_icon(icon_name)
 
 def get_weather_icon(description: str) -> str:
     """Get weather icon by description"""
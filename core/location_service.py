@@ -2,14 +2,102 @@
 
 import requests
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple, Dict
 import json
+import math
 import os
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from core.http_utils import create_session, parse_json, split_timeout
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# fromisoformat accepts a trailing 'Z' natively from Python 3.11
+_ISO_Z_SUPPORTED = sys.version_info >= (3, 11)
+
+# (connect, read) timeout for the location and sunrise APIs
+_REQUEST_TIMEOUT = split_timeout(10)
+
+# Days of past sunrise/sunset entries kept when the sun cache is rewritten
+_SUN_CACHE_KEEP_DAYS = 2
+
+
+# Julian day of the J2000.0 epoch (2000-01-01 12:00 UTC) and its proleptic ordinal
+_J2000 = 2451545.0
+_J2000_ORDINAL = 730120
+_J2000_UTC = datetime(2000, 1, 1, 12, tzinfo=timezone.utc)
+
+# Sun's apparent altitude at rise/set: refraction plus the solar disc radius
+_SUNRISE_ALTITUDE = math.radians(-0.833)
+_EARTH_OBLIQUITY = math.radians(23.4397)
+
+
+def _solar_times_utc(latitude: float, longitude: float, date: datetime) -> Optional[Tuple[datetime, datetime]]:
+    """
+    Compute sunrise and sunset for a day with the NOAA sunrise equation
+    
+    Accurate to about a minute away from the poles, which is plenty for
+    choosing a day or night theme.
+    
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees (east positive)
+        date: Local calendar day to compute
+        
+    Returns:
+        (sunrise, sunset) as aware UTC datetimes, or None during polar day/night
+    """
+    # Mean solar noon, in days since J2000
+    mean_noon = date.toordinal() - _J2000_ORDINAL - longitude / 360.0
+    
+    anomaly = math.radians((357.5291 + 0.98560028 * mean_noon) % 360.0)
+    center = 1.9148 * math.sin(anomaly) + 0.0200 * math.sin(2 * anomaly) + 0.0003 * math.sin(3 * anomaly)
+    ecliptic_longitude = math.radians((math.degrees(anomaly) + center + 180.0 + 102.9372) % 360.0)
+    transit = mean_noon + 0.0053 * math.sin(anomaly) - 0.0069 * math.sin(2 * ecliptic_longitude)
+    
+    sin_declination = math.sin(ecliptic_longitude) * math.sin(_EARTH_OBLIQUITY)
+    cos_declination = math.cos(math.asin(sin_declination))
+    phi = math.radians(latitude)
+    cos_hour_angle = ((math.sin(_SUNRISE_ALTITUDE) - math.sin(phi) * sin_declination)
+                      / (math.cos(phi) * cos_declination))
+    if not -1.0 <= cos_hour_angle <= 1.0:
+        return None
+    
+    half_day = math.degrees(math.acos(cos_hour_angle)) / 360.0
+    return (_J2000_UTC + timedelta(days=transit - half_day),
+            _J2000_UTC + timedelta(days=transit + half_day))
+
+
+def _read_json(path: str):
+    """Read a JSON file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _write_json(path: str, data) -> None:
+    """Write data as compact JSON, using orjson when it is installed"""
+    # These files are machine-read caches, so skip pretty-printing
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+
+# Background lookups run here so callers on the UI thread never block on HTTP
+_lookup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="location-lookup")
+
 @dataclass
 class LocationInfo:
     """Container for location information"""
@@ -29,11 +117,20 @@ class SunTimes:
 class LocationService:
     """Service for getting user location and calculating sunrise/sunset times"""
     
-    def __init__(self, cache_file: str = "data/location_cache.json", cache_duration_hours: int = 24):
+    def __init__(self, cache_file: str = "data/location_cache.json", cache_duration_hours: int = 24,
+                 sun_cache_file: Optional[str] = None):
         self.cache_file = cache_file
         self.cache_duration_hours = cache_duration_hours
+        self.sun_cache_file = sun_cache_file or os.path.join(os.path.dirname(cache_file), "sun_cache.json")
+        self._sun_cache: Optional[Dict[str, Tuple[str, str]]] = None  # Loaded from disk on first use
+        # Uncached: location_cache.json and sun_cache.json already hold these answers
+        self._session = create_session()
         self._ensure_data_directory()
     
+    def close(self) -> None:
+        """Close the pooled HTTP session"""
+        self._session.close()
+    
     def _ensure_data_directory(self) -> None:
         """Create data directory if it doesn't exist"""
         data_dir = os.path.dirname(self.cache_file)
@@ -60,10 +157,10 @@ class LocationService:
         # Fetch fresh location data
         try:
             # Using ipapi.co as it's free and reliable
-            response = requests.get("https://ipapi.co/json/", timeout=10)
+            response = self._session.get("https://ipapi.co/json/", timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
+            data = parse_json(response)
             
             # Check if we got valid data
             if not all(key in data for key in ['latitude', 'longitude', 'city', 'country_name']):
@@ -104,43 +201,38 @@ class LocationService:
         """
         if date is None:
             date = datetime.now()
+        date_str = date.strftime('%Y-%m-%d')
         
         try:
-            # Using sunrise-sunset.org API (free, no key required)
-            url = "https://api.sunrise-sunset.org/json"
-            params = {
-                'lat': location.latitude,
-                'lng': location.longitude,
-                'formatted': 0,  # Get ISO format
-                'date': date.strftime('%Y-%m-%d')
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('status') != 'OK':
-                logger.error(f"Sunrise API error: {data}")
-                return None
-            
-            # Parse times
-            sunrise_str = data['results']['sunrise']
-            sunset_str = data['results']['sunset']
-            
-            sunrise = datetime.fromisoformat(sunrise_str.replace('Z', '+00:00'))
-            sunset = datetime.fromisoformat(sunset_str.replace('Z', '+00:00'))
+            # Closed-form calculation first; the API only covers polar day/night
+            solar_times = _solar_times_utc(location.latitude, location.longitude, date)
+            if solar_times is not None:
+                sunrise, sunset = solar_times
+            else:
+                api_times = self._fetch_sun_times(location, date_str)
+                if api_times is None:
+                    return None
+                
+                # Parse times
+                sunrise_str, sunset_str = api_times
+                if not _ISO_Z_SUPPORTED:
+                    sunrise_str = sunrise_str.replace('Z', '+00:00')
+                    sunset_str = sunset_str.replace('Z', '+00:00')
+                sunrise = datetime.fromisoformat(sunrise_str)
+                sunset = datetime.fromisoformat(sunset_str)
             
-            # Convert to local time (approximate - using system timezone)
-            now = datetime.now(timezone.utc)
-            local_offset = datetime.now() - datetime.utcnow()
+            # Convert to the location's own timezone (system timezone if unknown)
+            try:
+                tz = ZoneInfo(location.timezone_name)
+            except (ZoneInfoNotFoundError, ValueError):
+                tz = None
             
-            sunrise_local = sunrise + local_offset
-            sunset_local = sunset + local_offset
+            sunrise_local = sunrise.astimezone(tz)
+            sunset_local = sunset.astimezone(tz)
             
             # Determine if it's currently daytime
-            now_local = datetime.now()
-            is_daytime = sunrise_local.time() <= now_local.time() <= sunset_local.time()
+            now_local = datetime.now(timezone.utc).astimezone(tz)
+            is_daytime = sunrise_local <= now_local <= sunset_local
             
             sun_times = SunTimes(
                 sunrise=sunrise_local,
@@ -160,6 +252,46 @@ class LocationService:
             logger.error(f"Invalid sunrise/sunset data received: {e}")
             return None
     
+    def _fetch_sun_times(self, location: LocationInfo, date_str: str) -> Optional[Tuple[str, str]]:
+        """
+        Look up sunrise/sunset from sunrise-sunset.org, caching per place and day
+        
+        Args:
+            location: LocationInfo object with coordinates
+            date_str: Day to look up as YYYY-MM-DD
+            
+        Returns:
+            (sunrise, sunset) ISO strings in UTC, or None if the API reports an error
+        """
+        # Times only depend on place and day, so repeat lookups come from the cache
+        cache_key = f"{round(location.latitude, 3)}:{round(location.longitude, 3)}:{date_str}"
+        sun_cache = self._get_sun_cache()
+        cached = sun_cache.get(cache_key)
+        if cached:
+            return cached
+        
+        # Using sunrise-sunset.org API (free, no key required)
+        url = "https://api.sunrise-sunset.org/json"
+        params = {
+            'lat': location.latitude,
+            'lng': location.longitude,
+            'formatted': 0,  # Get ISO format
+            'date': date_str
+        }
+        
+        response = self._session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        
+        data = parse_json(response)
+        
+        if data.get('status') != 'OK':
+            logger.error(f"Sunrise API error: {data}")
+            return None
+        
+        sun_cache[cache_key] = (data['results']['sunrise'], data['results']['sunset'])
+        self._save_sun_cache()
+        return sun_cache[cache_key]
+    
     def is_daytime_now(self, location: Optional[LocationInfo] = None) -> Optional[bool]:
         """
         Determine if it's currently daytime at user's location
@@ -181,14 +313,28 @@ class LocationService:
         
         return sun_times.is_daytime
     
+    def is_daytime_now_async(self, location: Optional[LocationInfo] = None) -> Future:
+        """
+        Run is_daytime_now on a background thread
+        
+        The location and sunrise lookups depend on each other, so they stay
+        sequential; this only moves both round trips off the calling thread.
+        
+        Args:
+            location: LocationInfo object (fetched automatically if None)
+            
+        Returns:
+            Future resolving to True, False, or None like is_daytime_now
+        """
+        return _lookup_executor.submit(self.is_daytime_now, location)
+    
     def _load_cached_location(self) -> Optional[LocationInfo]:
         """Load cached location if valid"""
         if not os.path.exists(self.cache_file):
             return None
         
         try:
-            with open(self.cache_file, 'r') as f:
-                data = json.load(f)
+            data = _read_json(self.cache_file)
             
             # Check if cache is still valid
             cache_time = datetime.fromisoformat(data['cached_at'])
@@ -222,8 +368,31 @@ class LocationService:
                 'cached_at': datetime.now().isoformat()
             }
             
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            _write_json(self.cache_file, cache_data)
                 
         except Exception as e:
             logger.warning(f"Failed to cache location: {e}")
+    
+    def _get_sun_cache(self) -> Dict[str, Tuple[str, str]]:
+        """Return the sunrise/sunset cache, loading it from disk on first use"""
+        if self._sun_cache is None:
+            self._sun_cache = {}
+            if os.path.exists(self.sun_cache_file):
+                try:
+                    self._sun_cache = {key: tuple(value) for key, value in _read_json(self.sun_cache_file).items()}
+                except (json.JSONDecodeError, AttributeError, TypeError, ValueError) as e:
+                    logger.warning(f"Invalid sunrise/sunset cache: {e}")
+        return self._sun_cache
+    
+    def _save_sun_cache(self) -> None:
+        """Persist the sunrise/sunset cache, dropping days that have passed"""
+        oldest = (datetime.now() - timedelta(days=_SUN_CACHE_KEEP_DAYS)).strftime('%Y-%m-%d')
+        self._sun_cache = {
+            key: value for key, value in self._sun_cache.items()
+            if key.rsplit(':', 1)[-1] >= oldest
+        }
+        
+        try:
+            _write_json(self.sun_cache_file, self._sun_cache)
+        except Exception as e:
+            logger.warning(f"Failed to cache sunrise/sunset times: {e}")
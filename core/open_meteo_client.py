@@ -3,42 +3,75 @@
 import requests
 import logging
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Optional
+from core.http_utils import create_session, parse_json, split_timeout
+
+# OpenMeteo weather code mappings
+_WEATHER_CODES = {
+    0: {'main': 'Clear', 'description': 'Clear sky', 'icon': '01d'},
+    1: {'main': 'Partly Cloudy', 'description': 'Partly cloudy', 'icon': '02d'},
+    2: {'main': 'Cloudy', 'description': 'Cloudy', 'icon': '03d'},
+    3: {'main': 'Overcast', 'description': 'Overcast', 'icon': '04d'},
+    45: {'main': 'Foggy', 'description': 'Foggy', 'icon': '50d'},
+    48: {'main': 'Foggy', 'description': 'Depositing rime fog', 'icon': '50d'},
+    51: {'main': 'Drizzle', 'description': 'Light drizzle', 'icon': '09d'},
+    53: {'main': 'Drizzle', 'description': 'Moderate drizzle', 'icon': '09d'},
+    55: {'main': 'Drizzle', 'description': 'Heavy drizzle', 'icon': '09d'},
+    61: {'main': 'Rain', 'description': 'Light rain', 'icon': '10d'},
+    63: {'main': 'Rain', 'description': 'Moderate rain', 'icon': '10d'},
+    65: {'main': 'Rain', 'description': 'Heavy rain', 'icon': '10d'},
+    71: {'main': 'Snow', 'description': 'Light snow', 'icon': '13d'},
+    73: {'main': 'Snow', 'description': 'Moderate snow', 'icon': '13d'},
+    75: {'main': 'Snow', 'description': 'Heavy snow', 'icon': '13d'},
+    77: {'main': 'Snow', 'description': 'Snow grains', 'icon': '13d'},
+    80: {'main': 'Rain', 'description': 'Light rain showers', 'icon': '10d'},
+    81: {'main': 'Rain', 'description': 'Moderate rain showers', 'icon': '10d'},
+    82: {'main': 'Rain', 'description': 'Heavy rain showers', 'icon': '10d'},
+    85: {'main': 'Snow', 'description': 'Light snow showers', 'icon': '13d'},
+    86: {'main': 'Snow', 'description': 'Heavy snow showers', 'icon': '13d'},
+    95: {'main': 'Thunderstorm', 'description': 'Thunderstorm', 'icon': '11d'},
+    96: {'main': 'Thunderstorm', 'description': 'Thunderstorm with hail', 'icon': '11d'},
+    99: {'main': 'Thunderstorm', 'description': 'Thunderstorm with heavy hail', 'icon': '11d'}
+}
+
+# Weather codes are small ints (0-99), so each field is also kept in a flat
+# list indexed by code; unmapped codes and the extra last slot hold 'Unknown'
+_WEATHER_CODE_LIMIT = 100
+_UNKNOWN_CODE = _WEATHER_CODE_LIMIT
+_WEATHER_MAIN = ['Unknown'] * (_WEATHER_CODE_LIMIT + 1)
+_WEATHER_DESCRIPTION = ['Unknown weather'] * (_WEATHER_CODE_LIMIT + 1)
+_WEATHER_ICON = ['01d'] * (_WEATHER_CODE_LIMIT + 1)
+for _code, _info in _WEATHER_CODES.items():
+    _WEATHER_MAIN[_code] = _info['main']
+    _WEATHER_DESCRIPTION[_code] = _info['description']
+    _WEATHER_ICON[_code] = _info['icon']
+del _code, _info
+
+# Every client shares the same table, so expose it read-only; repeated
+# main/icon strings are already single constant objects in this module
+_WEATHER_CODES = MappingProxyType({
+    code: MappingProxyType(info) for code, info in _WEATHER_CODES.items()
+})
+
+# How long a current-weather response may be served from the HTTP cache
+_CURRENT_WEATHER_CACHE_SECONDS = 600
+
 
 class OpenMeteoClient:
     """Client for the OpenMeteo API service"""
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, cache_name: Optional[str] = "data/http_cache"):
         self.timeout = timeout
         self.logger = logging.getLogger(__name__)
+        # Current conditions are cached briefly so quick refreshes skip the network
+        self._session = create_session(
+            cache_name=cache_name,
+            urls_expire_after={'api.open-meteo.com': _CURRENT_WEATHER_CACHE_SECONDS}
+        )
         
         # OpenMeteo weather code mappings
-        self.weather_codes = {
-            0: {'main': 'Clear', 'description': 'Clear sky', 'icon': '01d'},
-            1: {'main': 'Partly Cloudy', 'description': 'Partly cloudy', 'icon': '02d'},
-            2: {'main': 'Cloudy', 'description': 'Cloudy', 'icon': '03d'},
-            3: {'main': 'Overcast', 'description': 'Overcast', 'icon': '04d'},
-            45: {'main': 'Foggy', 'description': 'Foggy', 'icon': '50d'},
-            48: {'main': 'Foggy', 'description': 'Depositing rime fog', 'icon': '50d'},
-            51: {'main': 'Drizzle', 'description': 'Light drizzle', 'icon': '09d'},
-            53: {'main': 'Drizzle', 'description': 'Moderate drizzle', 'icon': '09d'},
-            55: {'main': 'Drizzle', 'description': 'Heavy drizzle', 'icon': '09d'},
-            61: {'main': 'Rain', 'description': 'Light rain', 'icon': '10d'},
-            63: {'main': 'Rain', 'description': 'Moderate rain', 'icon': '10d'},
-            65: {'main': 'Rain', 'description': 'Heavy rain', 'icon': '10d'},
-            71: {'main': 'Snow', 'description': 'Light snow', 'icon': '13d'},
-            73: {'main': 'Snow', 'description': 'Moderate snow', 'icon': '13d'},
-            75: {'main': 'Snow', 'description': 'Heavy snow', 'icon': '13d'},
-            77: {'main': 'Snow', 'description': 'Snow grains', 'icon': '13d'},
-            80: {'main': 'Rain', 'description': 'Light rain showers', 'icon': '10d'},
-            81: {'main': 'Rain', 'description': 'Moderate rain showers', 'icon': '10d'},
-            82: {'main': 'Rain', 'description': 'Heavy rain showers', 'icon': '10d'},
-            85: {'main': 'Snow', 'description': 'Light snow showers', 'icon': '13d'},
-            86: {'main': 'Snow', 'description': 'Heavy snow showers', 'icon': '13d'},
-            95: {'main': 'Thunderstorm', 'description': 'Thunderstorm', 'icon': '11d'},
-            96: {'main': 'Thunderstorm', 'description': 'Thunderstorm with hail', 'icon': '11d'},
-            99: {'main': 'Thunderstorm', 'description': 'Thunderstorm with heavy hail', 'icon': '11d'}
-        }
+        self.weather_codes = _WEATHER_CODES
 
     def fetch_weather(self, lat: float, lon: float, units: str = "metric") -> Optional[Dict]:
         """
@@ -70,19 +103,19 @@ class OpenMeteoClient:
                 'timezone': 'auto'
             }
             
-            response = requests.get(current_url, params=params, timeout=self.timeout)
+            response = self._session.get(current_url, params=params, timeout=split_timeout(self.timeout))
             if response.status_code != 200:
                 return {"error": f"OpenMeteo API error: {response.status_code}"}
                 
-            data = response.json()
+            data = parse_json(response)
             
             if 'error' in data:
                 return {"error": f"OpenMeteo API error: {data['error']}"}
                 
             current = data.get('current', {})
             weather_code = current.get('weather_code')
-            weather_info = self.weather_codes.get(weather_code, 
-                {'main': 'Unknown', 'description': 'Unknown weather', 'icon': '01d'})
+            if not (isinstance(weather_code, int) and 0 <= weather_code < _WEATHER_CODE_LIMIT):
+                weather_code = _UNKNOWN_CODE
             
             # Format the response to match our expected structure
             weather_data = {
@@ -90,9 +123,9 @@ class OpenMeteoClient:
                 'feels_like': current.get('apparent_temperature'),
                 'humidity': current.get('relative_humidity_2m'),
                 'pressure': current.get('pressure_msl'),
-                'weather_main': weather_info['main'],
-                'weather_description': weather_info['description'],
-                'weather_icon': weather_info['icon'],
+                'weather_main': _WEATHER_MAIN[weather_code],
+                'weather_description': _WEATHER_DESCRIPTION[weather_code],
+                'weather_icon': _WEATHER_ICON[weather_code],
                 'wind_speed': current.get('wind_speed_10m'),
                 'wind_direction': current.get('wind_direction_10m'),
                 'visibility': None,  # Not provided by OpenMeteo free API
@@ -109,6 +142,10 @@ class OpenMeteoClient:
             self.logger.error(f"Error processing OpenMeteo data: {str(e)}")
             return {"error": f"Error processing OpenMeteo data: {str(e)}"}
 
+    def close(self) -> None:
+        """Close the pooled HTTP session"""
+        self._session.close()
+
     def fetch_forecast(self, lat: float, lon: float, units: str = "metric", days: int = 7) -> Optional[Dict]:
         """
         Fetch forecast data from OpenMeteo API
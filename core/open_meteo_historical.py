@@ -1,6 +1,7 @@
 """Historical weather data client using Open-Meteo Archive API"""
 
 import logging
+import numpy as np
 import pandas as pd
 import openmeteo_requests
 import requests_cache
@@ -10,6 +11,29 @@ from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Daily variables requested from the archive API, in response order
+_DAILY_VARIABLES = [
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "sunrise",
+    "sunset",
+    "precipitation_sum",
+    "rain_sum",
+    "temperature_2m_mean",
+    "wind_speed_10m_max",
+    "wind_gusts_10m_max",
+    "cloud_cover_mean",
+    "relative_humidity_2m_mean"
+]
+
+# Column groups rounded together in clean_historical_data
+_ONE_DECIMAL_COLUMNS = [
+    'temperature_2m_max', 'temperature_2m_min', 'temperature_2m_mean',
+    'wind_speed_10m_max', 'wind_gusts_10m_max'
+]
+_TWO_DECIMAL_COLUMNS = ['precipitation_sum', 'rain_sum']
+_INTEGER_COLUMNS = ['cloud_cover_mean', 'relative_humidity_2m_mean']
+
 class OpenMeteoHistorical:
     """Client for fetching historical weather data from Open-Meteo Archive API"""
     
@@ -20,6 +44,70 @@ class OpenMeteoHistorical:
         self.client = openmeteo_requests.Client(session=retry_session)
         self.api_url = "https://archive-api.open-meteo.com/v1/archive"
     
+    def _build_params(self, latitude, longitude, timezone: str) -> Dict:
+        """
+        Build archive request parameters for one location or a list of locations
+        
+        Args:
+            latitude: Latitude, or list of latitudes for a batch request
+            longitude: Longitude, or list of longitudes for a batch request
+            timezone: Timezone string
+            
+        Returns:
+            Request parameter dictionary
+        """
+        # Fixed start date and calculate end date (6 days before current date)
+        end_date = datetime.now() - timedelta(days=6)
+        
+        return {
+            "latitude": latitude,
+            "longitude": longitude,
+            "start_date": "2010-01-01",
+            "end_date": end_date.strftime("%Y-%m-%d"),
+            "daily": _DAILY_VARIABLES,
+            "timezone": timezone,
+            "temperature_unit": "fahrenheit",
+            "wind_speed_unit": "mph",
+            "precipitation_unit": "inch"
+        }
+    
+    @staticmethod
+    def _response_to_dataframe(response) -> pd.DataFrame:
+        """
+        Convert one location's archive response into a DataFrame
+        
+        Args:
+            response: Location response from the openmeteo_requests client
+            
+        Returns:
+            DataFrame with one row per day plus location metadata
+        """
+        # Process daily data
+        daily = response.Daily()
+        dates = pd.date_range(
+            start=pd.to_datetime(daily.Time(), unit="s", utc=True),
+            end=pd.to_datetime(daily.TimeEnd(), unit="s", utc=True),
+            freq=pd.Timedelta(seconds=daily.Interval()),
+            inclusive="left"
+        )
+        
+        # Copy every variable into one contiguous float64 block (float64 keeps
+        # the sunrise/sunset epoch seconds exact) and wrap it without a further copy
+        values = np.empty((len(_DAILY_VARIABLES), len(dates)), dtype=np.float64)
+        for idx in range(len(_DAILY_VARIABLES)):
+            values[idx] = daily.Variables(idx).ValuesAsNumpy()
+        
+        df = pd.DataFrame(values.T, columns=_DAILY_VARIABLES, copy=False)
+        df.insert(0, "date", dates)
+        
+        # Add metadata
+        df['latitude'] = response.Latitude()
+        df['longitude'] = response.Longitude()
+        df['elevation'] = response.Elevation()
+        df['timezone'] = response.Timezone()
+        
+        return df
+    
     def get_historical_data(
         self,
         latitude: float,
@@ -38,84 +126,64 @@ class OpenMeteoHistorical:
             Tuple of (DataFrame with weather data, error message if any)
         """
         try:
-            # Fixed start date and calculate end date (6 days before current date)
-            end_date = datetime.now() - timedelta(days=6)
-            
-            params = {
-                "latitude": latitude,
-                "longitude": longitude,
-                "start_date": "2010-01-01",
-                "end_date": end_date.strftime("%Y-%m-%d"),
-                "daily": [
-                    "temperature_2m_max",
-                    "temperature_2m_min",
-                    "sunrise",
-                    "sunset",
-                    "precipitation_sum",
-                    "rain_sum",
-                    "temperature_2m_mean",
-                    "wind_speed_10m_max",
-                    "wind_gusts_10m_max",
-                    "cloud_cover_mean",
-                    "relative_humidity_2m_mean"
-                ],
-                "timezone": timezone,
-                "temperature_unit": "fahrenheit",
-                "wind_speed_unit": "mph",
-                "precipitation_unit": "inch"
-            }
-            
+            params = self._build_params(latitude, longitude, timezone)
             responses = self.client.weather_api(self.api_url, params=params)
             
             if not responses:
                 return None, "No data received from API"
                 
             # Process first location response
-            response = responses[0]
-            
-            # Process daily data
-            daily = response.Daily()
-            daily_data = {
-                "date": pd.date_range(
-                    start=pd.to_datetime(daily.Time(), unit="s", utc=True),
-                    end=pd.to_datetime(daily.TimeEnd(), unit="s", utc=True),
-                    freq=pd.Timedelta(seconds=daily.Interval()),
-                    inclusive="left"
-                )
-            }
-            
-            # Map all variables to the dataframe
-            variables = [
-                "temperature_2m_max",
-                "temperature_2m_min",
-                "sunrise",
-                "sunset",
-                "precipitation_sum",
-                "rain_sum",
-                "temperature_2m_mean",
-                "wind_speed_10m_max",
-                "wind_gusts_10m_max",
-                "cloud_cover_mean",
-                "relative_humidity_2m_mean"
-            ]
-            
-            for idx, var in enumerate(variables):
-                daily_data[var] = daily.Variables(idx).ValuesAsNumpy()
-            
-            df = pd.DataFrame(data=daily_data)
-            
-            # Add metadata
-            df['latitude'] = response.Latitude()
-            df['longitude'] = response.Longitude()
-            df['elevation'] = response.Elevation()
-            df['timezone'] = response.Timezone()
-            
-            return df, None
+            return self._response_to_dataframe(responses[0]), None
             
         except Exception as e:
             logger.error(f"Error fetching historical data: {str(e)}")
             return None, f"Failed to fetch historical data: {str(e)}"
     
+    def get_historical_data_batch(
+        self,
+        points: List[Tuple[float, float]],
+        timezone: str = "America/Los_Angeles"
+    ) -> List[Tuple[Optional[pd.DataFrame], Optional[str]]]:
+        """
+        Fetch historical weather data for several locations in one request.
+        
+        The archive API accepts lists of coordinates and answers with one
+        response per location, so N cities cost one round trip instead of N.
+        
+        Args:
+            points: List of (latitude, longitude) pairs
+            timezone: Timezone string shared by all locations
+            
+        Returns:
+            List of (DataFrame, error message) tuples in the order of points
+        """
+        if not points:
+            return []
+        
+        try:
+            params = self._build_params(
+                [lat for lat, _ in points],
+                [lon for _, lon in points],
+                timezone
+            )
+            responses = self.client.weather_api(self.api_url, params=params)
+        except Exception as e:
+            logger.error(f"Error fetching historical data batch: {str(e)}")
+            error = f"Failed to fetch historical data: {str(e)}"
+            return [(None, error)] * len(points)
+        
+        results = []
+        for idx in range(len(points)):
+            if idx >= len(responses or ()):
+                results.append((None, "No data received from API"))
+                continue
+            try:
+                results.append((self._response_to_dataframe(responses[idx]), None))
+            except Exception as e:
+                logger.error(f"Error processing historical data for {points[idx]}: {str(e)}")
+                results.append((None, f"Failed to fetch historical data: {str(e)}"))
+        return results
+    
     def clean_historical_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Clean and validate historical weather data
@@ -130,28 +198,17 @@ class OpenMeteoHistorical:
             return None
             
         try:
-            # Convert temperatures to proper format
-            temp_columns = [
-                'temperature_2m_max',
-                'temperature_2m_min',
-                'temperature_2m_mean'
-            ]
-            for col in temp_columns:
-                df[col] = df[col].round(1)
-            
-            # Convert wind speeds
-            wind_columns = ['wind_speed_10m_max', 'wind_gusts_10m_max']
-            for col in wind_columns:
-                df[col] = df[col].round(1)
-            
-            # Convert precipitation to 2 decimal places
-            precip_columns = ['precipitation_sum', 'rain_sum']
-            for col in precip_columns:
-                df[col] = df[col].round(2)
-            
-            # Convert cloud cover and humidity to integers
-            df['cloud_cover_mean'] = df['cloud_cover_mean'].round().astype(int)
-            df['relative_humidity_2m_mean'] = df['relative_humidity_2m_mean'].round().astype(int)
+            # Round each column group in one NumPy pass over its block:
+            # temperatures and wind speeds to 1 decimal, precipitation to 2
+            df[_ONE_DECIMAL_COLUMNS] = np.round(df[_ONE_DECIMAL_COLUMNS].to_numpy(dtype=np.float64), 1)
+            df[_TWO_DECIMAL_COLUMNS] = np.round(df[_TWO_DECIMAL_COLUMNS].to_numpy(dtype=np.float64), 2)
+            
+            # Cloud cover and humidity are 0-100 percentages, so uint8 holds them.
+            # The uint8 cast would turn missing values into 0%, so reject them first
+            percentages = df[_INTEGER_COLUMNS].to_numpy(dtype=np.float64)
+            if np.isnan(percentages).any():
+                raise ValueError(f"missing values in {', '.join(_INTEGER_COLUMNS)}")
+            df[_INTEGER_COLUMNS] = np.round(percentages).astype(np.uint8)
             
             # Convert dates to string format in YYYY-MM-DD format for SQLite compatibility
             df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
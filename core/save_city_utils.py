@@ -1,6 +1,7 @@
 """Utility for creating a save city button using ttkbootstrap."""
 
 import logging
+import ttkbootstrap as tb
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +16,17 @@ def create_save_city_button(parent, city_data, on_save_callback, style='primary'
     Returns:
         button: the created Button
     """
-    import ttkbootstrap as tb
     def handle_save():
         current_city_data = getattr(btn, 'city_data', None)
-        logger.debug("Save button clicked - city_data: %s", current_city_data)
-        
-        # Make sure to use the proper city name from the API response
-        if current_city_data:
-            # Ensure we're using the properly capitalized city name from the API
-            logger.debug("Using API-provided city name: %s", current_city_data.get('city', ''))
+        # Skip the diagnostics entirely unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Save button clicked - city_data: %s", current_city_data)
             
+            # Make sure to use the proper city name from the API response
+            if current_city_data:
+                # Ensure we're using the properly capitalized city name from the API
+                logger.debug("Using API-provided city name: %s", current_city_data.get('city', ''))
+        
         on_save_callback(current_city_data)
     btn = tb.Button(parent, text="Save City", command=handle_save)
     if hasattr(btn, 'configure'):
@@ -4,16 +4,38 @@ import ttkbootstrap as tb
 import logging
 from typing import Dict, Optional
 
+# Themes grouped by brightness
+_AVAILABLE_THEMES = {
+    "light": ("aj_lightly", "pulse", "flatly", "litera", "minty", "lumen"),
+    "dark": ("aj_darkly", "darkly", "cyborg", "superhero", "solar")
+}
+_LIGHT_THEMES = frozenset(_AVAILABLE_THEMES["light"])
+_DARK_THEMES = frozenset(_AVAILABLE_THEMES["dark"])
+
+# Built-in stand-ins tried, in order, when a preferred theme isn't registered
+_FALLBACKS = {
+    "aj_lightly": ("pulse", "flatly", "litera", "cosmo"),
+    "aj_darkly": ("darkly", "superhero", "cyborg", "vapor"),
+}
+_DEFAULT_FALLBACKS = ("darkly", "superhero", "pulse", "cosmo")
+
 class ThemeManager:
     """Manages theme operations and provides theme utilities"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.style = tb.Style()
+        self._known_themes = set()  # Themes seen to exist; themes are never unregistered
     
     def theme_exists(self, theme_name: str) -> bool:
         """Check if a theme exists"""
-        return theme_name in self.style.theme_names()
+        if theme_name in self._known_themes:
+            return True
+        # Misses are re-checked, since custom themes can be registered later
+        if theme_name in self.style.theme_names():
+            self._known_themes.add(theme_name)
+            return True
+        return False
     
     def get_fallback_theme(self, preferred_theme: str) -> str:
         """Get a fallback theme if preferred theme doesn't exist"""
@@ -21,14 +43,7 @@ class ThemeManager:
             return preferred_theme
             
         # Fallback chain for custom themes
-        if preferred_theme == "aj_lightly":
-            fallbacks = ["pulse", "flatly", "litera", "cosmo"]
-        elif preferred_theme == "aj_darkly":
-            fallbacks = ["darkly", "superhero", "cyborg", "vapor"]
-        else:
-            fallbacks = ["darkly", "superhero", "pulse", "cosmo"]
-        
-        for theme in fallbacks:
+        for theme in _FALLBACKS.get(preferred_theme, _DEFAULT_FALLBACKS):
             if self.theme_exists(theme):
                 self.logger.warning(f"Using fallback theme: {theme} for {preferred_theme}")
                 return theme
@@ -38,20 +53,15 @@ class ThemeManager:
     
     def get_available_themes(self) -> Dict[str, list]:
         """Get all available themes categorized by type"""
-        return {
-            "light": ["aj_lightly", "pulse", "flatly", "litera", "minty", "lumen"],
-            "dark": ["aj_darkly", "darkly", "cyborg", "superhero", "solar"]
-        }
+        return {kind: list(themes) for kind, themes in _AVAILABLE_THEMES.items()}
     
     def is_light_theme(self, theme_name: str) -> bool:
         """Check if a theme is a light theme"""
-        light_themes = self.get_available_themes()["light"]
-        return theme_name in light_themes
+        return theme_name in _LIGHT_THEMES
     
     def is_dark_theme(self, theme_name: str) -> bool:
         """Check if a theme is a dark theme"""
-        dark_themes = self.get_available_themes()["dark"]
-        return theme_name in dark_themes
+        return theme_name in _DARK_THEMES
     
     def get_current_theme(self) -> str:
         """Get the currently active theme"""
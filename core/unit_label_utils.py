@@ -2,6 +2,10 @@
 Utility for handling unit label logic for temperature, wind, etc.
 """
 
+# Unit system -> label lookups; unknown systems fall back to imperial/metric defaults
+_TEMP_LABELS = {'imperial': '°F', 'metric': '°C', 'kelvin': 'K'}
+_WIND_LABELS = {'imperial': 'mph'}
+
 def get_unit_label(temp_unit):
     """
     Return the unit label for temperature.
@@ -10,14 +14,7 @@ def get_unit_label(temp_unit):
     Returns:
         str: unit label (e.g., '°F', '°C', 'K')
     """
-    if temp_unit == 'imperial':
-        return '°F'
-    elif temp_unit == 'metric':
-        return '°C'
-    elif temp_unit == 'kelvin':
-        return 'K'
-    else:
-        return '°F'  # Default
+    return _TEMP_LABELS.get(temp_unit, '°F')  # Default
 
 def get_wind_unit_label(temp_unit):
     """
@@ -27,7 +24,4 @@ def get_wind_unit_label(temp_unit):
     Returns:
         str: wind unit label (e.g., 'mph', 'm/s')
     """
-    if temp_unit == 'imperial':
-        return 'mph'
-    else:
-        return 'm/s'
+    return _WIND_LABELS.get(temp_unit, 'm/s')
@@ -2,34 +2,111 @@
 
 from datetime import datetime
 import json
+import mmap
 import os
 import logging
+import threading
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Optional
 from .theme_manager import ThemeManager
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib codec
+    orjson = None
+
+try:
+    from .icon_manager import get_weather_icon as _icon_weather_emoji
+except ImportError:  # Imaging dependencies missing; use the keyword table below
+    _icon_weather_emoji = None
+
 logger = logging.getLogger(__name__)
 
+# Fallback description keyword -> emoji rules, in priority order
+_EMOJI_RULES = (
+    ("sun", "☀️"),
+    ("clear", "☀️"),
+    ("partly", "🌤️"),
+    ("cloud", "☁️"),
+    ("wind", "🌬️"),
+    ("rain", "🌧️"),
+    ("thunder", "⛈️"),
+    ("snow", "❄️"),
+)
+
+@lru_cache(maxsize=128)
+def _keyword_weather_emoji(description: str) -> str:
+    """Map a description to an emoji with the fallback keyword table"""
+    d = description.lower()
+    for keyword, emoji in _EMOJI_RULES:
+        if keyword in d:
+            return emoji
+    return "🌡️"
+
+_TIMESTAMP_FORMAT = "%b %d, %Y %I:%M %p"
+
+@lru_cache(maxsize=512)
+def _format_iso_timestamp(timestamp: str, _fromiso=datetime.fromisoformat,
+                          _fmt=_TIMESTAMP_FORMAT) -> str:
+    """Format an ISO timestamp for display; repeat refreshes hit the cache"""
+    try:
+        return _fromiso(timestamp).strftime(_fmt)
+    except (ValueError, TypeError):
+        return "N/A"
+
+# Files above one page are mapped instead of read into a fresh buffer
+_MMAP_THRESHOLD = mmap.PAGESIZE
+
+def _read_json_file(path: str, size: int):
+    """
+    Parse a JSON file, memory-mapping it when it spans more than one page
+    
+    Args:
+        path: Path of the JSON file
+        size: Current size of the file in bytes
+        
+    Returns:
+        The decoded JSON document
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    if size <= _MMAP_THRESHOLD:
+        with open(path, "rb") as f:
+            return loads(f.read())
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # orjson reads the mapping through the buffer protocol without a copy
+            return loads(memoryview(mm) if orjson is not None else mm[:])
+
+# Settings used until the user saves their own; shared read-only by every manager
+_DEFAULT_SETTINGS = MappingProxyType({
+    "theme": "aj_darkly",  # Use custom dark theme as default
+    "auto_theme_mode": True,  # Enable auto day/night mode by default
+    "light_theme": "aj_lightly",  # Theme to use during daytime
+    "dark_theme": "aj_darkly",  # Theme to use during nighttime
+    "default_location": "",
+    "temperature_unit": "celsius",
+    "wind_speed_unit": "kmh",
+    "pressure_unit": "hPa"
+})
+
 class UserSettingsManager:
     """Handles all user settings and preferences"""
     
     def __init__(self, settings_file: str = "data/user_settings.json"):
         self.settings_file = settings_file
-        self.default_settings = {
-            "theme": "aj_darkly",  # Use custom dark theme as default
-            "auto_theme_mode": True,  # Enable auto day/night mode by default
-            "light_theme": "aj_lightly",  # Theme to use during daytime
-            "dark_theme": "aj_darkly",  # Theme to use during nighttime
-            "default_location": "",
-            "temperature_unit": "celsius",
-            "wind_speed_unit": "kmh",
-            "pressure_unit": "hPa"
-        }
+        self.default_settings = _DEFAULT_SETTINGS
+        # Last parsed settings and the (mtime_ns, size) of the file they came from
+        self._cache: Optional[Dict] = None
+        self._cache_sig = None
+        # Guards the cache fields and the temp-file write shared by save_settings
+        self._lock = threading.Lock()
         self._ensure_data_directory()
     
     def _ensure_data_directory(self) -> None:
         """Create data directory if it doesn't exist"""
         data_dir = os.path.dirname(self.settings_file)
-        if data_dir:
+        if data_dir and not os.path.isdir(data_dir):
             os.makedirs(data_dir, exist_ok=True)
     
     def load_user_theme(self, default: str = "aj_darkly") -> str:
@@ -66,13 +143,26 @@ class UserSettingsManager:
         Returns:
             Dictionary of user settings
         """
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file, "r") as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning("Error loading settings: %s", e)
-        return self.default_settings.copy()
+        try:
+            st = os.stat(self.settings_file)
+        except OSError:
+            return self.default_settings.copy()
+        
+        # Only re-read when the file changed since it was last parsed or written
+        sig = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if sig == self._cache_sig:
+                # Callers modify the result before saving it back, so hand out a copy
+                return self._cache.copy()
+        
+        try:
+            settings = _read_json_file(self.settings_file, st.st_size)
+        except (OSError, ValueError) as e:  # ValueError covers JSON decode errors
+            logger.warning("Error loading settings: %s", e)
+            return self.default_settings.copy()
+        with self._lock:
+            self._cache, self._cache_sig = settings, sig
+        return settings.copy()
     
     def save_settings(self, settings: Dict) -> bool:
         """
@@ -84,12 +174,51 @@ class UserSettingsManager:
         Returns:
             True if successful, False otherwise
         """
+        with self._lock:
+            return self._write_settings(settings)
+    
+    def _write_settings(self, settings: Dict) -> bool:
+        """Write settings to disk and refresh the cache; caller holds self._lock"""
+        # Write a sibling temp file and rename it over the original, so a crash
+        # mid-write never leaves a truncated settings file behind
+        tmp_file = self.settings_file + ".tmp"
         try:
-            with open(self.settings_file, "w") as f:
-                json.dump(settings, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(settings)
+            else:
+                data = json.dumps(settings, separators=(",", ":")).encode("utf-8")
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.settings_file)
+            st = os.stat(self.settings_file)
+            self._cache, self._cache_sig = dict(settings), (st.st_mtime_ns, st.st_size)
             return True
         except Exception as e:
             logger.error("Failed to save settings: %s", e)
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            return False
+    
+    def export_settings(self, export_file: str) -> bool:
+        """
+        Write the current settings as indented JSON for people to read
+        
+        Args:
+            export_file: Path of the file to write
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(export_file, "w") as f:
+                json.dump(self.load_settings(), f, indent=2)
+            return True
+        except Exception as e:
+            logger.error("Failed to export settings: %s", e)
             return False
 
 class WeatherFormatter:
@@ -107,8 +236,8 @@ class WeatherFormatter:
             Formatted date string
         """
         try:
-            return datetime.fromisoformat(timestamp).strftime("%b %d, %Y %I:%M %p")
-        except:
+            return _format_iso_timestamp(timestamp)
+        except TypeError:  # Unhashable input can't be a timestamp
             return "N/A"
     
     @staticmethod
@@ -123,40 +252,34 @@ class WeatherFormatter:
         Returns:
             Emoji character representing the weather
         """
-        # Import here to avoid circular imports
-        try:
-            from .icon_manager import get_weather_icon
-            return get_weather_icon(description)
-        except ImportError:
-            # Fallback to original logic if icon_manager not available
-            d = description.lower()
-            if "sun" in d or "clear" in d:
-                return "☀️"
-            elif "partly" in d:
-                return "🌤️"
-            elif "cloud" in d:
-                return "☁️"
-            elif "wind" in d:
-                return "🌬️"
-            elif "rain" in d:
-                return "🌧️"
-            elif "thunder" in d:
-                return "⛈️"
-            elif "snow" in d:
-                return "❄️"
-            else:
-                return "🌡️"
+        if _icon_weather_emoji is not None:
+            return _icon_weather_emoji(description)
+        # Fallback to the keyword table if icon_manager not available
+        return _keyword_weather_emoji(description)
+
+# Shared manager for the module-level helpers, so its settings cache persists
+_settings_manager = None
+
+_settings_manager_lock = threading.Lock()
+
+def _get_settings_manager() -> UserSettingsManager:
+    """Get the shared settings manager used by the legacy helpers"""
+    global _settings_manager
+    if _settings_manager is None:
+        # Double-checked so concurrent first calls share one manager and cache
+        with _settings_manager_lock:
+            if _settings_manager is None:
+                _settings_manager = UserSettingsManager()
+    return _settings_manager
 
 # Legacy functions for backward compatibility
 def load_user_theme(default="aj_darkly"):
     """Legacy function - wraps the new class-based approach"""
-    manager = UserSettingsManager()
-    return manager.load_user_theme(default)
+    return _get_settings_manager().load_user_theme(default)
 
 def save_user_theme(theme_name):
     """Legacy function - wraps the new class-based approach"""
-    manager = UserSettingsManager()
-    return manager.save_user_theme(theme_name)
+    return _get_settings_manager().save_user_theme(theme_name)
 
 def save_auto_theme_settings(auto_mode: bool, light_theme: str = "aj_lightly", dark_theme: str = "aj_darkly"):
     """
@@ -170,7 +293,7 @@ def save_auto_theme_settings(auto_mode: bool, light_theme: str = "aj_lightly", d
     Returns:
         True if successful, False otherwise
     """
-    manager = UserSettingsManager()
+    manager = _get_settings_manager()
     settings = manager.load_settings()
     settings["auto_theme_mode"] = auto_mode
     settings["light_theme"] = light_theme
@@ -184,8 +307,7 @@ def load_auto_theme_settings():
     Returns:
         Tuple of (auto_mode, light_theme, dark_theme)
     """
-    manager = UserSettingsManager()
-    settings = manager.load_settings()
+    settings = _get_settings_manager().load_settings()
     return (
         settings.get("auto_theme_mode", True),
         settings.get("light_theme", "aj_lightly"),
@@ -213,7 +335,7 @@ def get_auto_theme() -> str:
     
     if not auto_mode:
         # Auto mode disabled, use saved theme
-        manager = UserSettingsManager()
+        manager = _get_settings_manager()
         saved_theme = manager.load_user_theme()
         theme_manager = ThemeManager()
         return theme_manager.get_fallback_theme(saved_theme)
@@ -224,7 +346,7 @@ def get_auto_theme() -> str:
     
     if is_daytime is None:
         # Unable to determine time, use saved theme as fallback
-        manager = UserSettingsManager()
+        manager = _get_settings_manager()
         saved_theme = manager.load_user_theme()
         return theme_manager.get_fallback_theme(saved_theme)
     
@@ -233,10 +355,6 @@ def get_auto_theme() -> str:
     theme_manager = ThemeManager()
     return theme_manager.get_fallback_theme(theme_to_use)
 
-def format_timestamp(timestamp):
-    """Legacy function - wraps the new class-based approach"""
-    return WeatherFormatter.format_timestamp(timestamp)
-
-def map_weather_to_emoji(description):
-    """Legacy function - wraps the new class-based approach"""
-    return WeatherFormatter.map_weather_to_emoji(description)
+# Legacy names bound straight to the class-based implementations
+format_timestamp = WeatherFormatter.format_timestamp
+map_weather_to_emoji = WeatherFormatter.map_weather_to_emoji
@@ -1,33 +1,65 @@
 """Utility functions for weather data extraction and formatting"""
 
+_NA = 'N/A'
+_NO_WEATHER = ({},)
+
+def _parse_cleaned(data, unit_label):
+    """Build the display dict from a cleaned/validated weather record"""
+    get = data.get
+    return {
+        'city': get('city', 'Unknown'),
+        'temp': get('temperature', _NA),
+        'description': get('weather_description', _NA),
+        'humidity': get('humidity', _NA),
+        'pressure': get('pressure', _NA),
+        'wind_speed': get('wind_speed', _NA),
+        'icon': get('weather_icon', ''),
+        'country': get('country', ''),
+        'unit_label': unit_label
+    }
+
+def _parse_raw(data, unit_label):
+    """Build the display dict from a raw OpenWeatherMap response"""
+    # Bind each nested section once instead of re-walking it per field
+    main = data.get('main') or {}
+    weather0 = (data.get('weather') or _NO_WEATHER)[0]
+    wind = data.get('wind') or {}
+    sys_info = data.get('sys') or {}
+    return {
+        'city': data.get('name', 'Unknown'),
+        'temp': main.get('temp', _NA),
+        'description': weather0.get('description', _NA),
+        'humidity': main.get('humidity', _NA),
+        'pressure': main.get('pressure', _NA),
+        'wind_speed': wind.get('speed', _NA),
+        'icon': weather0.get('icon', ''),
+        'country': sys_info.get('country', ''),
+        'unit_label': unit_label
+    }
+
 def parse_weather_data(data, unit_label="°F"):
     """
     Parse weather data dict (raw or cleaned) into a display-ready dict.
+    Missing or empty sections of a raw response (e.g. 'weather': [] or
+    'main': None) show as 'N/A' instead of raising.
     Returns:
         dict with keys: city, temp, description, humidity, pressure, wind_speed, icon, country
     """
-    # Try cleaned format first
+    # Try cleaned format first, fall back to raw OpenWeatherMap format
     if 'city' in data and 'temperature' in data:
-        return {
-            'city': data.get('city', 'Unknown'),
-            'temp': data.get('temperature', 'N/A'),
-            'description': data.get('weather_description', 'N/A'),
-            'humidity': data.get('humidity', 'N/A'),
-            'pressure': data.get('pressure', 'N/A'),
-            'wind_speed': data.get('wind_speed', 'N/A'),
-            'icon': data.get('weather_icon', ''),
-            'country': data.get('country', ''),
-            'unit_label': unit_label
-        }
-    # Fallback to raw OpenWeatherMap format
-    return {
-        'city': data.get('name', 'Unknown'),
-        'temp': data.get('main', {}).get('temp', 'N/A'),
-        'description': data.get('weather', [{}])[0].get('description', 'N/A'),
-        'humidity': data.get('main', {}).get('humidity', 'N/A'),
-        'pressure': data.get('main', {}).get('pressure', 'N/A'),
-        'wind_speed': data.get('wind', {}).get('speed', 'N/A'),
-        'icon': data.get('weather', [{}])[0].get('icon', ''),
-        'country': data.get('sys', {}).get('country', ''),
-        'unit_label': unit_label
-    }
+        return _parse_cleaned(data, unit_label)
+    return _parse_raw(data, unit_label)
+
+def parse_weather_data_many(records, unit_label="°F"):
+    """
+    Parse a batch of weather data dicts, e.g. forecast days or history rows.
+    Returns:
+        list of display-ready dicts, in the order of records
+    """
+    parse_cleaned = _parse_cleaned
+    parse_raw = _parse_raw
+    return [
+        parse_cleaned(data, unit_label) if 'city' in data and 'temperature' in data
+        else parse_raw(data, unit_label)
+        for data in records
+    ]
@@ -1,14 +1,108 @@
-import matplotlib.pyplot as plt
+import tkinter as tk
+
+import numpy as np
+
+def _chart_temps(weather_data_list):
+    """Extract the temperatures of weather entries as a float64 array."""
+    # Vectorized extraction: one C-level fill instead of a list of floats.
+    # float64 matches what Tk and matplotlib use, so no widening copy later
+    return np.fromiter((entry["temperature"] for entry in weather_data_list),
+                       dtype=np.float64, count=len(weather_data_list))
+
+def _chart_series(weather_data_list):
+    """Extract (dates, temperatures) arrays from weather entries."""
+    import pandas as pd  # Only the matplotlib charts need real dates
+
+    # One ISO parse for all timestamps, so matplotlib gets dates instead of strings
+    dates = pd.to_datetime([entry["timestamp"] for entry in weather_data_list],
+                           format="ISO8601", cache=True).to_numpy()
+    return dates, _chart_temps(weather_data_list)
+
+class TkLineChart:
+    """Temperature history drawn straight onto a Tk Canvas.
+
+    Cheap enough for every dashboard refresh: no matplotlib import, and one
+    canvas line whose coordinates are moved in place.
+    """
+
+    def __init__(self, parent, width=600, height=400, pad=30):
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.canvas = tk.Canvas(parent, width=width, height=height, highlightthickness=0)
+        self._title = self.canvas.create_text(width / 2, pad / 2, text="")
+        self._line = None
+
+    def update(self, weather_data_list, city_name):
+        """Redraw the line for new weather entries."""
+        self.canvas.itemconfigure(self._title, text=f"Temperature History - {city_name}")
+        temps = _chart_temps(weather_data_list)
+        if len(temps) < 2:
+            if self._line is not None:
+                self.canvas.delete(self._line)
+                self._line = None
+            return
+
+        # Scale every point to pixels in one numpy expression
+        w, h, pad = self.width, self.height, self.pad
+        tmin = temps.min()
+        span = (temps.max() - tmin) or 1.0  # Flat line: avoid dividing by zero
+        xs = np.linspace(pad, w - pad, len(temps))
+        ys = h - pad - (temps - tmin) / span * (h - 2 * pad)
+        coords = np.column_stack((xs, ys)).ravel().tolist()
+
+        if self._line is None:
+            self._line = self.canvas.create_line(*coords, width=2)
+        else:
+            self.canvas.coords(self._line, *coords)
+
+class TemperatureChart:
+    """Temperature history chart that keeps one Figure and redraws it in place."""
+
+    def __init__(self, parent=None):
+        # Imported here so the Tk line chart never pays for matplotlib
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        # Explicit Figure instead of pyplot: no global state, no interactive backend
+        self.fig = Figure(figsize=(6, 4))
+        self.ax = self.fig.add_subplot(111)
+        (self.line,) = self.ax.plot([], [], marker='o')
+        self.ax.tick_params(axis='x', labelrotation=45)
+        self._laid_out = False
+        if parent is not None:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
+        else:
+            self.canvas = FigureCanvasAgg(self.fig)
+
+    def update(self, weather_data_list, city_name):
+        """Replace the plotted series and schedule a redraw."""
+        dates, temps = _chart_series(weather_data_list)
+        self.ax.xaxis.update_units(dates)
+        self.line.set_data(dates, temps)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.ax.set_title(f"Temperature History - {city_name}")
+        if not self._laid_out and len(temps):
+            # Lay out once the tick labels exist; later refreshes keep the layout
+            self.fig.tight_layout()
+            self._laid_out = True
+        self.canvas.draw_idle()
+        return self.fig
+
+_headless_chart = None
 
 def generate_temperature_chart(weather_data_list, city_name):
-    """Generate and return a line chart of temperatures."""
-    # Example placeholder using matplotlib
-    dates = [entry["timestamp"] for entry in weather_data_list]
-    temps = [entry["temperature"] for entry in weather_data_list]
-
-    plt.figure(figsize=(6,4))
-    plt.plot(dates, temps, marker='o')
-    plt.title(f"Temperature History - {city_name}")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    return plt
+    """Generate and return a line chart of temperatures.
+
+    Export path (e.g. fig.savefig to PNG): reuses one off-screen Agg chart
+    across calls and returns its Figure. Use TkLineChart for on-screen refreshes.
+    Returns a matplotlib Figure, not the pyplot module it used to return:
+    call fig.savefig() rather than plt.show()/plt.savefig(), and expect the
+    same Figure back on every call.
+    """
+    global _headless_chart
+    if _headless_chart is None:
+        _headless_chart = TemperatureChart()
+    return _headless_chart.update(weather_data_list, city_name)
@@ -1,7 +1,52 @@
-def analyze_trends(weather_data_list):
-    """Analyze weather trends for a city."""
-    # Example: return average change or trend direction
-    if len(weather_data_list) < 2:
-        return "Insufficient data"
-    delta = weather_data_list[-1]['temperature'] - weather_data_list[0]['temperature']
-    return "Warming trend" if delta > 0 else "Cooling trend" if delta < 0 else "Stable"
+from enum import IntEnum
+
+import numpy as np
+
+class Trend(IntEnum):
+    """Direction of a temperature history, comparable as a signed int."""
+    COOLING = -1
+    STABLE = 0
+    WARMING = 1
+
+    @property
+    def label(self):
+        """Human-readable description for display."""
+        return _TREND_LABELS[self]
+
+_TREND_LABELS = {
+    Trend.COOLING: "Cooling trend",
+    Trend.STABLE: "Stable",
+    Trend.WARMING: "Warming trend",
+}
+
+def analyze_trends(weather_data_list, *, temps=None):
+    """Analyze weather trends for a city.
+
+    Compares the last temperature with the first. Pass temps (or an array
+    as weather_data_list) to use temperatures the caller already holds.
+    Returns a Trend, or None when there are fewer than two readings.
+    Trend is an IntEnum, so str() gives its number: display code must use
+    trend.label (and its own text for None, e.g. "Insufficient data").
+    """
+    if temps is None and isinstance(weather_data_list, np.ndarray):
+        temps = weather_data_list
+    if temps is not None:
+        if len(temps) < 2:
+            return None
+        delta = temps[-1] - temps[0]
+    else:
+        if len(weather_data_list) < 2:
+            return None
+        delta = weather_data_list[-1]['temperature'] - weather_data_list[0]['temperature']
+    return Trend.WARMING if delta > 0 else Trend.COOLING if delta < 0 else Trend.STABLE
+
+def analyze_trends_batch(temps_2d):
+    """Analyze trends for many cities at once.
+
+    Args:
+        temps_2d: array of shape (cities, readings)
+    Returns:
+        int8 array of Trend values, one per city
+    """
+    temps_2d = np.asarray(temps_2d)
+    return np.sign(temps_2d[:, -1] - temps_2d[:, 0]).astype(np.int8)
@@ -5,6 +5,7 @@ import ttkbootstrap as tb
 from ttkbootstrap.constants import LEFT, RIGHT, BOTH, X, Y, TOP, BOTTOM
 from datetime import datetime
 from core.icon_manager import get_icon_manager
+from core.forecast_card import ForecastCard, precompute_day_labels
 
 class ForecastDisplayComponent:
     """Handles displaying 7-day weather forecast (starting from tomorrow)"""
@@ -13,6 +14,10 @@ class ForecastDisplayComponent:
         self.parent = parent
         self.forecast_data = None
         self.forecast_cards = []
+        self.cards_container = None
+        self._shown_cards = 0  # Leading cards currently gridded
+        # Shared process-wide manager; looked up once instead of every refresh
+        self._icon_manager = get_icon_manager()
         
     def setup_component(self):
         """Create the forecast display section"""
@@ -49,50 +54,67 @@ class ForecastDisplayComponent:
         placeholder.pack(pady=40, expand=True)
     
     def update_forecast_display(self, forecast_data):
-        """Update the forecast display with new data"""
+        """Update the forecast display with new data, reusing existing cards"""
         self.forecast_data = forecast_data
         
-        # Clear existing forecast cards
-        for widget in self.forecast_cards_frame.winfo_children():
-            widget.destroy()
-        self.forecast_cards.clear()
-        
         if not forecast_data:
-            self.show_placeholder()
+            self.clear_forecast()
             return
         
-        # Create forecast cards with uniform grid layout
-        from core.forecast_card import create_forecast_card_tk
-        icon_manager = get_icon_manager()
+        if self.cards_container is None:
+            # Replace the placeholder with a container that uses grid for equal sizing
+            self._reset_cards_frame()
+            self.cards_container = tb.Frame(self.forecast_cards_frame)
+            self.cards_container.pack(expand=True, fill="both", padx=10, pady=10)
+            
+            # Configure all columns to have equal weight (uniform sizing);
+            # a tuple index configures all seven in a single Tcl call
+            self.cards_container.grid_columnconfigure(
+                tuple(range(7)), weight=1, uniform="forecast_cards"
+            )
+            
+            # Configure row to expand vertically
+            self.cards_container.grid_rowconfigure(0, weight=1)
         
-        # Create a container frame that uses grid for equal sizing
-        cards_container = tb.Frame(self.forecast_cards_frame)
-        cards_container.pack(expand=True, fill="both", padx=10, pady=10)
+        icon_manager = self._icon_manager
+        days = forecast_data[:7]  # Show 7 days starting from tomorrow
+        day_labels = precompute_day_labels(days)
         
-        # Create forecast cards using grid for equal distribution
-        for i, day_data in enumerate(forecast_data[:7]):  # Show 7 days starting from tomorrow
-            card = create_forecast_card_tk(cards_container, day_data, i, icon_manager, style='main')
-            # Use grid with equal weight for all columns
-            card.grid(row=0, column=i, padx=2, pady=5, sticky="nsew")
-            self.forecast_cards.append(card)
+        # Update cards in place, creating only the ones that don't exist yet
+        for i, day_data in enumerate(days):
+            if i < len(self.forecast_cards):
+                card = self.forecast_cards[i]
+                if i >= self._shown_cards:
+                    card.frame.grid()  # Restore the grid options kept by grid_remove
+            else:
+                card = ForecastCard(self.cards_container, style='main')
+                self.forecast_cards.append(card)
+                # Use grid with equal weight for all columns
+                card.frame.grid(row=0, column=i, padx=2, pady=5, sticky="nsew")
+            card.update(day_data, i, icon_manager, day_text=day_labels[i])
         
-        # Configure all columns to have equal weight (uniform sizing)
-        for i in range(7):
-            cards_container.grid_columnconfigure(i, weight=1, uniform="forecast_cards")
-        
-        # Configure row to expand vertically
-        cards_container.grid_rowconfigure(0, weight=1)
+        # Hide cards left over from a longer forecast
+        for card in self.forecast_cards[len(days):self._shown_cards]:
+            card.frame.grid_remove()
+        self._shown_cards = len(days)
     
     def create_forecast_card(self, day_data, index):
         """(Deprecated: replaced by create_forecast_card_tk)"""
         pass
     
+    def _reset_cards_frame(self):
+        """Swap in an empty cards frame; Tk tears down the old subtree in one destroy"""
+        old_frame = self.forecast_cards_frame
+        self.forecast_cards_frame = tb.Frame(self.forecast_frame)
+        self.forecast_cards_frame.pack(fill=BOTH, expand=True, padx=10, pady=10, before=old_frame)
+        old_frame.destroy()
+        self.forecast_cards.clear()
+        self.cards_container = None
+        self._shown_cards = 0
+    
     def clear_forecast(self):
         """Clear the forecast display"""
-        for widget in self.forecast_cards_frame.winfo_children():
-            widget.destroy()
-        self.forecast_cards.clear()
-        
+        self._reset_cards_frame()
         self.show_placeholder()
 
 def restyle(self):
@@ -3,10 +3,23 @@
 import logging
 import ttkbootstrap as tb
 from core.data_handler import WeatherDataHandler
+from core.details_row_utils import set_label_text
 from core.state_utils import normalize_state_abbreviation
 
+# Fixed row height of a saved city card on the list canvas, in pixels
+_CARD_HEIGHT = 56
+_CARD_GAP = 10  # Vertical space left between neighbouring cards
+_VISIBLE_ROWS = 6  # Requested canvas height, in rows
+# Bind tag shared by the canvas and every card so the wheel scrolls over cards too
+_WHEEL_TAG = "SavedCitiesWheel"
+
 class SavedCitiesComponent:
-    """Handles displaying and managing saved cities using ttkbootstrap widgets."""
+    """Handles displaying and managing saved cities using ttkbootstrap widgets.
+
+    The list is virtualized: cards sit on a canvas at fixed row offsets and
+    only rows inside the viewport own a card. Cards scrolled out of view go
+    back to a pool and are rebound to other cities instead of being rebuilt.
+    """
 
     def __init__(self, parent, data_directory=None):
         self.parent = parent
@@ -16,6 +29,11 @@ class SavedCitiesComponent:
         # Use the same data directory as the main app if provided
         self.data_handler = WeatherDataHandler(data_directory=data_directory or "data")
         self.forecast_items = {}  # Store forecast widgets by city
+        self._cities = []  # Saved cities in display order
+        self._visible_cards = {}  # Row index -> card currently showing that row
+        self._card_pool = []  # Hidden cards ready to be rebound to another row
+        self._list_shown = None  # Neither the list nor the empty message is packed yet
+        self.no_cities_label = None  # Built the first time an empty list is shown
 
     def setup_component(self):
         """Create the saved cities section."""
@@ -31,16 +49,25 @@ class SavedCitiesComponent:
 
         # Scrollable frame for cities list
         self.cities_list_frame = tb.Frame(self.cities_frame)
-        self.cities_list_frame.pack(fill="x", padx=20, pady=10)
+        self.cities_list_frame.pack(fill="both", expand=True, padx=20, pady=10)
 
-        # No cities message (initially shown)
-        self.no_cities_label = tb.Label(
+        # Canvas holding one window item per visible card, scrolled a row at a time
+        self.cities_canvas = tb.Canvas(
             self.cities_list_frame,
-            text="No saved cities yet.\nGet weather for a city and click '💾 Save City' to add it here!",
-            font=("Helvetica Neue", 14),
-            justify="center"
+            height=_CARD_HEIGHT * _VISIBLE_ROWS,
+            highlightthickness=0,
+            yscrollincrement=_CARD_HEIGHT
+        )
+        self.cities_scrollbar = tb.Scrollbar(
+            self.cities_list_frame,
+            orient="vertical",
+            command=self.cities_canvas.yview
         )
-        self.no_cities_label.pack(pady=40)
+        self.cities_canvas.configure(yscrollcommand=self._on_canvas_scroll)
+        self.cities_canvas.bind("<Configure>", self._on_canvas_configure)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.cities_canvas.bind_class(_WHEEL_TAG, sequence, self._on_mousewheel)
+        self._add_wheel_tag(self.cities_canvas)
 
         # Separator- do i want the background to be light gray? or I could use a ttk.Frame as a vertical separator
         # This will visually separate the title from the cities list
@@ -50,6 +77,15 @@ class SavedCitiesComponent:
 
         return self.cities_frame
 
+    def _create_no_cities_label(self):
+        """Create the empty-list message inside the cities list frame"""
+        self.no_cities_label = tb.Label(
+            self.cities_list_frame,
+            text="No saved cities yet.\nGet weather for a city and click '💾 Save City' to add it here!",
+            font=("Helvetica Neue", 14),
+            justify="center"
+        )
+
     def set_weather_callback(self, callback):
         """Set the callback for when a city is selected"""
         self.weather_callback = callback
@@ -58,48 +94,137 @@ class SavedCitiesComponent:
         """Update the display with the provided cities list"""
         self.logger.info(f"Updating cities list with {len(cities)} cities")
         
-        # Clear existing city widgets
-        for widget in self.cities_list_frame.winfo_children():
-            widget.destroy()
-
-        if not cities:
+        cities = list(cities)
+        if cities == self._cities and self._list_shown == bool(cities):
+            self.logger.debug("Saved cities unchanged; keeping the current list")
+            return
+        self._cities = cities
+        if not self._cities:
             self.logger.debug("No cities to display")
-            # Show no cities message
-            self.no_cities_label = tb.Label(
-                self.cities_list_frame,
-                text="No saved cities yet.\nGet weather for a city and click '💾 Save City' to add it here!",
-                font=("Helvetica Neue", 14),
-                justify="center"
-            )
-            self.no_cities_label.pack(pady=40)
         else:
-            self.logger.debug(f"Displaying {len(cities)} cities")
-            # Create city cards
-            for city_data in cities:
-                self._create_city_card(city_data)
-
-    def _create_city_card(self, city_data):
-        """Create a card for a saved city"""
-        # Create card frame
-        card = tb.Frame(self.cities_list_frame)
-        card.pack(fill="x", padx=10, pady=5)
-
-        # City info
-        city_name = f"{city_data.get('city')}"
-        if city_data.get('state'):
-            city_name += f", {city_data.get('state')}"
-        if city_data.get('country') and city_data.get('country') != 'US':
-            city_name += f", {city_data.get('country')}"
-
-        city_label = tb.Label(
+            self.logger.debug(f"Displaying {len(self._cities)} cities")
+        self._show_list(bool(self._cities))
+        
+        # The scroll region covers every row; widgets exist only for visible ones
+        self.cities_canvas.configure(scrollregion=(0, 0, 0, _CARD_HEIGHT * len(self._cities)))
+        self._render_visible()
+
+    def _remove_city(self, city_data):
+        """Drop one city from the in-memory list and re-render without reloading"""
+        key = self._city_key(city_data)
+        for index, saved in enumerate(self._cities):
+            if self._city_key(saved) == key:
+                break
+        else:
+            return
+        # Rows below shift up; _render_visible rebinds only the cards that changed
+        self.update_cities_list(self._cities[:index] + self._cities[index + 1:])
+
+    def _show_list(self, show):
+        """Toggle between the cities canvas and the no cities message"""
+        if show == self._list_shown:
+            return
+        self._list_shown = show
+        if show:
+            if self.no_cities_label is not None:
+                self.no_cities_label.pack_forget()
+            self.cities_scrollbar.pack(side="right", fill="y")
+            self.cities_canvas.pack(side="left", fill="both", expand=True)
+        else:
+            self.cities_canvas.pack_forget()
+            self.cities_scrollbar.pack_forget()
+            # Show no cities message, building it only if the list was ever empty
+            if self.no_cities_label is None:
+                self._create_no_cities_label()
+            self.no_cities_label.pack(pady=40)
+
+    def _render_visible(self):
+        """Give each row inside the viewport a card, recycling rows that left it"""
+        canvas = self.cities_canvas
+        top = canvas.canvasy(0)
+        first = max(0, int(top // _CARD_HEIGHT))
+        last = min(len(self._cities), int((top + canvas.winfo_height()) // _CARD_HEIGHT) + 1)
+        
+        # Hide cards whose rows scrolled out of view (or no longer exist)
+        for row in [row for row in self._visible_cards if not first <= row < last]:
+            card = self._visible_cards.pop(row)
+            canvas.itemconfigure(card.window, state="hidden")
+            self._card_pool.append(card)
+        
+        for row in range(first, last):
+            card = self._visible_cards.get(row)
+            if card is None:
+                card = self._card_pool.pop() if self._card_pool else self._create_city_card()
+                self._visible_cards[row] = card
+                canvas.coords(card.window, 0, row * _CARD_HEIGHT)
+                canvas.itemconfigure(card.window, state="normal")
+            city_data = self._cities[row]
+            # Reloaded lists hold fresh dicts; rebind only rows whose content changed
+            if card.city_data != city_data:
+                self._bind_card(card, city_data)
+
+    def _bind_card(self, card, city_data):
+        """Point a card at a saved city; its buttons read card.city_data when pressed"""
+        card.city_data = city_data
+        set_label_text(card.city_label, self._format_city_name(*self._city_key(city_data)))
+
+    def _on_canvas_scroll(self, first, last):
+        """Keep the scrollbar in sync and render the rows that came into view"""
+        self.cities_scrollbar.set(first, last)
+        self._render_visible()
+
+    def _on_canvas_configure(self, event):
+        """Stretch cards to the canvas width and fill a taller viewport"""
+        for card in list(self._visible_cards.values()) + self._card_pool:
+            self.cities_canvas.itemconfigure(card.window, width=event.width)
+        self._render_visible()
+
+    def _on_mousewheel(self, event):
+        """Scroll the cities list by one row per wheel notch"""
+        step = 1 if event.num == 5 or event.delta < 0 else -1
+        self.cities_canvas.yview_scroll(step, "units")
+
+    @staticmethod
+    def _add_wheel_tag(widget):
+        """Route mouse wheel events over widget to the cities list"""
+        widget.bindtags((_WHEEL_TAG,) + widget.bindtags())
+
+    @staticmethod
+    def _city_key(city_data):
+        """Identity of a saved city"""
+        return (city_data.get('city'), city_data.get('state'), city_data.get('country'))
+
+    @staticmethod
+    def _format_city_name(city, state, country):
+        """Display name for a saved city card"""
+        parts = [f"{city}"]
+        if state:
+            parts.append(state)
+        if country and country != 'US':
+            parts.append(country)
+        return ", ".join(parts)
+
+    def _create_city_card(self):
+        """
+        Create an unbound city card on the list canvas
+        
+        Returns:
+            Frame: the card, with city_label and window (canvas item id) attributes;
+            _bind_card fills in the city it shows
+        """
+        card = tb.Frame(self.cities_canvas)
+        card.city_data = None
+
+        card.city_label = tb.Label(
             card,
-            text=city_name,
+            text="",
             font=("Helvetica Neue", 14, "bold")
         )
-        city_label.pack(side="left", padx=10, pady=5)
+        card.city_label.pack(side="left", padx=10, pady=5)
 
         # Get Weather button
         def get_weather():
+            city_data = card.city_data
             if self.weather_callback:
                 state = normalize_state_abbreviation(city_data.get('state', ''))
                 self.weather_callback(
@@ -121,6 +246,7 @@ class SavedCitiesComponent:
         def get_history():
             from core.historical_coordinator import HistoricalDataCoordinator
             
+            city_data = card.city_data
             try:
                 coordinator = HistoricalDataCoordinator()
                 state = normalize_state_abbreviation(city_data.get('state', ''))
@@ -186,14 +312,13 @@ class SavedCitiesComponent:
 
         # Delete button
         def delete_city():
-            self.data_handler.delete_city(
-                city_data.get('city'),
-                city_data.get('state'),
-                city_data.get('country')
-            )
-            # Refresh the list after deletion
-            saved_cities = self.data_handler.load_saved_cities()
-            self.update_cities_list(saved_cities)
+            city_data = card.city_data
+            if self.data_handler.delete_city(*self._city_key(city_data)):
+                # The database only lost this row, so skip re-reading the others
+                self._remove_city(city_data)
+            else:
+                # Nothing was deleted; resync with what the database really holds
+                self.update_cities_list(self.data_handler.load_saved_cities())
 
         delete_btn = tb.Button(
             card,
@@ -203,6 +328,18 @@ class SavedCitiesComponent:
             bootstyle="danger-outline"
         )
         delete_btn.pack(side="right", padx=5, pady=5)
+        
+        for widget in (card, card.city_label, weather_btn, history_btn, delete_btn):
+            self._add_wheel_tag(widget)
+        card.window = self.cities_canvas.create_window(
+            0, 0,
+            window=card,
+            anchor="nw",
+            width=self.cities_canvas.winfo_width(),
+            height=_CARD_HEIGHT - _CARD_GAP,
+            state="hidden"
+        )
+        return card
 
     def restyle(self):
         """Force a style refresh for saved cities widgets."""
@@ -1,6 +1,7 @@
 """Theme toggle component for the weather dashboard"""
 
 import logging
+import time
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 import tkinter as tk
@@ -12,11 +13,21 @@ from core.utils import (
     get_auto_theme,
     UserSettingsManager,
 )
-from core.custom_themes import register_custom_themes
+from core.auto_theme import get_auto_theme as get_auto_theme_coords
+from core.custom_themes import register_custom_themes, get_fallback_theme
 from core.location_service import LocationService
 
 logger = logging.getLogger(__name__)
 
+# Themes that use the light toggle state, and the stock ones among them
+_LIGHT_THEMES = frozenset(("aj_lightly", "pulse", "flatly", "litera", "minty", "lumen"))
+_FALLBACK_LIGHT = frozenset(("pulse", "flatly", "litera", "minty", "lumen"))
+
+# Seconds an auto theme decision is reused; the sun barely moves in between
+_AUTO_THEME_TTL = 600
+# Refresh requests arriving within this many ms collapse into the last one
+_REFRESH_DEBOUNCE_MS = 250
+
 
 class ThemeComponent:
     """Handles theme switching functionality with optional auto day/night mode."""
@@ -25,27 +36,29 @@ class ThemeComponent:
         self.parent = parent
         self.current_theme = current_theme
         self.location_service = LocationService()
+        # Location key (None for IP lookup) -> (monotonic time, auto theme)
+        self._auto_theme_cache = {}
+        self._pending_refresh = None  # after() id of the queued auto refresh
 
         # Register custom themes first
         register_custom_themes()
 
-        from core.custom_themes import get_fallback_theme
+        # Style lookup walks Tcl for the root style, so do it once and reuse it
+        self._style = tb.Style()
 
         try:
             # Attempt to apply the theme before building any widgets
-            style = tb.Style()
-            style.theme_use(self.current_theme)
+            self._style.theme_use(self.current_theme)
 
         except Exception as e:
             fallback = get_fallback_theme(self.current_theme)
             logging.warning(f"Falling back to default theme: {fallback} due to error: {e}")
-            style = tb.Style()
-            style.theme_use(fallback)
+            self._style.theme_use(fallback)
             self.current_theme = fallback
 
 
         # ✅ Confirm themes are loaded AFTER registration and before widget creation
-        print("Available themes:", style.theme_names())
+        logger.debug("Available themes: %s", self._style.theme_names())
 
 
         # Load auto theme settings
@@ -55,14 +68,7 @@ class ThemeComponent:
         self.auto_mode_var = tb.BooleanVar(value=self.auto_mode)
 
         # Determine if the current theme is light
-        self.is_light_theme = current_theme in [
-            "aj_lightly",
-            "pulse",
-            "flatly",
-            "litera",
-            "minty",
-            "lumen",
-        ]
+        self.is_light_theme = current_theme in _LIGHT_THEMES
         self.theme_var = tb.BooleanVar(value=self.is_light_theme)
 
         self.setup_component()
@@ -104,6 +110,7 @@ class ThemeComponent:
         """Toggle auto day/night mode on or off."""
         self.auto_mode = self.auto_mode_var.get()
         save_auto_theme_settings(self.auto_mode, self.light_theme, self.dark_theme)
+        self._auto_theme_cache.clear()  # Settings changed; decide afresh
         self.update_ui_state()
 
         if self.auto_mode:
@@ -127,29 +134,33 @@ class ThemeComponent:
         """Apply theme automatically based on location and time."""
         try:
             if latitude is not None and longitude is not None:
-                from core.auto_theme import get_auto_theme as get_auto_theme_coords
-
+                # ~1 km grid: nearby refreshes share a decision
+                cache_key = (round(latitude, 2), round(longitude, 2))
+            else:
+                cache_key = None
+            
+            now = time.monotonic()
+            cached = self._auto_theme_cache.get(cache_key)
+            if cached is not None and now - cached[0] < _AUTO_THEME_TTL:
+                auto_theme = cached[1]
+                logger.debug(f"Reusing auto theme decision: {auto_theme}")
+            elif cache_key is not None:
                 auto_theme = get_auto_theme_coords(latitude, longitude)
                 logger.info(
                     f"Using specific location for auto theme: {latitude}, {longitude}"
                 )
+                self._auto_theme_cache[cache_key] = (now, auto_theme)
             else:
                 auto_theme = get_auto_theme()
                 logger.info("Using IP location for auto theme")
+                self._auto_theme_cache[cache_key] = (now, auto_theme)
 
             if auto_theme != self.current_theme:
                 self.current_theme = auto_theme
                 self.apply_theme(auto_theme)
 
                 # Update manual toggle to reflect new theme
-                self.is_light_theme = auto_theme in [
-                    "aj_lightly",
-                    "pulse",
-                    "flatly",
-                    "litera",
-                    "minty",
-                    "lumen",
-                ]
+                self.is_light_theme = auto_theme in _LIGHT_THEMES
                 self.theme_var.set(self.is_light_theme)
 
                 logger.info(f"Auto theme applied: {auto_theme}")
@@ -170,25 +181,23 @@ class ThemeComponent:
 
     def apply_theme(self, theme_name: str):
         """Apply the specified theme with fallbacks."""
+        # Compare with the live theme (it may also be switched elsewhere); re-applying
+        # the active one would only set off a full restyle for nothing
+        if theme_name == self._style.theme_use():
+            logger.debug(f"Theme already active: {theme_name}")
+            return
+
         try:
-            style = tb.Style()
-            style.theme_use(theme_name)
+            self._style.theme_use(theme_name)
             logger.debug(f"Applied theme: {theme_name}")
             self.parent.update_idletasks()  # Force UI refresh
 
 
         except Exception as e:
             logger.error(f"Failed to apply theme {theme_name}: {e}")
-            fallback_theme = "pulse" if theme_name in [
-                "pulse",
-                "flatly",
-                "litera",
-                "minty",
-                "lumen",
-            ] else "darkly"
+            fallback_theme = "pulse" if theme_name in _FALLBACK_LIGHT else "darkly"
             try:
-                style = tb.Style()
-                style.theme_use(fallback_theme)
+                self._style.theme_use(fallback_theme)
                 self.current_theme = fallback_theme
                 logger.info(f"Fell back to theme: {fallback_theme}")
                 self.parent.update_idletasks()
@@ -204,7 +213,21 @@ class ThemeComponent:
             self.parent.restyle_all_components()
 
     def refresh_auto_theme(self, latitude=None, longitude=None):
-        """Refresh auto theme if auto mode is active."""
+        """Refresh auto theme if auto mode is active.
+
+        Calls are debounced: a burst of refreshes runs once, with the last arguments.
+        """
+        if not self.auto_mode:
+            return
+        if self._pending_refresh is not None:
+            self.parent.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.parent.after(
+            _REFRESH_DEBOUNCE_MS, self._run_auto_theme_refresh, latitude, longitude
+        )
+
+    def _run_auto_theme_refresh(self, latitude, longitude):
+        """Run the debounced auto theme refresh."""
+        self._pending_refresh = None
         if self.auto_mode:
             self.apply_auto_theme(latitude, longitude)
 
@@ -216,18 +239,12 @@ class ThemeComponent:
         self.auto_mode = False
         self.auto_mode_var.set(False)
         save_auto_theme_settings(self.auto_mode, self.light_theme, self.dark_theme)
+        self._auto_theme_cache.clear()
         self.current_theme = theme_name
         self.apply_theme(theme_name)
         save_user_theme(theme_name)
         self.update_ui_state()
-        self.is_light_theme = theme_name in [
-            "aj_lightly",
-            "pulse",
-            "flatly",
-            "litera",
-            "minty",
-            "lumen",
-        ]
+        self.is_light_theme = theme_name in _LIGHT_THEMES
         self.theme_var.set(self.is_light_theme)
         logger.info(f"Manual theme set to: {theme_name} (auto mode disabled)")
 
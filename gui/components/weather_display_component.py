@@ -1,10 +1,14 @@
 """Weather display component for showing current weather"""
 
 import logging
+from tkinter import TclError
 import ttkbootstrap as tb
 from ttkbootstrap.constants import LEFT, RIGHT, BOTH, X, Y, END
 from core.icon_manager import get_weather_icon
 from core.weather_utils import parse_weather_data
+from core.details_row_utils import set_label_text, update_weather_details_row
+from core.save_city_utils import create_save_city_button
+from core.unit_label_utils import get_unit_label, get_wind_unit_label
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +18,11 @@ class WeatherDisplayComponent:
     def __init__(self, parent):
         self.parent = parent
         self.current_weather_data = None
+        # Packing state of the save button and details row, so updates skip re-packing
+        self._row_visible = False
+        self._save_btn_side = None
+        # Inputs behind the icon/description text last written by update_weather_display
+        self._last_desc_key = None
         self.setup_component()
     
     def setup_component(self):
@@ -40,7 +49,6 @@ class WeatherDisplayComponent:
         self.weather_desc_label.pack(side=LEFT)
         
         # Save city button (initially hidden)
-        from core.save_city_utils import create_save_city_button
         self.save_city_btn = create_save_city_button(
             desc_frame,
             city_data=None,  # Will be set when weather is loaded
@@ -76,7 +84,6 @@ class WeatherDisplayComponent:
             temp_unit: 'imperial', 'metric', or 'kelvin'
         """
         logger.debug("update_weather_display called with weather_data: %s", weather_data)
-        from core.unit_label_utils import get_unit_label, get_wind_unit_label
         unit_label = get_unit_label(temp_unit)
         wind_unit_label = get_wind_unit_label(temp_unit)
         if "error" in weather_data:
@@ -91,28 +98,33 @@ class WeatherDisplayComponent:
         parsed = parse_weather_data(weather_data, unit_label)
         logger.debug("Parsed weather data: %s", parsed)
         
-        # Update emoji using IconManager
-        emoji = get_weather_icon(parsed['description'])
-        self.weather_icon_label.config(text=emoji)
+        # Identical polls leave the icon and description as they are: skip
+        # building their strings and the Tk calls entirely
+        # (keyed on the rounded temperature that is actually shown)
+        description, temp = parsed['description'], parsed['temp']
+        temp_display = f"{round(temp)}" if temp != "N/A" and temp is not None else "N/A"
+        desc_key = (description, temp_display, parsed['city'], parsed['unit_label'])
+        if desc_key != self._last_desc_key:
+            # Work out every string before touching a widget, so the Tk calls below
+            # run back to back and land in one geometry pass
+            emoji = get_weather_icon(description)
+            title = description.title() if description != 'N/A' else 'Unknown'
+            desc_text = f"{title} | {temp_display}{parsed['unit_label']}\n{parsed['city']}"
+            
+            # Update emoji and main description
+            set_label_text(self.weather_icon_label, emoji)
+            set_label_text(self.weather_desc_label, desc_text)
+            self._last_desc_key = desc_key
         
-        # Update main description
-        temp_display = f"{round(parsed['temp'])}" if parsed['temp'] != "N/A" and parsed['temp'] is not None else "N/A"
-        self.weather_desc_label.config(
-            text=f"{parsed['description'].title() if parsed['description'] != 'N/A' else 'Unknown'} | {temp_display}{parsed['unit_label']}\n{parsed['city']}"
-        )
+        # Update details
+        parsed['wind_unit_label'] = wind_unit_label
+        update_weather_details_row(self.humidity_label, self.pressure_label, self.wind_label, parsed)
         
         # Update save_city_btn city_data - make sure we're using the proper city name from API response
         self.save_city_btn.city_data = weather_data
         
-        # Show save button
-        self.save_city_btn.pack(side=LEFT, padx=10)
-        
-        # Update details
-        from core.details_row_utils import update_weather_details_row
-        update_weather_details_row(self.humidity_label, self.pressure_label, self.wind_label, {**parsed, 'wind_unit_label': wind_unit_label})
-        self.humidity_label.pack(side=LEFT, padx=10)
-        self.pressure_label.pack(side=LEFT, padx=10)
-        self.wind_label.pack(side=LEFT, padx=10)
+        # Show save button and details row
+        self._show_details_row(save_side=LEFT)
     
     def update_display(self, weather_data):
         """Update the weather display with new data"""
@@ -129,6 +141,7 @@ class WeatherDisplayComponent:
             description = weather_data.get('weather_description', '').title()
             emoji = get_weather_icon(description)
             self.weather_icon_label.configure(text=emoji)
+            self._last_desc_key = None
 
             # Format temperature
             temp = weather_data.get('temperature')
@@ -150,27 +163,43 @@ class WeatherDisplayComponent:
             wind_speed = weather_data.get('wind_speed', 'N/A')
 
             self.humidity_label.configure(text=f"💧 Humidity: {humidity}%")
-            self.humidity_label.pack(side=LEFT, padx=10)
-
             self.pressure_label.configure(text=f"⭕ Pressure: {pressure} hPa")
-            self.pressure_label.pack(side=LEFT, padx=10)
-
             self.wind_label.configure(text=f"💨 Wind: {wind_speed} mph")
-            self.wind_label.pack(side=LEFT, padx=10)
 
             # Update save_city_btn city_data
             self.save_city_btn.city_data = weather_data
 
-            # Show save button
-            self.save_city_btn.pack(side=RIGHT, padx=10)
+            # Show save button and details row
+            self._show_details_row(save_side=RIGHT)
 
         except Exception as e:
             self.logger.error(f"Error updating weather display: {str(e)}")
             self.show_error("Failed to update weather display")
 
+    def _show_details_row(self, save_side):
+        """Pack the save button and details labels unless they are already shown"""
+        if self._save_btn_side != save_side:
+            self.save_city_btn.pack(side=save_side, padx=10)
+            self._save_btn_side = save_side
+        if not self._row_visible:
+            self.humidity_label.pack(side=LEFT, padx=10)
+            self.pressure_label.pack(side=LEFT, padx=10)
+            self.wind_label.pack(side=LEFT, padx=10)
+            self._row_visible = True
+    
+    def _hide_details_row(self):
+        """Hide the save button and details labels"""
+        self.save_city_btn.pack_forget()
+        self.humidity_label.pack_forget()
+        self.pressure_label.pack_forget()
+        self.wind_label.pack_forget()
+        self._row_visible = False
+        self._save_btn_side = None
+    
     def show_error(self, error_message):
         """Display an error message"""
         self.weather_icon_label.config(text="❌")
+        self._last_desc_key = None
         
         # Check for specific error messages and make them more user-friendly
         if error_message == "City not found" or "not found" in error_message.lower():
@@ -185,22 +214,17 @@ class WeatherDisplayComponent:
         self.weather_desc_label.config(text=f"Error: {display_message}")
         
         # Hide save button and details
-        self.save_city_btn.pack_forget()
-        self.humidity_label.pack_forget()
-        self.pressure_label.pack_forget()
-        self.wind_label.pack_forget()
+        self._hide_details_row()
     
     def clear_display(self):
         """Clear the weather display"""
         self.weather_icon_label.config(text="🌡️")
         self.weather_desc_label.config(text="Enter a city to get weather data")
+        self._last_desc_key = None
         self.current_weather_data = None
         
         # Hide save button and details
-        self.save_city_btn.pack_forget()
-        self.humidity_label.pack_forget()
-        self.pressure_label.pack_forget()
-        self.wind_label.pack_forget()
+        self._hide_details_row()
     
     def on_save_city(self, city_data=None):
         """Handle save city button click"""
@@ -220,12 +244,10 @@ class WeatherDisplayComponent:
         """Show loading spinner/indicator"""
         self.weather_icon_label.config(text="⏳")
         self.weather_desc_label.config(text="Loading weather data...")
+        self._last_desc_key = None
         
         # Hide save button and details during loading
-        self.save_city_btn.pack_forget()
-        self.humidity_label.pack_forget()
-        self.pressure_label.pack_forget()
-        self.wind_label.pack_forget()
+        self._hide_details_row()
         
         # Start the progress bar animation
         self.progress_bar.pack(fill=X, padx=10, pady=5)
@@ -241,20 +263,22 @@ class WeatherDisplayComponent:
         # The update_weather_display method will override these if data is available
         self.weather_icon_label.config(text="🌡️")
         self.weather_desc_label.config(text="Enter a city to get weather data")
+        self._last_desc_key = None
 
     def restyle(self):
         try:
-            def refresh_widget(widget):
-                try:
-                    widget.configure()
-                except:
-                    pass
-                for child in widget.winfo_children():
-                    refresh_widget(child)
-
             if hasattr(self, "display_frame"):
                 self.display_frame.update_idletasks()
-                refresh_widget(self.display_frame)
+                # Walk the widget tree with an explicit stack instead of recursion
+                stack = [self.display_frame]
+                pop, extend = stack.pop, stack.extend
+                while stack:
+                    widget = pop()
+                    try:
+                        widget.configure()
+                    except TclError:
+                        pass  # Some widgets may not support configure()
+                    extend(widget.winfo_children())
 
             self.logger.info("WeatherDisplayComponent restyled.")
         except Exception as e:
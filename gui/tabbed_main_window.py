@@ -11,6 +11,7 @@ import threading
 from core.state_utils import normalize_state_abbreviation
 import time
 from datetime import datetime
+from functools import lru_cache
 from ttkbootstrap.constants import LEFT, RIGHT, BOTH, X, Y, END
 from ttkbootstrap.dialogs import Messagebox
 from core.utils import load_user_theme
@@ -19,6 +20,14 @@ from core.data_handler import WeatherDataHandler
 from core.custom_themes import register_custom_themes, get_fallback_theme
 from gui.components import ThemeComponent, WeatherInputComponent, WeatherDisplayComponent, SavedCitiesComponent, ForecastDisplayComponent
 
+@lru_cache(maxsize=512)
+def _format_history_time(timestamp):
+    """Format a stored ISO timestamp for the history table, memoized across reloads"""
+    try:
+        return datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+    except (ValueError, TypeError):
+        return timestamp
+
 class TabbedWeatherDashboard:
     """Advanced tabbed GUI with components and additional features"""
 
@@ -540,11 +549,7 @@ class TabbedWeatherDashboard:
                 # Add items to treeview
                 for item in history_data:
                     # Convert timestamp to local time
-                    try:
-                        timestamp = datetime.fromisoformat(item['timestamp'])
-                        formatted_time = timestamp.strftime('%Y-%m-%d %H:%M:%S')
-                    except (ValueError, TypeError):
-                        formatted_time = item['timestamp']
+                    formatted_time = _format_history_time(item['timestamp'])
 
                     # Format temperature
                     try:
@@ -666,6 +671,6 @@ class TabbedWeatherDashboard:
             self.logger.info("Cleaning up resources...")
             self.stop_auto_theme_refresh()  # Stop auto theme thread
             try:
-                self.data_handler.db.get_connection().close()  # Close database connection
+                self.data_handler.db.close()  # Close cached database connection
             except Exception as e:
                 self.logger.error(f"Error closing database connection: {str(e)}")
@@ -0,0 +1,103 @@
+"""Unit tests for the temperature charts"""
+
+import unittest
+from unittest.mock import patch
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import features.charts
+from features.charts import TemperatureChart, TkLineChart, generate_temperature_chart
+
+
+def _readings(*temps):
+    """Build weather entries holding the given temperatures"""
+    return [{"temperature": temp, "timestamp": f"2024-01-0{i + 1}T12:00:00"}
+            for i, temp in enumerate(temps)]
+
+
+class TestTkLineChart(unittest.TestCase):
+    """Test suite for the Tk canvas line chart"""
+
+    def setUp(self):
+        """Build the chart on a mocked Canvas so no display is needed"""
+        patcher = patch("features.charts.tk.Canvas")
+        self.canvas_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.canvas = self.canvas_cls.return_value
+        self.canvas.create_line.return_value = "line-1"
+        self.chart = TkLineChart(None, width=100, height=80, pad=10)
+
+    def test_second_update_moves_the_line(self):
+        """Test the line is created once and later updates only move its points"""
+        self.chart.update(_readings(50.0, 60.0), "Denver")
+        self.canvas.create_line.assert_called_once_with(10.0, 70.0, 90.0, 10.0, width=2)
+
+        self.chart.update(_readings(60.0, 50.1, 50.0), "Denver")
+
+        self.canvas.create_line.assert_called_once()
+        line, *coords = self.canvas.coords.call_args.args
+        self.assertEqual(line, "line-1")
+        self.assertEqual(coords[0::2], [10.0, 50.0, 90.0])
+        # float64 end to end: 50.1 is not quantized to 50.099998
+        self.assertAlmostEqual(coords[3], 70.0 - 0.1 / 10.0 * 60.0, places=9)
+        self.assertEqual(coords[5], 70.0)
+        self.canvas.itemconfigure.assert_called_with(
+            self.canvas.create_text.return_value, text="Temperature History - Denver"
+        )
+
+    def test_flat_line(self):
+        """Test equal temperatures draw a flat line instead of dividing by zero"""
+        self.chart.update(_readings(55.0, 55.0, 55.0), "Boise")
+
+        coords = self.canvas.create_line.call_args.args
+        self.assertEqual(coords[1::2], (70.0, 70.0, 70.0))
+
+    def test_line_removed_with_too_few_points(self):
+        """Test the line is deleted when fewer than two readings remain"""
+        self.chart.update(_readings(50.0, 60.0), "Reno")
+        self.chart.update(_readings(50.0), "Reno")
+
+        self.canvas.delete.assert_called_once_with("line-1")
+        self.assertIsNone(self.chart._line)
+
+        self.chart.update([], "Reno")
+        self.canvas.delete.assert_called_once()
+
+
+class TestTemperatureChart(unittest.TestCase):
+    """Test suite for the reused matplotlib chart on the Agg backend"""
+
+    def setUp(self):
+        """Start every test without a shared headless chart"""
+        patcher = patch.object(features.charts, "_headless_chart", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_returns_figure(self):
+        """Test the headless chart plots onto an Agg-backed Figure"""
+        fig = generate_temperature_chart(_readings(50.0, 55.0, 53.0), "Denver")
+
+        self.assertIsInstance(fig, Figure)
+        self.assertIsInstance(fig.canvas, FigureCanvasAgg)
+        self.assertEqual(list(fig.axes[0].lines[0].get_ydata()), [50.0, 55.0, 53.0])
+
+    def test_reuses_figure_and_updates_title(self):
+        """Test later calls redraw the same Figure with the new city"""
+        first = generate_temperature_chart(_readings(50.0, 55.0), "Denver")
+        second = generate_temperature_chart(_readings(40.0, 45.0, 41.0), "Boise")
+
+        self.assertIs(first, second)
+        self.assertEqual(second.axes[0].get_title(), "Temperature History - Boise")
+        self.assertEqual(len(second.axes[0].lines), 1)
+
+    def test_empty_history(self):
+        """Test an empty history draws an empty chart instead of raising"""
+        fig = TemperatureChart().update([], "Reno")
+
+        self.assertEqual(len(fig.axes[0].lines[0].get_xdata()), 0)
+        self.assertEqual(fig.axes[0].get_title(), "Temperature History - Reno")
+
+
+if __name__ == '__main__':
+    unittest.main()
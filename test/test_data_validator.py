@@ -0,0 +1,100 @@
+"""Unit tests for the WeatherDataValidator class"""
+
+import unittest
+import json
+import os
+
+from core.data_validator import WeatherDataValidator
+
+
+def load_mock_data(filename):
+    """Helper to load mock data from JSON files"""
+    filepath = os.path.join(os.path.dirname(__file__), "mock_data", filename)
+    with open(filepath, "r") as f:
+        return json.load(f)
+
+
+class TestWeatherDataValidator(unittest.TestCase):
+    """Test suite for the WeatherDataValidator class"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.validator = WeatherDataValidator(temperature_unit="imperial")
+
+    def test_clean_current_weather_success(self):
+        """Test a valid OpenWeatherMap response is cleaned"""
+        result = self.validator.validate_and_clean_current_weather(load_mock_data("weather_success.json"))
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result["city"], "New York")
+        self.assertEqual(result["temperature"], 75.2)
+        self.assertEqual(result["weather_main"], "Clear")
+        self.assertEqual(result["weather_icon"], "01d")
+
+    def test_vocabulary_fields_are_interned(self):
+        """Test weather_main and weather_icon values share one object across records"""
+        first = self.validator.validate_and_clean_current_weather(load_mock_data("weather_success.json"))
+        second = self.validator.validate_and_clean_current_weather(load_mock_data("weather_success.json"))
+
+        self.assertIs(first["weather_main"], second["weather_main"])
+        self.assertIs(first["weather_icon"], second["weather_icon"])
+
+    def test_temperature_out_of_range_rejected(self):
+        """Test out-of-range temperatures fail validation with a diagnostic warning"""
+        raw = load_mock_data("weather_success.json")
+        raw["main"]["temp"] = 500
+
+        with self.assertLogs("core.data_validator", level="WARNING") as logs:
+            result = self.validator.validate_and_clean_current_weather(raw)
+
+        self.assertIsNone(result)
+        self.assertTrue(any("Temperature out of range" in line for line in logs.output))
+
+    def test_humidity_out_of_range_rejected(self):
+        """Test out-of-range humidity fails validation"""
+        raw = load_mock_data("weather_success.json")
+        raw["main"]["humidity"] = 150
+
+        with self.assertLogs("core.data_validator", level="WARNING") as logs:
+            result = self.validator.validate_and_clean_current_weather(raw)
+
+        self.assertIsNone(result)
+        self.assertTrue(any("Humidity out of range" in line for line in logs.output))
+
+    def test_one_call_descriptions_are_titlecased(self):
+        """Test One Call current and daily descriptions are title-cased"""
+        weather = [{"main": "Clouds", "description": "broken clouds", "icon": "04d"}]
+        data = {
+            "current": {"temp": 70.0, "feels_like": 69.0, "weather": weather},
+            "daily": [{"dt": 1700000000, "temp": {"min": 60.0, "max": 75.0}, "weather": weather}],
+        }
+
+        result = self.validator.validate_and_clean_one_call_weather(data)
+
+        self.assertEqual(result["current"]["description"], "Broken Clouds")
+        self.assertEqual(result["forecast"][0]["description"], "Broken Clouds")
+
+    def test_daily_forecast_range_checks(self):
+        """Test forecast days drop invalid temperatures and blank out bad metrics"""
+        weather = [{"main": "Rain", "description": "light rain", "icon": "10d"}]
+        daily = [
+            {"dt": 1, "temp": {"min": 60.0, "max": 75.0}, "weather": weather,
+             "humidity": 250, "pressure": 1013, "wind_speed": 10},
+            {"dt": 2, "temp": {"min": 60.0, "max": 900.0}, "weather": weather},
+        ]
+
+        result = self.validator._extract_and_validate_daily_forecast(daily)
+
+        self.assertEqual(len(result), 1)
+        self.assertIsNone(result[0]["humidity"])
+        self.assertEqual(result[0]["pressure"], 1013)
+        self.assertEqual(result[0]["wind_speed"], 10)
+
+    def test_clean_token_blank_values(self):
+        """Test blank or missing tokens are returned as None"""
+        self.assertIsNone(self.validator._clean_token(None))
+        self.assertIsNone(self.validator._clean_token("   "))
+
+
+if __name__ == "__main__":
+    unittest.main()
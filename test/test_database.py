@@ -0,0 +1,225 @@
+"""Unit tests for the WeatherDatabase class"""
+
+import unittest
+import tempfile
+import os
+
+import pandas as pd
+
+from core.database import HISTORICAL_SOURCE_COLUMNS, SCHEMA_VERSION, WeatherDatabase, encode_api_response, decode_api_response
+
+
+class TestWeatherDatabase(unittest.TestCase):
+    """Test suite for the WeatherDatabase class"""
+
+    def setUp(self):
+        """Create a throwaway database for each test"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = WeatherDatabase(os.path.join(self.temp_dir.name, "weather.db"))
+
+    def tearDown(self):
+        """Remove the throwaway database"""
+        self.db.close()
+        self.temp_dir.cleanup()
+
+    def test_connection_uses_wal_and_pragmas(self):
+        """Test performance PRAGMAs are applied to each connection"""
+        with self.db.get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+            self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 5000)
+
+    def test_history_query_uses_date_index(self):
+        """Test the DATE(timestamp) history lookup is served by the expression index"""
+        with self.db.get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT DATE(timestamp), AVG(temperature) FROM current_weather "
+                "WHERE city = ? AND state = ? AND DATE(timestamp) >= DATE('now', '-7 days') "
+                "GROUP BY DATE(timestamp)",
+                ("Denver", "CO"),
+            ).fetchall()
+
+        self.assertTrue(any("idx_current_city_date" in row[3] for row in plan))
+
+    def test_schema_version_recorded(self):
+        """Test the migration stamps the schema version and is skipped on reopen"""
+        with self.db.get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION)
+
+        with self.assertLogs("core.database", level="DEBUG") as logs:
+            reopened = WeatherDatabase(self.db.db_path)
+        reopened.close()
+
+        self.assertTrue(any("schema is current" in line for line in logs.output))
+
+    def test_connection_is_reused_per_thread(self):
+        """Test the same thread gets the same cached connection back"""
+        with self.db.get_connection() as first:
+            pass
+        with self.db.get_connection() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.db.close()
+        with self.db.get_connection() as third:
+            self.assertIsNot(first, third)
+
+    def test_transaction_rolls_back_on_error(self):
+        """Test a failed write transaction leaves no partial rows behind"""
+        with self.assertRaises(ValueError):
+            with self.db.transaction() as conn:
+                conn.execute("INSERT INTO user_preferences (preference_key, preference_value) VALUES ('a', '1')")
+                raise ValueError("boom")
+
+        self.assertIsNone(self.db.get_user_preference("a"))
+        with self.db.get_connection() as conn:
+            self.assertFalse(conn.in_transaction)
+
+    def test_queued_writes_are_committed_in_background(self):
+        """Test queued writes resolve their futures and a bad write does not drop the others"""
+        sql = "INSERT INTO user_preferences (preference_key, preference_value) VALUES (?, ?)"
+        good = self.db.submit_write(sql, [("units", "metric")])
+        bad = self.db.submit_write("INSERT INTO missing_table VALUES (?)", [(1,)])
+        self.db.flush()
+
+        self.assertTrue(good.result(timeout=5))
+        self.assertIsNotNone(bad.exception(timeout=5))
+        self.assertEqual(self.db.get_user_preference("units"), "metric")
+
+    def test_user_preference_round_trip(self):
+        """Test saving and reading back a user preference"""
+        self.assertTrue(self.db.save_user_preference("theme", "aj_darkly"))
+        self.assertTrue(self.db.save_user_preference("theme", "aj_lightly"))
+
+        self.assertEqual(self.db.get_user_preference("theme"), "aj_lightly")
+        self.assertEqual(self.db.get_user_preference("missing", "default"), "default")
+
+    def test_save_and_get_forecast_data(self):
+        """Test a forecast batch is stored and returned in date order"""
+        forecast = [
+            {"dt": 1700086400, "temp": {"min": 50, "max": 60, "day": 55, "night": 48},
+             "weather": [{"description": "light rain", "main": "Rain", "icon": "10d"}], "pop": 0.4},
+            {"dt": 1700000000, "temp": {"min": 45, "max": 58, "day": 52, "night": 44},
+             "weather": [{"description": "clear sky", "main": "Clear", "icon": "01d"}], "pop": 0.0},
+        ]
+
+        self.assertTrue(self.db.save_forecast_data(forecast, "Denver", "CO"))
+        rows = self.db.get_forecast_data("Denver", "CO")
+
+        self.assertEqual(len(rows), 2)
+        self.assertLess(rows[0]["forecast_date"], rows[1]["forecast_date"])
+        self.assertEqual(rows[0]["weather_main"], "Clear")
+
+    def test_freshness_window_is_bound(self):
+        """Test stale rows are filtered and purged using bound time windows"""
+        with self.db.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO current_weather (city, state, temperature, timestamp) "
+                "VALUES ('Denver', 'CO', 40.0, datetime('now', '-3 hours'))"
+            )
+            conn.commit()
+
+        self.assertIsNone(self.db.get_current_weather("Denver", "CO", max_age_hours=1))
+        self.assertEqual(self.db.get_current_weather("Denver", "CO", max_age_hours=6)["temperature"], 40.0)
+        self.assertTrue(self.db.cleanup_old_data(days_to_keep=0))
+        self.assertIsNone(self.db.get_current_weather("Denver", "CO", max_age_hours=6))
+
+    def test_api_response_round_trip(self):
+        """Test API payloads are stored compressed and decode back, including legacy JSON text"""
+        payload = {"name": "Denver", "main": {"temp": 40.5}, "weather": [{"main": "Snow"}]}
+        encoded = encode_api_response(payload)
+
+        self.assertIsInstance(encoded, (bytes, memoryview))
+        self.assertEqual(decode_api_response(bytes(encoded)), payload)
+        self.assertEqual(decode_api_response('{"legacy": true}'), {"legacy": True})
+        self.assertIsNone(decode_api_response(None))
+
+    def test_cleanup_releases_free_pages(self):
+        """Test incremental auto_vacuum is enabled and cleanup shrinks the freelist"""
+        records = [
+            {"date": f"2000-01-{day:02d}", "temperature_2m_max": 1.0, "temperature_2m_min": 0.0,
+             "temperature_2m_mean": 0.5, "precipitation_sum": 0.0, "rain_sum": 0.0,
+             "wind_speed_10m_max": 0.0, "wind_gusts_10m_max": 0.0, "cloud_cover_mean": 0,
+             "relative_humidity_2m_mean": 0, "latitude": 0.0, "longitude": 0.0,
+             "sunrise": 0, "sunset": "x" * 2000}
+            for day in range(1, 29)
+        ]
+        self.assertTrue(self.db.save_historical_weather_many("Denver", "CO", records))
+        self.assertTrue(self.db.cleanup_old_data(days_to_keep=30))
+
+        with self.db.get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA auto_vacuum").fetchone()[0], 2)  # INCREMENTAL
+            self.assertEqual(conn.execute("PRAGMA freelist_count").fetchone()[0], 0)
+
+    def test_save_historical_weather_many(self):
+        """Test a batch of historical days is stored in one call"""
+        records = [
+            {"date": f"2024-01-0{day}", "temperature_2m_max": 50.0 + day, "temperature_2m_min": 30.0,
+             "temperature_2m_mean": 40.0, "precipitation_sum": 0.0, "rain_sum": 0.0,
+             "wind_speed_10m_max": 5.0, "wind_gusts_10m_max": 9.0, "cloud_cover_mean": 20,
+             "relative_humidity_2m_mean": 40, "latitude": 39.7, "longitude": -105.0,
+             "sunrise": 0, "sunset": 0}
+            for day in range(1, 4)
+        ]
+
+        self.assertTrue(self.db.save_historical_weather_many("Denver", "CO", records))
+        rows = self.db.get_historical_weather("Denver", "CO", "2024-01-01", "2024-01-31")
+
+        self.assertEqual([row["date"] for row in rows], ["2024-01-01", "2024-01-02", "2024-01-03"])
+        self.assertEqual(rows[2]["temperature_max"], 53.0)
+
+    def test_save_historical_weather_bulk_from_dataframe(self):
+        """Test positional rows from DataFrame.itertuples are stored and re-saves upsert"""
+        df = pd.DataFrame([
+            {"date": "2024-02-01", "temperature_2m_max": 45.0, "temperature_2m_min": 25.0,
+             "temperature_2m_mean": 35.0, "precipitation_sum": 0.1, "rain_sum": 0.0,
+             "wind_speed_10m_max": 7.0, "wind_gusts_10m_max": 12.0, "cloud_cover_mean": 60,
+             "relative_humidity_2m_mean": 55, "latitude": 39.7, "longitude": -105.0,
+             "sunrise": 0, "sunset": 0, "extra_column": "ignored"},
+        ])
+        rows = df[list(HISTORICAL_SOURCE_COLUMNS)].itertuples(index=False, name=None)
+
+        self.assertTrue(self.db.save_historical_weather_bulk("Denver", "CO", rows))
+        df["temperature_2m_max"] = 47.0
+        rows = df[list(HISTORICAL_SOURCE_COLUMNS)].itertuples(index=False, name=None)
+        self.assertTrue(self.db.save_historical_weather_bulk("Denver", "CO", rows))
+
+        stored = self.db.get_historical_weather("Denver", "CO", "2024-02-01", "2024-02-01")
+        self.assertEqual(len(stored), 1)
+        self.assertEqual(stored[0]["temperature_max"], 47.0)
+
+    def test_save_historical_weather_bulk_skips_bad_rows(self):
+        """Test a failing chunk is rolled back and retried without the bad row"""
+        good = ("2024-03-01", 50.0, 30.0, 40.0, 0.0, 0.0, 5.0, 9.0, 20, 40, 39.7, -105.0, 0, 0)
+        bad = ("2024-03-02", 50.0, 30.0, 40.0, 0.0, 0.0, 5.0, 9.0, 20, 40, 39.7, -105.0, 0, object())
+
+        self.assertFalse(self.db.save_historical_weather_bulk("Denver", "CO", [good, bad]))
+
+        stored = self.db.get_historical_weather("Denver", "CO", "2024-03-01", "2024-03-31")
+        self.assertEqual([row["date"] for row in stored], ["2024-03-01"])
+
+    def test_save_location_and_remove(self):
+        """Test saving, listing, and removing a saved location"""
+        self.assertTrue(self.db.save_location("Phoenix", "AZ", latitude=33.4, longitude=-112.0))
+        locations = self.db.get_saved_locations()
+
+        self.assertEqual(len(locations), 1)
+        self.assertEqual(locations[0]["city"], "Phoenix")
+        self.assertTrue(self.db.remove_saved_location(locations[0]["id"]))
+        self.assertEqual(self.db.get_saved_locations(), [])
+
+    def test_save_location_upsert_keeps_id(self):
+        """Test re-saving a location updates it in place instead of replacing the row"""
+        self.assertTrue(self.db.save_location("Phoenix", "AZ", latitude=33.4, longitude=-112.0))
+        first_id = self.db.get_saved_locations()[0]["id"]
+
+        self.assertTrue(self.db.save_location("Phoenix", "AZ", nickname="Home", latitude=33.5, longitude=-112.1))
+        locations = self.db.get_saved_locations()
+
+        self.assertEqual(len(locations), 1)
+        self.assertEqual(locations[0]["id"], first_id)
+        self.assertEqual(locations[0]["nickname"], "Home")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Unit tests for the DatabaseDataHandler class"""
+
+import unittest
+import tempfile
+import os
+from unittest.mock import patch
+
+from core.database import WeatherDatabase
+from core.db_data_handler import DatabaseDataHandler
+
+
+class TestDatabaseDataHandler(unittest.TestCase):
+    """Test suite for the DatabaseDataHandler class"""
+
+    def setUp(self):
+        """Point the handler at a throwaway database"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = WeatherDatabase(os.path.join(self.temp_dir.name, "weather.db"))
+        with patch("core.db_data_handler.get_database", return_value=self.db):
+            self.handler = DatabaseDataHandler()
+
+    def tearDown(self):
+        """Remove the throwaway database"""
+        self.db.close()
+        self.temp_dir.cleanup()
+
+    def test_weather_reads_are_memoized_until_saved(self):
+        """Test repeat reads skip SQLite and a save invalidates the location"""
+        weather = {"main": {"temp": 71.0}, "weather": [{"main": "Clear"}]}
+        self.handler.save_weather_data(weather, "Phoenix", "AZ")
+
+        with patch.object(self.db, "get_current_weather", wraps=self.db.get_current_weather) as spy:
+            first = self.handler.get_weather_data("Phoenix", "AZ")
+            second = self.handler.get_weather_data("Phoenix", "AZ")
+            self.assertEqual(spy.call_count, 1)
+
+            self.handler.save_weather_data(weather, "Phoenix", "AZ")
+            self.handler.get_weather_data("Phoenix", "AZ")
+            self.assertEqual(spy.call_count, 2)
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_user_preferences_are_memoized(self):
+        """Test preference reads hit the database once and saves update the memo"""
+        self.assertTrue(self.handler.save_user_theme("aj_darkly"))
+
+        with patch.object(self.db, "get_user_preference") as spy:
+            self.assertEqual(self.handler.load_user_theme(), "aj_darkly")
+            spy.assert_not_called()
+
+        self.assertEqual(self.handler.get_user_preference("missing", "fallback"), "fallback")
+
+
+if __name__ == "__main__":
+    unittest.main()
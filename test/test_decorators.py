@@ -0,0 +1,88 @@
+"""Unit tests for the decorators module"""
+
+import unittest
+from unittest.mock import patch
+
+from core.decorators import TokenBucket, rate_limit, retry_on_failure, validate_api_response
+
+
+class TestRateLimit(unittest.TestCase):
+    """Test suite for the token-bucket rate limiter"""
+
+    def test_bucket_allows_burst_then_throttles(self):
+        """Test calls up to capacity are free and the next one must wait a refill period"""
+        bucket = TokenBucket(capacity=3, refill_rate=2.0)
+
+        self.assertEqual([bucket.acquire() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.acquire(), 0.5, places=2)
+
+    @patch("time.sleep")
+    def test_rate_limit_sleeps_only_when_bucket_empty(self, mock_sleep):
+        """Test the decorator only sleeps once the burst capacity is used up"""
+        @rate_limit(min_interval=1.0, capacity=2)
+        def ping():
+            return "pong"
+
+        self.assertEqual([ping(), ping()], ["pong", "pong"])
+        mock_sleep.assert_not_called()
+
+        ping()
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 1.0, places=1)
+
+
+class TestRetryOnFailure(unittest.TestCase):
+    """Test suite for the retry decorator"""
+
+    @patch("time.sleep")
+    def test_full_jitter_stays_within_backoff_ceiling(self, mock_sleep):
+        """Test jittered delays never exceed the exponential ceiling or the cap"""
+        @retry_on_failure(max_retries=4, delay=1.0, backoff=2.0, max_delay=5.0)
+        def always_fails():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            always_fails()
+
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 4)
+        for attempt, slept in enumerate(delays):
+            self.assertGreaterEqual(slept, 0)
+            self.assertLessEqual(slept, min(5.0, 2.0 ** attempt))
+
+    @patch("time.sleep")
+    def test_no_jitter_is_deterministic(self, mock_sleep):
+        """Test jitter='none' keeps the plain exponential schedule"""
+        attempts = []
+
+        @retry_on_failure(max_retries=2, delay=1.0, backoff=3.0, jitter="none")
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise RuntimeError("boom")
+            return "ok"
+
+        self.assertEqual(flaky(), "ok")
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [1.0, 3.0])
+
+
+class TestValidateApiResponse(unittest.TestCase):
+    """Test suite for the response validation decorator"""
+
+    def test_nested_and_list_paths(self):
+        """Test dotted paths descend dicts and the first item of lists"""
+        @validate_api_response(required_fields=["main.temp", "weather.description", "name"])
+        def fetch(payload):
+            return payload
+
+        good = {"main": {"temp": 70}, "weather": [{"description": "clear"}], "name": "Denver"}
+        self.assertIs(fetch(good), good)
+
+        result = fetch({"main": {}, "weather": [], "name": "Denver"})
+        self.assertIn("main.temp", result["error"])
+        self.assertIn("weather.description", result["error"])
+        self.assertNotIn("'name'", result["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
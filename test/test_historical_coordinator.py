@@ -0,0 +1,71 @@
+"""Unit tests for the HistoricalDataCoordinator class"""
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from core.historical_coordinator import HistoricalDataCoordinator
+
+
+class TestHistoricalDataCoordinator(unittest.TestCase):
+    """Test suite for the HistoricalDataCoordinator class"""
+
+    def test_vectorized_clean_drops_incomplete_days(self):
+        """Test days with any missing measurement are dropped before cleaning"""
+        df = pd.DataFrame({
+            "date": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            "temperature_2m_max": [50.0, np.nan, 52.0],
+            "cloud_cover_mean": [20.0, 30.0, np.nan],
+            "timezone": ["America/Denver"] * 3,
+        })
+
+        cleaned = HistoricalDataCoordinator._vectorized_clean(df)
+
+        self.assertEqual(len(cleaned), 1)
+        self.assertEqual(list(cleaned.index), [0])
+        self.assertEqual(cleaned.loc[0, "temperature_2m_max"], 50.0)
+
+    @patch("core.historical_coordinator.DatabaseDataHandler")
+    @patch("core.historical_coordinator.OpenMeteoHistorical")
+    def test_batch_fetch_preserves_location_order(self, mock_client_cls, mock_handler_cls):
+        """Test a batch fetches all locations in one request and keeps their order"""
+        coordinator = HistoricalDataCoordinator()
+        api_client = mock_client_cls.return_value
+        locations = [
+            {"city": name, "state": "XX", "latitude": float(i), "longitude": -float(i)}
+            for i, name in enumerate(("Phoenix", "Denver", "Seattle", "Boston"))
+        ]
+        api_client.get_historical_data_batch.return_value = [(None, name) for name in ("a", "b", "c", "d")]
+
+        with patch.object(coordinator, "_clean_and_store",
+                          side_effect=lambda city, state, df, error: (True, (city, error))):
+            results = coordinator.fetch_and_store_historical_data_batch(locations)
+
+        api_client.get_historical_data_batch.assert_called_once_with(
+            [(0.0, -0.0), (1.0, -1.0), (2.0, -2.0), (3.0, -3.0)]
+        )
+        api_client.get_historical_data.assert_not_called()
+        self.assertEqual(results, [(True, ("Phoenix", "a")), (True, ("Denver", "b")),
+                                   (True, ("Seattle", "c")), (True, ("Boston", "d"))])
+        self.assertEqual(coordinator.fetch_and_store_historical_data_batch([]), [])
+
+    @patch("core.historical_coordinator._BATCH_LOCATIONS_PER_REQUEST", 2)
+    @patch("core.historical_coordinator.DatabaseDataHandler")
+    @patch("core.historical_coordinator.OpenMeteoHistorical")
+    def test_batch_fetch_splits_large_batches(self, mock_client_cls, mock_handler_cls):
+        """Test locations beyond one request's size go out as further requests"""
+        coordinator = HistoricalDataCoordinator()
+        api_client = mock_client_cls.return_value
+        api_client.get_historical_data_batch.side_effect = lambda points: [(None, "No data")] * len(points)
+        locations = [{"city": str(i), "latitude": 1.0, "longitude": 2.0} for i in range(5)]
+
+        results = coordinator.fetch_and_store_historical_data_batch(locations)
+
+        self.assertEqual(api_client.get_historical_data_batch.call_count, 3)
+        self.assertEqual(results, [(False, "No data")] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Unit tests for the IconManager class"""
+
+import unittest
+import tempfile
+import os
+
+from PIL import Image
+
+from core.icon_manager import IconManager, _LRUCache
+
+
+class TestIconManager(unittest.TestCase):
+    """Test suite for the IconManager class"""
+
+    def setUp(self):
+        """Create an icon manager over a throwaway assets directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.manager = IconManager(assets_path=self.temp_dir.name, disk_cache_dir=self.cache_dir)
+
+    def tearDown(self):
+        """Remove the throwaway assets directory"""
+        self.temp_dir.cleanup()
+
+    def test_weather_icon_classification(self):
+        """Test weather descriptions map to the expected emoji"""
+        self.assertEqual(self.manager.get_weather_icon("Clear Sky"), "☀️")
+        self.assertEqual(self.manager.get_weather_icon("few clouds"), "🌤️")
+        self.assertEqual(self.manager.get_weather_icon("Broken Clouds"), "☁️")
+        self.assertEqual(self.manager.get_weather_icon("light rain"), "🌧️")
+        self.assertEqual(self.manager.get_weather_icon("thunderstorm"), "⛈️")
+        self.assertEqual(self.manager.get_weather_icon("light snow"), "❄️")
+        self.assertEqual(self.manager.get_weather_icon("mist"), "🌫️")
+        self.assertEqual(self.manager.get_weather_icon("something odd"), "🌤️")
+
+    def test_weather_icon_keyword_priority(self):
+        """Test the highest-priority keyword wins regardless of its position"""
+        self.assertEqual(self.manager.get_weather_icon("thunderstorm with light rain"), "🌧️")
+        self.assertEqual(self.manager.get_weather_icon("overcast, few clouds later"), "🌤️")
+        self.assertEqual(self.manager.get_weather_icon("sky is clear"), "☀️")
+
+    def test_custom_icon_overrides_cached_classification(self):
+        """Test custom icons still apply after a description has been classified"""
+        self.assertEqual(self.manager.get_weather_icon("light rain"), "🌧️")
+        self.manager.add_custom_icon("rainy", "☔")
+
+        self.assertEqual(self.manager.get_weather_icon("light rain"), "☔")
+
+    def test_resized_images_are_cached_on_disk(self):
+        """Test a resized image is written to the disk cache and reused on the next open"""
+        source = os.path.join(self.manager.images_path, "logo.png")
+        Image.new("RGBA", (64, 64), (255, 0, 0, 255)).save(source)
+
+        first = self.manager._open_resized(source, (16, 16))
+        cached_files = os.listdir(self.cache_dir)
+        second = self.manager._open_resized(source, (16, 16))
+
+        self.assertEqual(first.size, (16, 16))
+        self.assertEqual(len(cached_files), 1)
+        self.assertEqual(second.size, (16, 16))
+        self.assertEqual(os.path.basename(second.filename), cached_files[0])
+
+    def test_asset_index_prefers_extension_order(self):
+        """Test the directory index picks the highest-priority extension and sees new files after refresh"""
+        for name in ("sun.jpg", "sun.png", "notes.txt"):
+            open(os.path.join(self.manager.images_path, name), "wb").close()
+        self.assertEqual(self.manager._image_index, {})
+
+        self.manager.refresh_index()
+
+        self.assertEqual(self.manager._image_index, {"sun": os.path.join(self.manager.images_path, "sun.png")})
+
+    def test_image_cache_evicts_least_recently_used(self):
+        """Test the bounded cache drops the entry that was read longest ago"""
+        cache = _LRUCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+
+        self.assertEqual(list(cache), ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Unit tests for the LocationService class"""
+
+import unittest
+import tempfile
+import os
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from core.location_service import LocationService, LocationInfo, _solar_times_utc
+
+
+class TestLocationService(unittest.TestCase):
+    """Test suite for the LocationService class"""
+
+    def setUp(self):
+        """Create a location service over a throwaway cache directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.service = LocationService(cache_file=os.path.join(self.temp_dir.name, "location_cache.json"))
+        self.location = LocationInfo(33.4484, -112.074, "Phoenix", "United States", "America/Phoenix")
+
+    def tearDown(self):
+        """Close the session and remove the throwaway cache directory"""
+        self.service.close()
+        self.temp_dir.cleanup()
+
+    def _sun_response(self):
+        """Build a fake sunrise-sunset.org response"""
+        payload = {
+            "status": "OK",
+            "results": {"sunrise": "2024-06-01T12:20:00+00:00", "sunset": "2024-06-02T02:35:00+00:00"},
+        }
+        response = MagicMock()
+        response.content = json.dumps(payload).encode("utf-8")
+        response.json.return_value = payload
+        return response
+
+    def test_solar_times_match_published_values(self):
+        """Test the local calculation lands within a couple of minutes of published times"""
+        sunrise, sunset = _solar_times_utc(33.4484, -112.074, datetime(2024, 6, 1))
+
+        # Phoenix on 2024-06-01: sunrise 05:20 MST, sunset 19:35 MST
+        self.assertLess(abs((sunrise - datetime(2024, 6, 1, 12, 20, tzinfo=timezone.utc)).total_seconds()), 120)
+        self.assertLess(abs((sunset - datetime(2024, 6, 2, 2, 35, tzinfo=timezone.utc)).total_seconds()), 120)
+        self.assertIsNone(_solar_times_utc(78.22, 15.65, datetime(2024, 6, 21)))
+
+    def test_sunrise_sunset_computed_without_http(self):
+        """Test ordinary latitudes never call the sunrise API"""
+        with patch.object(self.service._session, "get") as mock_get:
+            sun_times = self.service.get_sunrise_sunset(self.location, datetime(2024, 6, 1))
+            mock_get.assert_not_called()
+
+        # Times are reported in the location's own timezone (MST, no DST in Phoenix)
+        self.assertEqual(sun_times.sunrise.utcoffset().total_seconds(), -7 * 3600)
+        self.assertEqual(sun_times.sunrise.strftime("%H"), "05")
+        self.assertFalse(sun_times.is_daytime)  # 2024-06-01 is in the past
+
+    @patch("core.location_service._solar_times_utc", return_value=None)
+    def test_sunrise_sunset_is_cached_per_day(self, _mock_solar):
+        """Test API fallback lookups for the same place and day are cached, even across instances"""
+        day = datetime.now()
+
+        with patch.object(self.service._session, "get", return_value=self._sun_response()) as mock_get:
+            first = self.service.get_sunrise_sunset(self.location, day)
+            second = self.service.get_sunrise_sunset(self.location, day)
+            self.assertEqual(mock_get.call_count, 1)
+
+        self.assertIsNotNone(first)
+        self.assertIsNotNone(second)
+        self.assertTrue(os.path.exists(self.service.sun_cache_file))
+
+        reloaded = LocationService(cache_file=self.service.cache_file)
+        with patch.object(reloaded._session, "get") as mock_get:
+            self.assertIsNotNone(reloaded.get_sunrise_sunset(self.location, day))
+            mock_get.assert_not_called()
+        reloaded.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
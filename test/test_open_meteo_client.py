@@ -0,0 +1,56 @@
+"""Unit tests for the OpenMeteoClient class"""
+
+import unittest
+import json
+from unittest.mock import MagicMock, patch
+
+from core.open_meteo_client import OpenMeteoClient
+
+
+class TestOpenMeteoClient(unittest.TestCase):
+    """Test suite for the OpenMeteoClient class"""
+
+    def setUp(self):
+        """Create a client without an on-disk HTTP cache"""
+        self.client = OpenMeteoClient(cache_name=None)
+
+    def tearDown(self):
+        """Close the client session"""
+        self.client.close()
+
+    def _fetch_with_code(self, code):
+        """Run fetch_weather against a fake response carrying the given weather code"""
+        payload = {"current": {"temperature_2m": 21.5, "weather_code": code}}
+        response = MagicMock(status_code=200, content=json.dumps(payload).encode("utf-8"))
+        response.json.return_value = payload
+        with patch.object(self.client._session, "get", return_value=response):
+            return self.client.fetch_weather(33.45, -112.07)
+
+    def test_weather_code_lookup(self):
+        """Test known codes map to their fields and unknown or missing codes fall back"""
+        rain = self._fetch_with_code(61)
+        self.assertEqual(
+            (rain["weather_main"], rain["weather_description"], rain["weather_icon"]),
+            ("Rain", "Light rain", "10d"),
+        )
+
+        for code in (42, 250, None, "61"):
+            unknown = self._fetch_with_code(code)
+            self.assertEqual(
+                (unknown["weather_main"], unknown["weather_description"], unknown["weather_icon"]),
+                ("Unknown", "Unknown weather", "01d"),
+            )
+
+    def test_weather_code_table_is_shared_and_read_only(self):
+        """Test clients share one immutable code table with shared field strings"""
+        other = OpenMeteoClient(cache_name=None)
+        self.addCleanup(other.close)
+
+        self.assertIs(self.client.weather_codes, other.weather_codes)
+        self.assertIs(self.client.weather_codes[61]["main"], self.client.weather_codes[80]["main"])
+        with self.assertRaises(TypeError):
+            self.client.weather_codes[61]["main"] = "Storm"
+
+
+if __name__ == "__main__":
+    unittest.main()
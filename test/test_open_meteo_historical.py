@@ -0,0 +1,79 @@
+"""Unit tests for the OpenMeteoHistorical class"""
+
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from core.open_meteo_historical import (
+    OpenMeteoHistorical,
+    _ONE_DECIMAL_COLUMNS,
+    _TWO_DECIMAL_COLUMNS,
+)
+
+
+def _fake_response(latitude, days=3):
+    """Build a fake archive response for one location"""
+    daily = MagicMock()
+    daily.Time.return_value = 1704067200  # 2024-01-01 UTC
+    daily.TimeEnd.return_value = 1704067200 + days * 86400
+    daily.Interval.return_value = 86400
+    daily.Variables.return_value.ValuesAsNumpy.return_value = np.full(days, latitude, dtype=np.float32)
+
+    response = MagicMock()
+    response.Daily.return_value = daily
+    response.Latitude.return_value = latitude
+    response.Longitude.return_value = -100.0
+    response.Elevation.return_value = 300.0
+    response.Timezone.return_value = b"America/Denver"
+    return response
+
+
+class TestOpenMeteoHistorical(unittest.TestCase):
+    """Test suite for the OpenMeteoHistorical class"""
+
+    def setUp(self):
+        """Create a client without opening the on-disk request cache"""
+        self.client = OpenMeteoHistorical.__new__(OpenMeteoHistorical)
+        self.client.api_url = "https://archive-api.open-meteo.com/v1/archive"
+        self.client.client = MagicMock()
+
+    def test_batch_fetch_uses_one_request(self):
+        """Test a batch sends every coordinate in one call and keeps the point order"""
+        self.client.client.weather_api.return_value = [_fake_response(33.4), _fake_response(39.7)]
+
+        results = self.client.get_historical_data_batch([(33.4, -112.0), (39.7, -105.0), (47.6, -122.3)])
+
+        self.assertEqual(self.client.client.weather_api.call_count, 1)
+        params = self.client.client.weather_api.call_args.kwargs["params"]
+        self.assertEqual(params["latitude"], [33.4, 39.7, 47.6])
+        self.assertEqual([df["latitude"].iloc[0] if df is not None else None for df, _ in results], [33.4, 39.7, None])
+        self.assertEqual(len(results[0][0]), 3)
+        self.assertEqual(results[2][1], "No data received from API")
+        self.assertEqual(self.client.get_historical_data_batch([]), [])
+
+    def _daily_frame(self, humidity):
+        """Build a two-day frame shaped like _response_to_dataframe output"""
+        data = {"date": pd.date_range("2024-01-01", periods=2, tz="UTC")}
+        for column in _ONE_DECIMAL_COLUMNS + _TWO_DECIMAL_COLUMNS:
+            data[column] = [1.234, 5.678]
+        data["cloud_cover_mean"] = [40.4, 99.6]
+        data["relative_humidity_2m_mean"] = humidity
+        return pd.DataFrame(data)
+
+    def test_clean_rounds_percentages(self):
+        """Test cloud cover and humidity are rounded to whole percentages"""
+        df = self.client.clean_historical_data(self._daily_frame([55.5, 60.2]))
+
+        self.assertEqual(df["cloud_cover_mean"].tolist(), [40, 100])
+        self.assertEqual(df["relative_humidity_2m_mean"].tolist(), [56, 60])
+        self.assertEqual(df["date"].tolist(), ["2024-01-01", "2024-01-02"])
+
+    def test_clean_rejects_missing_percentages(self):
+        """Test a missing humidity reading is not stored as 0%"""
+        self.assertIsNone(self.client.clean_historical_data(self._daily_frame([55.5, np.nan])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+"""Unit tests for the ThemeComponent class with Tk mocked out"""
+
+import sys
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Modules that bind ttkbootstrap at import time and must be rebuilt against the fakes
+_TK_MODULES = ("core.custom_themes", "core.details_row_utils", "core.forecast_card",
+               "core.icon_manager", "core.save_city_utils", "core.theme_manager")
+
+
+def _fake_ttkbootstrap():
+    """Build stand-in ttkbootstrap modules so no Tk root or display is needed"""
+    tb = MagicMock(name="ttkbootstrap")
+    constants = types.ModuleType("ttkbootstrap.constants")
+    for name in ("LEFT", "RIGHT", "TOP", "BOTTOM", "BOTH", "X", "Y", "END"):
+        setattr(constants, name, name.lower())
+    return {
+        "ttkbootstrap": tb,
+        "ttkbootstrap.constants": constants,
+        "ttkbootstrap.style": MagicMock(name="ttkbootstrap.style"),
+    }
+
+
+class TestThemeComponent(unittest.TestCase):
+    """Test suite for ThemeComponent with Tk and settings I/O mocked out"""
+
+    def setUp(self):
+        """Import the component against fake ttkbootstrap modules"""
+        modules = _fake_ttkbootstrap()
+        self.tb = modules["ttkbootstrap"]
+        self.style = self.tb.Style.return_value
+        self.style.theme_names.return_value = ("aj_darkly", "aj_lightly")
+
+        # patch.dict restores sys.modules on stop, dropping everything imported here
+        stale = [name for name in sys.modules if name.startswith("gui") or name in _TK_MODULES]
+        self.modules_patch = patch.dict(sys.modules, modules)
+        self.modules_patch.start()
+        for name in stale:
+            del sys.modules[name]
+        import gui.components.theme_component as theme_component
+        self.module = theme_component
+
+        self.patches = [
+            patch.object(theme_component, "register_custom_themes"),
+            patch.object(theme_component, "LocationService"),
+            patch.object(theme_component, "load_auto_theme_settings",
+                         return_value=(False, "aj_lightly", "aj_darkly")),
+            # Keep the tests away from the real settings file
+            patch.object(theme_component, "save_user_theme"),
+            patch.object(theme_component, "save_auto_theme_settings"),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        """Undo the patches and drop the modules built against the fakes"""
+        for p in reversed(self.patches):
+            p.stop()
+        self.modules_patch.stop()
+
+    def test_init_applies_theme_and_builds_controls(self):
+        """Constructing the component uses the shared style and builds the toggles"""
+        component = self.module.ThemeComponent(MagicMock(), current_theme="aj_darkly")
+
+        self.assertIs(component._style, self.style)
+        self.style.theme_use.assert_called_with("aj_darkly")
+        self.style.theme_names.assert_called_once()
+        self.assertFalse(component.is_light_theme)
+        self.assertIsNotNone(component.theme_frame)
+        component.manual_toggle.configure.assert_called_with(state="normal")
+
+    def test_init_falls_back_when_theme_fails(self):
+        """A theme that cannot be applied is replaced by its fallback"""
+        self.style.theme_use.side_effect = [Exception("unknown theme"), None]
+        with patch.object(self.module, "get_fallback_theme", return_value="darkly"):
+            component = self.module.ThemeComponent(MagicMock(), current_theme="missing")
+
+        self.assertEqual(component.current_theme, "darkly")
+        self.style.theme_use.assert_called_with("darkly")
+
+    def _auto_component(self):
+        """Build a component in auto mode with a controllable clock"""
+        component = self.module.ThemeComponent(MagicMock(), current_theme="aj_darkly")
+        component.auto_mode = True
+        clock = patch.object(self.module, "time")
+        self.time = clock.start()
+        self.addCleanup(clock.stop)
+        self.time.monotonic.return_value = 1000.0
+        return component
+
+    def test_auto_theme_reused_within_ttl(self):
+        """Test a second decision within the TTL skips the sun lookup"""
+        component = self._auto_component()
+        with patch.object(self.module, "get_auto_theme_coords", return_value="aj_darkly") as lookup:
+            component.apply_auto_theme(45.5231, -122.6765)
+            self.time.monotonic.return_value += self.module._AUTO_THEME_TTL - 1
+            component.apply_auto_theme(45.5231, -122.6765)
+            self.assertEqual(lookup.call_count, 1)
+
+            self.time.monotonic.return_value += 1
+            component.apply_auto_theme(45.5231, -122.6765)
+            self.assertEqual(lookup.call_count, 2)
+
+    def test_auto_theme_nearby_coordinates_share_entry(self):
+        """Test coordinates equal to 2 decimals reuse one decision"""
+        component = self._auto_component()
+        with patch.object(self.module, "get_auto_theme_coords", return_value="aj_darkly") as lookup:
+            component.apply_auto_theme(45.5231, -122.6765)
+            component.apply_auto_theme(45.5249, -122.6801)
+            self.assertEqual(lookup.call_count, 1)
+
+            component.apply_auto_theme(45.5351, -122.6765)
+            self.assertEqual(lookup.call_count, 2)
+        self.assertEqual(set(component._auto_theme_cache), {(45.52, -122.68), (45.54, -122.68)})
+
+    def test_auto_theme_cache_cleared_on_mode_changes(self):
+        """Test toggling auto mode or picking a theme forgets cached decisions"""
+        component = self._auto_component()
+        with patch.object(self.module, "get_auto_theme_coords", return_value="aj_darkly") as lookup:
+            component.apply_auto_theme(45.5231, -122.6765)
+            component.auto_mode_var.get.return_value = True
+            component.toggle_auto_mode()
+            self.assertEqual(component._auto_theme_cache, {})
+
+            component.apply_auto_theme(45.5231, -122.6765)
+            self.assertEqual(lookup.call_count, 2)
+            component.set_manual_theme("aj_lightly")
+            self.assertEqual(component._auto_theme_cache, {})
+
+    def test_refresh_auto_theme_debounced(self):
+        """Test a burst of refreshes cancels the queued one and runs once with the last arguments"""
+        component = self._auto_component()
+        parent = component.parent
+        parent.after.side_effect = ["after#1", "after#2", "after#3"]
+
+        component.refresh_auto_theme(1.0, 2.0)
+        component.refresh_auto_theme(3.0, 4.0)
+        component.refresh_auto_theme(5.0, 6.0)
+
+        self.assertEqual([c.args[0] for c in parent.after_cancel.call_args_list], ["after#1", "after#2"])
+        delay, callback, *args = parent.after.call_args.args
+        self.assertEqual(delay, self.module._REFRESH_DEBOUNCE_MS)
+        self.assertEqual(args, [5.0, 6.0])
+
+        with patch.object(component, "apply_auto_theme") as apply_auto:
+            callback(*args)
+        apply_auto.assert_called_once_with(5.0, 6.0)
+        self.assertIsNone(component._pending_refresh)
+
+        component.auto_mode = False
+        parent.after.reset_mock()
+        component.refresh_auto_theme(7.0, 8.0)
+        parent.after.assert_not_called()
+
+    def test_apply_theme_skips_active_theme(self):
+        """Test re-applying the live theme does not switch or restyle"""
+        component = self.module.ThemeComponent(MagicMock(), current_theme="aj_darkly")
+        self.style.theme_use.reset_mock()
+        self.style.theme_use.return_value = "aj_darkly"
+
+        component.apply_theme("aj_darkly")
+        self.style.theme_use.assert_called_once_with()
+        component.parent.restyle_all_components.assert_not_called()
+
+        component.apply_theme("aj_lightly")
+        self.style.theme_use.assert_called_with("aj_lightly")
+        component.parent.restyle_all_components.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
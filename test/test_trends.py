@@ -0,0 +1,60 @@
+"""Unit tests for the temperature trend analysis"""
+
+import unittest
+
+import numpy as np
+
+from features.trends import Trend, analyze_trends, analyze_trends_batch
+
+
+def _readings(*temps):
+    """Build weather entries holding the given temperatures"""
+    return [{"temperature": temp} for temp in temps]
+
+
+class TestAnalyzeTrends(unittest.TestCase):
+    """Test suite for analyze_trends and analyze_trends_batch"""
+
+    def test_trend_from_weather_entries(self):
+        """Test the first and last readings decide the trend"""
+        self.assertIs(analyze_trends(_readings(50.0, 40.0, 55.0)), Trend.WARMING)
+        self.assertIs(analyze_trends(_readings(60.0, 70.0, 52.5)), Trend.COOLING)
+        self.assertIs(analyze_trends(_readings(48.0, 30.0, 48.0)), Trend.STABLE)
+
+    def test_trend_from_arrays(self):
+        """Test an array or temps= skips the per-entry dict lookups"""
+        self.assertIs(analyze_trends(np.array([50.0, 51.0])), Trend.WARMING)
+        self.assertIs(analyze_trends(None, temps=[61.0, 60.0]), Trend.COOLING)
+        # temps wins over the entries when both are given
+        self.assertIs(analyze_trends(_readings(1.0, 99.0), temps=np.array([5.0, 5.0])), Trend.STABLE)
+
+    def test_fewer_than_two_readings(self):
+        """Test a trend needs at least two readings"""
+        self.assertIsNone(analyze_trends([]))
+        self.assertIsNone(analyze_trends(_readings(50.0)))
+        self.assertIsNone(analyze_trends(np.array([50.0])))
+        self.assertIsNone(analyze_trends(_readings(1.0, 2.0), temps=[3.0]))
+
+    def test_trend_labels(self):
+        """Test each trend carries the text shown to users"""
+        self.assertEqual(Trend.WARMING.label, "Warming trend")
+        self.assertEqual(Trend.COOLING.label, "Cooling trend")
+        self.assertEqual(Trend.STABLE.label, "Stable")
+        self.assertEqual(Trend.WARMING, 1)
+
+    def test_batch_signs(self):
+        """Test a batch returns one signed trend per city row"""
+        temps = np.array([
+            [50.0, 55.0, 60.0],
+            [60.0, 50.0, 40.0],
+            [45.0, 90.0, 45.0],
+        ])
+
+        trends = analyze_trends_batch(temps)
+
+        self.assertEqual(trends.dtype, np.int8)
+        self.assertEqual(trends.tolist(), [Trend.WARMING, Trend.COOLING, Trend.STABLE])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Unit tests for the UserSettingsManager class"""
+
+import unittest
+import tempfile
+import os
+import json
+import mmap
+import threading
+from unittest.mock import patch
+
+from core.utils import UserSettingsManager
+
+
+class TestUserSettingsManager(unittest.TestCase):
+    """Test suite for the UserSettingsManager class"""
+
+    def setUp(self):
+        """Create a settings manager over a throwaway settings file"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.settings_file = os.path.join(self.temp_dir.name, "user_settings.json")
+        self.manager = UserSettingsManager(settings_file=self.settings_file)
+
+    def tearDown(self):
+        """Remove the throwaway settings file"""
+        self.temp_dir.cleanup()
+
+    def test_missing_file_returns_defaults(self):
+        """Test defaults are returned when nothing has been saved"""
+        self.assertEqual(self.manager.load_settings(), self.manager.default_settings)
+        self.assertEqual(self.manager.load_user_theme(), "aj_darkly")
+
+    def test_corrupt_file_returns_defaults(self):
+        """Test an unparseable settings file falls back to defaults"""
+        with open(self.settings_file, "w") as f:
+            f.write("{not json")
+
+        self.assertEqual(self.manager.load_settings(), self.manager.default_settings)
+
+    def test_settings_reads_are_cached_until_file_changes(self):
+        """Test repeat loads skip the file and external edits are picked up"""
+        self.assertTrue(self.manager.save_user_theme("aj_lightly"))
+
+        with patch("builtins.open", side_effect=AssertionError("settings re-read")):
+            self.assertEqual(self.manager.load_user_theme(), "aj_lightly")
+
+        with open(self.settings_file, "w") as f:
+            json.dump({"theme": "darkly", "auto_theme_mode": False}, f)
+
+        self.assertEqual(self.manager.load_user_theme(), "darkly")
+
+    def test_loaded_settings_are_independent_copies(self):
+        """Test mutating a loaded dict does not leak into later loads"""
+        self.manager.save_settings({"theme": "aj_darkly"})
+
+        settings = self.manager.load_settings()
+        settings["theme"] = "changed"
+
+        self.assertEqual(self.manager.load_settings()["theme"], "aj_darkly")
+
+    def test_large_settings_file_is_memory_mapped(self):
+        """Test files over one page are parsed through mmap"""
+        self.manager.save_settings({"theme": "aj_lightly", "notes": "x" * 8192})
+        self.manager._cache_sig = None
+
+        with patch("core.utils.mmap.mmap", wraps=mmap.mmap) as mapped:
+            settings = self.manager.load_settings()
+
+        mapped.assert_called_once()
+        self.assertEqual(settings["theme"], "aj_lightly")
+        self.assertEqual(len(settings["notes"]), 8192)
+
+    def test_concurrent_saves_leave_valid_file(self):
+        """Test saves from several threads don't interleave their temp writes"""
+        themes = [f"theme_{i}" for i in range(8)]
+        threads = [
+            threading.Thread(target=self.manager.save_user_theme, args=(theme,))
+            for theme in themes
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with open(self.settings_file) as f:
+            self.assertIn(json.load(f)["theme"], themes)
+        self.assertIn(self.manager.load_user_theme(), themes)
+
+    def test_save_replaces_file_atomically(self):
+        """Test saves go through a temp file that is renamed into place"""
+        with patch("core.utils.os.replace", wraps=os.replace) as replace:
+            self.assertTrue(self.manager.save_settings({"theme": "aj_lightly"}))
+
+        replace.assert_called_once_with(self.settings_file + ".tmp", self.settings_file)
+        self.assertFalse(os.path.exists(self.settings_file + ".tmp"))
+        with open(self.settings_file) as f:
+            self.assertEqual(json.load(f), {"theme": "aj_lightly"})
+
+    def test_failed_save_keeps_previous_file(self):
+        """Test an error mid-save leaves the last good settings intact"""
+        self.manager.save_settings({"theme": "aj_darkly"})
+
+        with patch("core.utils.os.replace", side_effect=OSError("disk full")):
+            self.assertFalse(self.manager.save_settings({"theme": "aj_lightly"}))
+
+        self.assertFalse(os.path.exists(self.settings_file + ".tmp"))
+        with open(self.settings_file) as f:
+            self.assertEqual(json.load(f)["theme"], "aj_darkly")
+
+
+if __name__ == "__main__":
+    unittest.main()
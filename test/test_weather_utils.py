@@ -0,0 +1,75 @@
+"""Unit tests for the weather data parsing helpers"""
+
+import unittest
+
+from core.weather_utils import parse_weather_data, parse_weather_data_many
+
+
+_CLEANED = {
+    'city': 'Denver',
+    'temperature': 71.3,
+    'weather_description': 'clear sky',
+    'humidity': 20,
+    'pressure': 1015,
+    'wind_speed': 6.2,
+    'weather_icon': '01d',
+    'country': 'US',
+}
+
+_RAW = {
+    'name': 'Seattle',
+    'main': {'temp': 55.4, 'humidity': 80, 'pressure': 1009},
+    'weather': [{'description': 'light rain', 'icon': '10d'}],
+    'wind': {'speed': 9.1},
+    'sys': {'country': 'US'},
+}
+
+
+class TestParseWeatherData(unittest.TestCase):
+    """Test suite for parse_weather_data and parse_weather_data_many"""
+
+    def test_cleaned_record(self):
+        """Test a cleaned record is read from its flat keys"""
+        parsed = parse_weather_data(_CLEANED, unit_label="°C")
+
+        self.assertEqual(parsed, {
+            'city': 'Denver', 'temp': 71.3, 'description': 'clear sky', 'humidity': 20,
+            'pressure': 1015, 'wind_speed': 6.2, 'icon': '01d', 'country': 'US',
+            'unit_label': '°C',
+        })
+
+    def test_raw_response(self):
+        """Test a raw OpenWeatherMap response is read from its nested sections"""
+        parsed = parse_weather_data(_RAW)
+
+        self.assertEqual(parsed, {
+            'city': 'Seattle', 'temp': 55.4, 'description': 'light rain', 'humidity': 80,
+            'pressure': 1009, 'wind_speed': 9.1, 'icon': '10d', 'country': 'US',
+            'unit_label': '°F',
+        })
+
+    def test_raw_response_with_empty_sections(self):
+        """Test empty or null sections show as N/A instead of raising"""
+        parsed = parse_weather_data({'name': 'Reno', 'weather': [], 'main': None})
+
+        self.assertEqual(parsed['city'], 'Reno')
+        self.assertEqual(parsed['description'], 'N/A')
+        self.assertEqual(parsed['icon'], '')
+        self.assertEqual(parsed['temp'], 'N/A')
+        self.assertEqual(parsed['humidity'], 'N/A')
+        self.assertEqual(parsed['wind_speed'], 'N/A')
+        self.assertEqual(parsed['country'], '')
+
+    def test_many_keeps_order_of_mixed_records(self):
+        """Test a batch dispatches each record on its own format and keeps input order"""
+        records = [_RAW, _CLEANED, {'weather': []}, _CLEANED]
+
+        parsed = parse_weather_data_many(records, unit_label="°C")
+
+        self.assertEqual([p['city'] for p in parsed], ['Seattle', 'Denver', 'Unknown', 'Denver'])
+        self.assertEqual(parsed, [parse_weather_data(r, unit_label="°C") for r in records])
+        self.assertEqual(parse_weather_data_many([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()